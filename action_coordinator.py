@@ -0,0 +1,116 @@
+"""
+Per-member coordination of moderation actions
+When several moderators target the same member at once, identical actions
+(e.g. two ``+men`` on the same member) share one in-flight run whose result
+every caller receives, and different actions on that member (e.g. ``+hebs``
+and ``+unhebs``) run one after the other instead of interleaving their role
+changes and their updates of ``jailed_users.json``.
+
+discord.py only updates a cached member's roles when the gateway confirms a
+change, so an action queued behind another one, or started just after it,
+is given a member fetched from Discord instead of the stale cached one.
+"""
+
+import asyncio
+import logging
+import time
+from collections import defaultdict
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Minimum REST calls an action makes when it succeeds, counted as saved when
+# a duplicate request shares an in-flight run instead
+ACTION_REST_CALLS = {
+    'verify': 4,   # remove role, add role, open DM, send DM
+    'men': 2,
+    'wom': 2,
+    'hebs': 4,     # remove roles (one call each), add jail role, open DM, send DM
+    'unhebs': 2,
+    'unverify': 2,
+    'unmute': 1,
+    'mute': 1,
+}
+
+# Seconds after an action during which the cached roles of its member may
+# not reflect it yet, so the next action on that member fetches it first
+STALE_AFTER = 5.0
+
+
+class ActionCoordinator:
+    """Deduplicates identical and serializes conflicting actions on the same member."""
+
+    def __init__(self):
+        """Initialize with no action in flight."""
+        self._in_flight: Dict[Tuple[int, int, str], asyncio.Future] = {}
+        self._locks: Dict[Tuple[int, int], asyncio.Lock] = {}
+        self._users: Dict[Tuple[int, int], int] = defaultdict(int)
+        self._finished: Dict[Tuple[int, int], float] = {}
+        self.deduplicated = 0
+        self.serialized = 0
+        self.rest_calls_saved = 0
+
+    async def run(self, guild, member, action: str, factory: Callable[[Any], Awaitable[Any]]):
+        """
+        Run an action on a member, or join the identical run already in flight.
+
+        Args:
+            guild: Guild of the member
+            member: Member the action targets
+            action: Action name; requests with the same name are identical
+            factory: Callable taking the member to act on and returning the
+                action coroutine; it is given a freshly fetched member when
+                the cached one may predate a previous action
+
+        Returns:
+            The result of the action; exceptions are raised to every caller
+        """
+        guild_id, member_id = guild.id, member.id
+        key = (guild_id, member_id, action)
+        pending = self._in_flight.get(key)
+        if pending is not None:
+            self.deduplicated += 1
+            logger.info(f"Joining in-flight '{action}' on member {member_id} in guild {guild_id}")
+            result = await asyncio.shield(pending)
+            self.rest_calls_saved += ACTION_REST_CALLS.get(action, 1)
+            return result
+
+        future = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = future
+        member_key = (guild_id, member_id)
+        lock = self._locks.get(member_key)
+        if lock is None:
+            lock = self._locks[member_key] = asyncio.Lock()
+        self._users[member_key] += 1
+        try:
+            if lock.locked():
+                self.serialized += 1
+            async with lock:
+                if self._is_stale(member_key):
+                    member = await guild.fetch_member(member_id)
+                result = await factory(member)
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as e:
+            future.set_exception(e)
+            future.exception()  # retrieved by this caller, joiners may not exist
+            raise
+        else:
+            future.set_result(result)
+            return result
+        finally:
+            del self._in_flight[key]
+            self._finished[member_key] = time.monotonic()
+            self._users[member_key] -= 1
+            if not self._users[member_key]:
+                del self._users[member_key]
+                del self._locks[member_key]
+
+    def _is_stale(self, member_key: Tuple[int, int]) -> bool:
+        """Return True if an action on the member finished too recently for its cached roles to be trusted."""
+        now = time.monotonic()
+        if len(self._finished) > 1000:
+            self._finished = {k: t for k, t in self._finished.items() if now - t < STALE_AFTER}
+        finished = self._finished.get(member_key)
+        return finished is not None and now - finished < STALE_AFTER
@@ -0,0 +1,175 @@
+"""
+Streaming archive-then-purge of channel messages
+Matching messages flow from ``channel.history`` through a chain of async
+generators: filtered, grouped into batches of at most 100, appended to a
+gzip-compressed JSON Lines archive and only then deleted. Only one batch is
+held in memory at a time, whatever the size of the channel history.
+"""
+
+import asyncio
+import datetime
+import gzip
+import logging
+import os
+from typing import AsyncIterator, Callable, Iterable, List, Optional, Tuple
+
+import discord
+
+from runtime import json_dumps
+
+logger = logging.getLogger(__name__)
+
+ARCHIVES_DIR = 'archives'
+
+# Discord deletes at most 100 messages per bulk delete, and only messages
+# younger than 14 days; older ones must be deleted one by one
+BULK_DELETE_LIMIT = 100
+BULK_DELETE_MAX_AGE = datetime.timedelta(days=14)
+
+
+def snowflake_window(hours: float, now: Optional[datetime.datetime] = None) -> Tuple[discord.Object, discord.Object]:
+    """
+    Return (after, before) snowflakes bounding the last ``hours`` hours.
+
+    Passed to ``channel.history``, they make Discord return only messages in
+    the window, so the scan stops at the window start instead of walking a
+    fixed number of messages.
+    """
+    now = now or discord.utils.utcnow()
+    after = discord.utils.time_snowflake(now - datetime.timedelta(hours=hours), high=False)
+    before = discord.utils.time_snowflake(now, high=True)
+    return discord.Object(id=after), discord.Object(id=before)
+
+
+async def matching(messages: AsyncIterator[discord.Message],
+                   check: Callable[[discord.Message], bool]) -> AsyncIterator[discord.Message]:
+    """Yield the messages accepted by ``check``."""
+    async for message in messages:
+        if check(message):
+            yield message
+
+
+async def batched(messages: AsyncIterator[discord.Message], size: int = BULK_DELETE_LIMIT) -> AsyncIterator[List[discord.Message]]:
+    """Group messages into lists of at most ``size``."""
+    batch = []
+    async for message in messages:
+        batch.append(message)
+        if len(batch) >= size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def message_record(message: discord.Message) -> dict:
+    """Return the archived fields of a message."""
+    return {
+        'id': message.id,
+        'channel_id': message.channel.id,
+        'channel': getattr(message.channel, 'name', None),
+        'author_id': message.author.id,
+        'author': str(message.author),
+        'created_at': message.created_at.isoformat(),
+        'edited_at': message.edited_at.isoformat() if message.edited_at else None,
+        'content': message.content,
+        'attachments': [attachment.url for attachment in message.attachments],
+        'embeds': len(message.embeds),
+        'reference_id': message.reference.message_id if message.reference else None,
+    }
+
+
+class MessageArchive:
+    """Append-only gzip-compressed JSON Lines file of archived messages."""
+
+    def __init__(self, path: str):
+        """Open the archive for writing, creating its directory if needed."""
+        self.path = path
+        self.count = 0
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self._file = gzip.open(path, 'wt', encoding='utf-8')
+
+    @classmethod
+    def for_guild(cls, guild_id: int) -> 'MessageArchive':
+        """Open a new timestamped archive for a guild in ARCHIVES_DIR."""
+        stamp = discord.utils.utcnow().strftime('%Y%m%d-%H%M%S')
+        return cls(os.path.join(ARCHIVES_DIR, f"clear-{guild_id}-{stamp}.jsonl.gz"))
+
+    def write(self, records: Iterable[dict]):
+        """Append records and flush them to disk."""
+        lines = [json_dumps(record) for record in records]
+        self._file.write('\n'.join(lines) + '\n')
+        self._file.flush()
+        self.count += len(lines)
+
+    def close(self):
+        """Close the archive file."""
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+
+async def delete_batch(channel, messages: List[discord.Message]) -> Tuple[int, int]:
+    """
+    Delete a batch of messages, in bulk where Discord allows it.
+
+    Returns:
+        (deleted, failed)
+    """
+    cutoff = discord.utils.utcnow() - BULK_DELETE_MAX_AGE
+    recent = [message for message in messages if message.created_at > cutoff]
+    old = [message for message in messages if message.created_at <= cutoff]
+    deleted = failed = 0
+
+    if recent:
+        try:
+            await channel.delete_messages(recent)
+            deleted += len(recent)
+        except discord.HTTPException as e:
+            logger.warning(f"Bulk delete of {len(recent)} messages in #{channel.name} failed: {e}")
+            failed += len(recent)
+
+    for message in old:
+        try:
+            await message.delete()
+            deleted += 1
+        except discord.NotFound:
+            deleted += 1
+        except discord.HTTPException as e:
+            logger.warning(f"Could not delete message {message.id} in #{channel.name}: {e}")
+            failed += 1
+
+    return deleted, failed
+
+
+async def archive_and_purge(channel, check: Callable[[discord.Message], bool], archive: MessageArchive,
+                            after: discord.Object, before: discord.Object,
+                            on_batch: Optional[Callable[..., None]] = None) -> Tuple[int, int]:
+    """
+    Archive, then delete, the messages of a channel in a time window that pass ``check``.
+
+    Each batch is written to the archive before it is deleted, so nothing is
+    deleted without having been archived first. ``on_batch`` is called after
+    every batch with the archived, deleted and failed counts as keywords;
+    unlike the return value, these counts are kept when reading the history
+    raises partway through the channel.
+
+    Returns:
+        (deleted, failed)
+    """
+    deleted = failed = 0
+    history = channel.history(limit=None, after=after, before=before)
+    async for batch in batched(matching(history, check)):
+        records = [message_record(message) for message in batch]
+        await asyncio.to_thread(archive.write, records)
+        batch_deleted, batch_failed = await delete_batch(channel, batch)
+        deleted += batch_deleted
+        failed += batch_failed
+        if on_batch is not None:
+            on_batch(archived=len(records), deleted=batch_deleted, failed=batch_failed)
+    return deleted, failed
@@ -0,0 +1,4 @@
+"""
+Benchmarks for the Discord Verification Bot
+Run each module from the repository root, e.g. ``python -m benchmarks.gateway_replay``.
+"""
@@ -0,0 +1,116 @@
+"""
+Gateway replay benchmark
+Replays gateway payloads through JSON decoding and per-event handler dispatch
+on every available event loop and JSON backend, and reports events per second
+and p99 handler latency.
+
+Record real payloads by running the bot with GATEWAY_RECORD_FILE set, then:
+
+    python -m benchmarks.gateway_replay --payloads gateway.jsonl
+
+Without --payloads a synthetic mix of typical guild events is used.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+
+import runtime
+
+
+def synthetic_payloads(count: int):
+    """Build a mix of raw gateway payloads resembling a busy guild."""
+    rng = random.Random(42)
+    author = {'id': '100000000000000001', 'username': 'user', 'global_name': 'User', 'discriminator': '0', 'avatar': None}
+    templates = [
+        ('MESSAGE_CREATE', 6, lambda i: {
+            'id': str(1200000000000000000 + i), 'channel_id': '1100000000000000000', 'guild_id': '1000000000000000000',
+            'author': author, 'content': 'bonjour ' * rng.randint(1, 30), 'timestamp': '2025-08-03T05:31:15.751000+00:00',
+            'member': {'roles': ['1401222901205700849'], 'joined_at': '2025-08-01T00:00:00+00:00', 'nick': None},
+            'mentions': [], 'attachments': [], 'embeds': [], 'type': 0,
+        }),
+        ('TYPING_START', 3, lambda i: {
+            'channel_id': '1100000000000000000', 'guild_id': '1000000000000000000', 'user_id': author['id'], 'timestamp': 1754199075,
+        }),
+        ('MESSAGE_REACTION_ADD', 2, lambda i: {
+            'user_id': author['id'], 'channel_id': '1100000000000000000', 'message_id': str(1200000000000000000 + i),
+            'guild_id': '1000000000000000000', 'emoji': {'id': None, 'name': '👍'},
+        }),
+        ('GUILD_MEMBER_UPDATE', 1, lambda i: {
+            'guild_id': '1000000000000000000', 'user': author, 'nick': None,
+            'roles': ['1401222619482820670'], 'joined_at': '2025-08-01T00:00:00+00:00',
+        }),
+    ]
+    population = [t for t in templates for _ in range(t[1])]
+    for i in range(count):
+        event, _, build = rng.choice(population)
+        yield json.dumps({'op': 0, 't': event, 's': i, 'd': build(i)})
+
+
+async def replay(payloads, loads):
+    """Decode every payload and dispatch it to a handler task, like discord.py does."""
+    latencies = []
+    handled = {'MESSAGE_CREATE': 0, 'GUILD_MEMBER_UPDATE': 0}
+
+    async def handler(data, queued_at):
+        # Roughly the work of the anti-spam check: a few dict lookups
+        handled[data['event']] = handled.get(data['event'], 0) + 1
+        latencies.append(time.perf_counter() - queued_at)
+
+    loop = asyncio.get_running_loop()
+    tasks = []
+    start = time.perf_counter()
+    for raw in payloads:
+        msg = loads(raw)
+        event = msg.get('t')
+        if event in handled:
+            data = msg['d']
+            data['event'] = event
+            tasks.append(loop.create_task(handler(data, time.perf_counter())))
+        if len(tasks) >= 100:
+            await asyncio.gather(*tasks)
+            tasks.clear()
+    await asyncio.gather(*tasks)
+    elapsed = time.perf_counter() - start
+    return elapsed, latencies
+
+
+def run_case(loop_name, factory, json_name, loads, payloads):
+    with asyncio.Runner(loop_factory=factory) as runner:
+        elapsed, latencies = runner.run(replay(payloads, loads))
+    p99 = statistics.quantiles(latencies, n=100)[98] if len(latencies) >= 2 else 0.0
+    print(f"{loop_name:8} {json_name:7} {len(payloads) / elapsed:12,.0f} events/s   p99 handler latency {p99 * 1000:8.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument('--payloads', help="JSON Lines file of recorded gateway payloads")
+    parser.add_argument('--count', type=int, default=100000, help="Synthetic payloads to generate")
+    args = parser.parse_args()
+
+    if args.payloads:
+        with open(args.payloads, encoding='utf-8') as f:
+            payloads = [line for line in f if line.strip()]
+    else:
+        payloads = list(synthetic_payloads(args.count))
+    print(f"Replaying {len(payloads):,} payloads")
+
+    loops = [('asyncio', None)]
+    factory, name = runtime.event_loop_factory('uvloop')
+    if factory is not None:
+        loops.append((name, factory))
+
+    backends = [('json', json.loads)]
+    if runtime.orjson is not None:
+        backends.append(('orjson', runtime.orjson.loads))
+
+    for loop_name, factory in loops:
+        for json_name, loads in backends:
+            run_case(loop_name, factory, json_name, loads, payloads)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,83 @@
+"""
+Response construction benchmark
+Compares the cost of building and serializing the reply of a few commands the
+way the commands used to (a new discord.Embed per call, serialized on send)
+against the prebuilt response catalog.
+
+    python -m benchmarks.responses --number 20000
+"""
+
+import argparse
+import timeit
+
+import discord
+
+from responses import embed
+
+MEMBER = '<@123456789012345678>'
+MODERATOR = '<@876543210987654321>'
+
+
+def help_from_scratch():
+    help_embed = discord.Embed(title="🤖 Commandes du Bot de Vérification", color=discord.Color.blue())
+    for name, value in (
+        ("+men @utilisateur", "Vérifier un utilisateur comme homme (mention ou réponse)"),
+        ("+wom @utilisateur", "Vérifier un utilisateur comme femme (mention ou réponse)"),
+        ("+hebs @utilisateur [raison]", "Mettre un utilisateur en prison (mention ou réponse)"),
+        ("+unhebs @utilisateur", "Libérer un utilisateur de prison (mention ou réponse)"),
+        ("+jailed / +muted", "Lister les membres en prison / mute"),
+        ("+releaseall jailed|muted", "Libérer tous les membres en prison / mute"),
+        ("+zekir", "Message de Zekir"),
+        ("+unmute @utilisateur", "Démuter un utilisateur (mention ou réponse)"),
+        ("+omar", "Envoie une vidéo spéciale"),
+        ("+yisclear [nombre]", "Supprimer vos messages et ceux du bot dans tous les salons (défaut: 100)"),
+        ("+yisclear archive [heures]", "Archiver puis supprimer ces messages des dernières heures (défaut: 24)"),
+        ("+status @utilisateur", "Vérifier le statut d'un utilisateur"),
+        ("+help", "Afficher cette aide"),
+    ):
+        help_embed.add_field(name=name, value=value, inline=False)
+    return help_embed.to_dict()
+
+
+def jailed_from_scratch():
+    jailed = discord.Embed(
+        title="🔒 Utilisateur Emprisonné",
+        description=f"{MEMBER} a été mis en prison !",
+        color=discord.Color.red()
+    )
+    jailed.add_field(name="Emprisonné par", value=MODERATOR, inline=True)
+    jailed.add_field(name="Raison", value="spam", inline=True)
+    return jailed.to_dict()
+
+
+def status_from_scratch():
+    return discord.Embed(
+        title="Statut Utilisateur",
+        description=f"Statut pour {MEMBER}: ✅ Vérifié",
+        color=discord.Color.green()
+    ).to_dict()
+
+
+CASES = {
+    '+help': (help_from_scratch, lambda: embed('fr', 'help', prefix='+').to_dict()),
+    '+hebs': (jailed_from_scratch,
+              lambda: embed('fr', 'jailed', member=MEMBER, moderator=MODERATOR, reason='spam').to_dict()),
+    '+status': (status_from_scratch, lambda: embed('fr', 'status_verified', member=MEMBER).to_dict()),
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Response construction benchmark")
+    parser.add_argument('--number', type=int, default=20000)
+    args = parser.parse_args()
+
+    print(f"{'command':<10} {'from scratch':>14} {'catalog':>10} {'speedup':>8}")
+    for command, (scratch, catalog) in CASES.items():
+        assert scratch() == catalog(), command
+        before = min(timeit.repeat(scratch, number=args.number, repeat=3)) / args.number
+        after = min(timeit.repeat(catalog, number=args.number, repeat=3)) / args.number
+        print(f"{command:<10} {before * 1e6:11.2f} us {after * 1e6:7.2f} us {before / after:7.1f}x")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,86 @@
+"""
+Snapshot benchmark
+Times encoding, decoding and the file size of a warm-restart snapshot for a
+synthetic state, against a plain JSON dump of the same data, and the member
+name index build and swap-in that follow a restore.
+
+    python -m benchmarks.snapshot --members 200000 --spammers 5000
+"""
+
+import argparse
+import json
+import random
+import time
+
+from member_index import GuildMemberIndex, MemberIndex
+from snapshot import GuildState, decode, encode
+
+
+def synthetic_state(guilds: int, members: int, spammers: int):
+    """Build guild states with random member names and spam timestamps."""
+    rng = random.Random(0)
+    now = time.time()
+    state = {}
+    for guild_number in range(guilds):
+        guild = GuildState()
+        for _ in range(members // guilds):
+            member_id = rng.getrandbits(60)
+            name = f"user{rng.getrandbits(32):x}"
+            guild.names[member_id] = {name, f"nick {name}"}
+        for _ in range(spammers // guilds):
+            guild.spam[rng.getrandbits(60)] = [now - rng.random() * 30 for _ in range(rng.randint(1, 3))]
+        state[1000 + guild_number] = guild
+    return state
+
+
+def best_of(runs: int, func):
+    """Return the best wall-clock time of a few runs, and the last result."""
+    best = float('inf')
+    for _ in range(runs):
+        start = time.perf_counter()
+        result = func()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Warm-restart snapshot benchmark")
+    parser.add_argument('--guilds', type=int, default=4)
+    parser.add_argument('--members', type=int, default=200000)
+    parser.add_argument('--spammers', type=int, default=5000)
+    parser.add_argument('--runs', type=int, default=3)
+    args = parser.parse_args()
+
+    state = synthetic_state(args.guilds, args.members, args.spammers)
+
+    encode_time, data = best_of(args.runs, lambda: encode(state))
+    decode_time, (_, restored) = best_of(args.runs, lambda: decode(data))
+    assert restored.keys() == state.keys()
+    index_time, indexes = best_of(args.runs, lambda: {
+        guild_id: GuildMemberIndex.from_names(guild.names) for guild_id, guild in restored.items()
+    })
+
+    def swap_in():
+        member_index = MemberIndex()
+        for guild_id, index in indexes.items():
+            member_index.restore(guild_id, index)
+    swap_time, _ = best_of(1, swap_in)
+
+    as_json = {
+        str(guild_id): {
+            'spam': {str(k): v for k, v in guild.spam.items()},
+            'names': {str(k): sorted(v) for k, v in guild.names.items()},
+        }
+        for guild_id, guild in state.items()
+    }
+    json_encode_time, text = best_of(args.runs, lambda: json.dumps(as_json))
+    json_decode_time, _ = best_of(args.runs, lambda: json.loads(text))
+
+    print(f"{args.members} members, {args.spammers} spam entries in {args.guilds} guild(s)")
+    print(f"  snapshot  encode {encode_time * 1000:7.1f} ms  decode {decode_time * 1000:7.1f} ms  {len(data) / 1024:8.0f} KiB")
+    print(f"  index     build  {index_time * 1000:7.1f} ms (worker thread)  swap in {swap_time * 1000:7.1f} ms (event loop)")
+    print(f"  json      encode {json_encode_time * 1000:7.1f} ms  decode {json_decode_time * 1000:7.1f} ms  {len(text) / 1024:8.0f} KiB")
+
+
+if __name__ == '__main__':
+    main()
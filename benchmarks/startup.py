@@ -0,0 +1,77 @@
+"""
+Startup benchmark
+Measures the offline part of a cold start in fresh interpreters: imports,
+configuration, bot construction and extension loading, i.e. everything before
+the gateway handshake. Also reports the import cost of the keep-alive web
+server, which now runs after the bot is connected instead of before.
+
+    python -m benchmarks.startup --runs 5
+
+Time to first command served on a live gateway is logged by the bot itself
+(startup phase 'first_command' in bot.log).
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CHILD = r'''
+import asyncio, json, os, time
+os.environ.setdefault('DISCORD_TOKEN', 'benchmark')
+import main
+from bot import VerificationBot
+from config import Config
+
+async def run():
+    startup = main.startup
+    startup.mark('imports')
+    config = Config()
+    startup.mark('config')
+    bot = VerificationBot(config, startup)
+    startup.mark('bot_init')
+    await bot.setup_hook()
+    await bot.close()
+    start = time.perf_counter()
+    import web
+    return dict(startup.phases), time.perf_counter() - start
+
+phases, web_import = asyncio.run(run())
+print(json.dumps({'phases': phases, 'web_import': web_import}))
+'''
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cold start benchmark")
+    parser.add_argument('--runs', type=int, default=5)
+    args = parser.parse_args()
+
+    # Run in a scratch directory so bot.log and state files are left alone
+    env = dict(os.environ, PYTHONPATH=REPO_ROOT)
+    results = []
+    with tempfile.TemporaryDirectory() as workdir:
+        for _ in range(args.runs):
+            output = subprocess.run(
+                [sys.executable, '-c', CHILD], capture_output=True, text=True, check=True, cwd=workdir, env=env
+            ).stdout
+            results.append(json.loads(output.strip().splitlines()[-1]))
+
+    phases = list(results[0]['phases'])
+    print(f"Median of {args.runs} cold starts")
+    total = 0.0
+    for phase in phases:
+        median = statistics.median(r['phases'][phase] for r in results)
+        total += median
+        print(f"  {phase:<12} {median * 1000:8.1f} ms")
+    print(f"  {'command-ready':<12} {total * 1000:8.1f} ms")
+    web = statistics.median(r['web_import'] for r in results)
+    print(f"  deferred web server import: {web * 1000:.1f} ms (off the critical path)")
+
+
+if __name__ == '__main__':
+    main()
@@ -1,257 +1,349 @@
 """
 Discord Verification Bot
-Handles user verification by managing roles through commands.
+Single bot process that loads every command set as an extension, so the
+verification (!) and moderation (+) commands share one gateway connection,
+one member cache and one event loop.
 """
 
+import asyncio
 import discord
-from discord.ext import commands
+from discord.ext import commands, tasks
+import importlib
 import logging
-from typing import Optional
+import os
+import time
+from typing import Optional, Set
+
+from action_coordinator import ActionCoordinator
+from gateway_stats import (HANDLER_PROFILES, GatewayRecorder, GatewayStats, build_intents, missing_intents,
+                           required_intents, unused_intents)
+from guild_settings import DEFAULT_SETTINGS_FILE, GuildSettingsStore
+from member_index import GuildMemberIndex, MemberIndex
+from profiling import Profiler
+from sanctions import SanctionIndex
+from snapshot import GuildState, SnapshotError, read_snapshot, write_snapshot
+from startup import StartupTimer
 
 logger = logging.getLogger(__name__)
 
+# Command sets loaded at startup
+EXTENSIONS = (
+    'cogs.verification',
+    'cogs.moderation',
+    'cogs.interactions',
+    'cogs.diagnostics',
+)
+
+
+def process_rss_mb() -> Optional[float]:
+    """Return the current resident set size of this process in MiB, if available."""
+    try:
+        with open('/proc/self/statm') as f:
+            resident_pages = int(f.read().split()[1])
+        return resident_pages * os.sysconf('SC_PAGE_SIZE') / (1024 * 1024)
+    except (OSError, ValueError, IndexError, AttributeError):
+        pass
+    try:
+        import resource
+        # ru_maxrss is the peak RSS, in KiB on Linux and bytes on macOS
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+    except ImportError:
+        return None
+
+
 class VerificationBot(commands.Bot):
-    """Main bot class for handling verification commands."""
-    
-    def __init__(self, config):
+    """Main bot class hosting all command sets."""
+
+    def __init__(self, config, startup: Optional[StartupTimer] = None):
         """Initialize the bot with necessary intents and configuration."""
-        intents = discord.Intents.default()
-        intents.message_content = True
-        intents.guilds = True
-        intents.members = True
-        
+        intents = build_intents(config.INTENT_PROFILE)
+        # Text commands need message content; slash commands work without it
+        intents.message_content = intents.message_content and config.MESSAGE_CONTENT_INTENT
+
         super().__init__(
-            command_prefix='!',
+            command_prefix=self.prefixes_for,
             intents=intents,
-            help_command=None
+            help_command=None,
+            # Serve commands as soon as the gateway is ready; members are
+            # chunked in the background and fetched on demand until then
+            chunk_guilds_at_startup=False,
+            # Raw payloads are only needed when recording them for benchmarks
+            enable_debug_events=bool(config.GATEWAY_RECORD_FILE)
         )
-        
+
         self.config = config
-        
+        self.startup = startup or StartupTimer()
+
+        # Start the keep-alive web server once connected (set by the entry point)
+        self.start_web_server = False
+        self._deferred_startup_task = None
+
+        # State and member name indexes restored from the warm-restart
+        # snapshot, applied once guilds are known
+        self._restored_state = None
+        self._snapshot_task = None
+        # Periodic snapshot write running in a worker thread
+        self._snapshot_write = None
+
+        self.guild_settings = GuildSettingsStore(os.getenv('GUILD_SETTINGS_FILE', DEFAULT_SETTINGS_FILE))
+        self.guild_settings.load()
+
+        # Name/ID index used to resolve member arguments of text commands
+        self.member_index = MemberIndex()
+        self.member_index.attach(self)
+
+        # Jailed and muted members of every guild, for listings and bulk release
+        self.sanctions = SanctionIndex(self.guild_settings)
+        self.sanctions.attach(self)
+
+        # Deduplicates and serializes concurrent role actions on the same member
+        self.action_coordinator = ActionCoordinator()
+
+        # Handler timings and blocked-loop detection
+        self.profiler = Profiler(slow_threshold=config.SLOW_CALLBACK_MS / 1000)
+
+        # Gateway dispatch events received since startup, per event type
+        self.gateway_stats = GatewayStats()
+        self.gateway_stats.instrument(self._connection)
+        if config.GATEWAY_RECORD_FILE:
+            GatewayRecorder(config.GATEWAY_RECORD_FILE).attach(self)
+
+    async def setup_hook(self):
+        """Load every command set before connecting to the gateway."""
+        self.startup.mark('login')
+        self.profiler.start_watchdog()
+        for extension in EXTENSIONS:
+            await self.load_extension(extension)
+        logger.info(f"Loaded extensions: {list(self.extensions)}")
+        self.apply_intent_profile()
+        self.startup.mark('extensions')
+        # Decoded while the gateway connects, applied in on_ready
+        self._snapshot_task = asyncio.create_task(self.load_snapshot())
+
+    def _read_snapshot(self):
+        """Decode the snapshot and build its member name indexes; runs in a worker thread."""
+        written_at, guilds = read_snapshot(self.config.SNAPSHOT_FILE)
+        if time.time() - written_at > self.config.SNAPSHOT_MAX_AGE:
+            return written_at, None, None
+        indexes = {guild_id: GuildMemberIndex.from_names(state.names) for guild_id, state in guilds.items()}
+        return written_at, guilds, indexes
+
+    async def load_snapshot(self):
+        """Read the warm-restart snapshot off the event loop, if a recent enough one exists."""
+        start = time.perf_counter()
+        try:
+            written_at, guilds, indexes = await asyncio.to_thread(self._read_snapshot)
+        except (SnapshotError, OSError) as e:
+            logger.info(f"Starting without state snapshot: {e}")
+            return
+
+        if guilds is None:
+            logger.info(f"Ignoring state snapshot written {time.time() - written_at:.0f}s ago")
+            return
+        self._restored_state = guilds, indexes
+        logger.info(f"Loaded state snapshot of {len(guilds)} guild(s) in {(time.perf_counter() - start) * 1000:.1f} ms")
+
+    def restore_snapshot(self):
+        """Apply the loaded snapshot to guilds the bot is still in, dropping expired entries."""
+        (guilds, indexes), self._restored_state = self._restored_state, None
+        known = {guild.id for guild in self.guilds}
+        moderation = self.get_cog('Moderation')
+        now = time.time()
+        for guild_id, state in guilds.items():
+            if guild_id not in known:
+                continue
+            if moderation is not None:
+                window = self.guild_settings.get(guild_id).spam_window
+                for user_id, timestamps in state.spam.items():
+                    recent = [ts for ts in timestamps if now - ts < window]
+                    if recent:
+                        moderation.spam_tracker.setdefault((guild_id, user_id), recent)
+            self.member_index.restore(guild_id, indexes[guild_id])
+        logger.info(f"Restored state snapshot for {len(known.intersection(guilds))} guild(s)")
+
+    def collect_state(self):
+        """Copy the in-memory state to snapshot."""
+        guilds = {}
+        moderation = self.get_cog('Moderation')
+        if moderation is not None:
+            for (guild_id, user_id), timestamps in moderation.spam_tracker.items():
+                if timestamps:
+                    guilds.setdefault(guild_id, GuildState()).spam[user_id] = list(timestamps)
+        for guild_id, index in self.member_index.guilds.items():
+            guilds.setdefault(guild_id, GuildState()).names = dict(index.names_by_id)
+        return guilds
+
+    @tasks.loop(minutes=5)
+    async def save_snapshot_periodically(self):
+        """Write the warm-restart snapshot in the background."""
+        state = self.collect_state()
+        # Cancelling the loop does not stop the thread; close() waits for it
+        self._snapshot_write = asyncio.ensure_future(
+            asyncio.to_thread(write_snapshot, self.config.SNAPSHOT_FILE, state))
+        await asyncio.shield(self._snapshot_write)
+
+    async def deferred_startup(self):
+        """Startup work that does not need to block serving commands."""
+        await self.sync_app_commands()
+
+        if self.start_web_server:
+            # Importing Flask is slow; keep it off the event loop
+            web = await asyncio.to_thread(importlib.import_module, 'web')
+            web.keep_alive()
+            logger.info("Keep-alive web server started")
+
+        for guild in self.guilds:
+            if guild.chunked:
+                continue
+            try:
+                await guild.chunk()
+            except (discord.HTTPException, asyncio.TimeoutError) as e:
+                logger.error(f"Failed to chunk members of guild {guild.id}: {e}")
+                continue
+            self.dispatch('guild_chunked', guild)
+        self.startup.mark('members_chunked')
+        logger.info(f"Startup timings:\n{self.startup.summary()}")
+
+    def listener_names(self) -> Set[str]:
+        """Return the names of every registered event handler."""
+        return set(self.extra_events) | {name for name in dir(self) if name.startswith('on_')}
+
+    def apply_intent_profile(self):
+        """
+        Complete a handler-built profile with the intents of the registered
+        handlers, then warn about intents that are unused or missing.
+        """
+        profile = self.config.INTENT_PROFILE
+        listener_names = self.listener_names()
+        if profile in HANDLER_PROFILES:
+            needed = required_intents(listener_names)
+            needed.message_content = needed.message_content and self.config.MESSAGE_CONTENT_INTENT
+            # Read when identifying to the gateway, which happens after setup_hook
+            self._connection._intents.value |= needed.value
+        intents = self.intents
+
+        unused = unused_intents(intents, listener_names)
+        if unused:
+            # Expected with a fixed profile such as full; only a surprise when built from the handlers
+            level = logging.WARNING if profile in HANDLER_PROFILES else logging.INFO
+            logger.log(level, f"Intent profile '{profile}' receives events no handler uses: {unused}")
+
+        missing = missing_intents(intents, listener_names)
+        if not self.config.MESSAGE_CONTENT_INTENT:
+            # Disabled on purpose for slash-only mode
+            missing.pop('message_content', None)
+        for flag, names in missing.items():
+            logger.warning(f"Intent profile '{profile}' lacks the '{flag}' intent, these handlers will not see its events: {names}")
+
+    async def sync_app_commands(self):
+        """Sync slash commands, to the configured guild if any (instant) or globally."""
+        try:
+            if self.config.GUILD_ID:
+                guild = discord.Object(id=self.config.GUILD_ID)
+                self.tree.copy_global_to(guild=guild)
+                synced = await self.tree.sync(guild=guild)
+            else:
+                synced = await self.tree.sync()
+            logger.info(f"Synced {len(synced)} slash commands")
+        except discord.HTTPException as e:
+            logger.error(f"Failed to sync slash commands: {e}")
+
+    def prefixed_cogs(self):
+        """Yield the loaded cogs that answer to their own prefix."""
+        for cog in self.cogs.values():
+            if hasattr(cog, 'prefixed_commands'):
+                yield cog
+
+    def prefixes_for(self, bot, message):
+        """Return the prefixes of every loaded command set for the message's guild."""
+        guild_id = message.guild.id if message.guild else None
+        return [cog.command_prefix(guild_id) for cog in self.prefixed_cogs()]
+
+    async def get_context(self, origin, /, *, cls=commands.Context):
+        """Resolve the command within the cog that owns the matched prefix."""
+        ctx = await super().get_context(origin, cls=cls)
+        if ctx.prefix is None or ctx.invoked_with is None:
+            return ctx
+
+        guild_id = ctx.guild.id if ctx.guild else None
+        ctx.command = None
+        for cog in self.prefixed_cogs():
+            if cog.command_prefix(guild_id) == ctx.prefix:
+                ctx.command = cog.prefixed_commands.get(ctx.invoked_with)
+                if ctx.command is not None:
+                    break
+        return ctx
+
+    def dispatch(self, event_name, /, *args, **kwargs):
+        """Count gateway events before dispatching them to listeners."""
+        if event_name == 'socket_event_type':
+            self.gateway_stats.record(args[0])
+        super().dispatch(event_name, *args, **kwargs)
+
+    async def on_connect(self):
+        """Event triggered when the gateway connection is established."""
+        self.startup.mark('gateway_connect')
+
+    async def _run_event(self, coro, event_name, *args, **kwargs):
+        """Run an event handler and record how long it took."""
+        start = time.perf_counter()
+        try:
+            await super()._run_event(coro, event_name, *args, **kwargs)
+        finally:
+            self.profiler.record(f"event:{getattr(coro, '__qualname__', event_name)}", time.perf_counter() - start)
+
+    async def invoke(self, ctx):
+        """Invoke a text command and record how long it took."""
+        start = time.perf_counter()
+        try:
+            await super().invoke(ctx)
+        finally:
+            if ctx.command is not None:
+                self.profiler.record(f"command:{ctx.prefix}{ctx.invoked_with}", time.perf_counter() - start)
+                self.startup.mark('first_command')
+
+    async def close(self):
+        """Save the state snapshot, stop the profiler watchdog and disconnect."""
+        self.profiler.stop_watchdog()
+        if self.save_snapshot_periodically.is_running():
+            self.save_snapshot_periodically.cancel()
+            if self._snapshot_write is not None:
+                # Both writes go through the same .tmp file
+                await asyncio.wait([self._snapshot_write])
+            try:
+                write_snapshot(self.config.SNAPSHOT_FILE, self.collect_state())
+            except OSError as e:
+                logger.error(f"Failed to write state snapshot: {e}")
+        await super().close()
+
     async def on_ready(self):
         """Event triggered when bot is ready."""
         logger.info(f'{self.user} has connected to Discord!')
         logger.info(f'Bot is in {len(self.guilds)} guilds')
-        
+
         # Log available text commands
         text_commands = [cmd.name for cmd in self.commands]
         logger.info(f'Available text commands: {text_commands}')
-    
+        logger.info(f'Process RSS: {process_rss_mb()} MiB')
+        self.startup.mark('ready')
+
+        if self._snapshot_task is not None:
+            await self._snapshot_task
+            self._snapshot_task = None
+        if self._restored_state is not None:
+            self.restore_snapshot()
+        if not self.save_snapshot_periodically.is_running():
+            self.save_snapshot_periodically.change_interval(seconds=self.config.SNAPSHOT_INTERVAL)
+            self.save_snapshot_periodically.start()
+
+        if self._deferred_startup_task is None:
+            self._deferred_startup_task = asyncio.create_task(self.deferred_startup())
+
     async def on_command_error(self, ctx, error):
-        """Handle command errors."""
-        if isinstance(error, commands.MissingPermissions):
-            await ctx.send("❌ You don't have permission to use this command.")
-        elif isinstance(error, commands.MemberNotFound):
-            await ctx.send("❌ User not found. Please mention a valid user.")
-        elif isinstance(error, commands.RoleNotFound):
-            await ctx.send("❌ Required role not found. Please check bot configuration.")
-        else:
-            logger.error(f'Command error: {error}')
-            await ctx.send("❌ An error occurred while processing the command.")
-
-    @commands.command(name='verify')
-    @commands.has_permissions(manage_roles=True)
-    async def verify_user(self, ctx, member: discord.Member):
-        """
-        Verify a user by removing entry role and adding verified role.
-        
-        Args:
-            ctx: Command context
-            member: Discord member to verify
-        """
-        try:
-            guild = ctx.guild
-            
-            # Get roles from configuration
-            entry_role = discord.utils.get(guild.roles, id=self.config.ENTRY_ROLE_ID)
-            verified_role = discord.utils.get(guild.roles, id=self.config.VERIFIED_ROLE_ID)
-            
-            if not entry_role:
-                await ctx.send("❌ Entry role not found. Please check bot configuration.")
-                return
-                
-            if not verified_role:
-                await ctx.send("❌ Verified role not found. Please check bot configuration.")
-                return
-            
-            # Check if user has entry role
-            if entry_role not in member.roles:
-                await ctx.send(f"❌ {member.mention} doesn't have the entry role.")
-                return
-            
-            # Check if user already has verified role
-            if verified_role in member.roles:
-                await ctx.send(f"❌ {member.mention} is already verified.")
-                return
-            
-            # Remove entry role and add verified role
-            await member.remove_roles(entry_role, reason=f"Manual verification by {ctx.author}")
-            await member.add_roles(verified_role, reason=f"Manual verification by {ctx.author}")
-            
-            # Send success message
-            embed = discord.Embed(
-                title="✅ User Verified",
-                description=f"{member.mention} has been successfully verified!",
-                color=discord.Color.green()
-            )
-            embed.add_field(name="Verified by", value=ctx.author.mention, inline=True)
-            embed.add_field(name="Entry role removed", value=entry_role.name, inline=True)
-            embed.add_field(name="Verified role added", value=verified_role.name, inline=True)
-            
-            await ctx.send(embed=embed)
-            
-            # Log the verification
-            logger.info(f"User {member} verified by {ctx.author} in guild {guild.name}")
-            
-            # Send DM to verified user (optional)
-            try:
-                dm_embed = discord.Embed(
-                    title="🎉 You've been verified!",
-                    description=f"You have been manually verified in **{guild.name}** and now have access to all channels.",
-                    color=discord.Color.green()
-                )
-                await member.send(embed=dm_embed)
-            except discord.Forbidden:
-                logger.info(f"Could not send DM to {member} - DMs disabled")
-                
-        except discord.Forbidden:
-            await ctx.send("❌ I don't have permission to manage roles. Please check my permissions.")
-        except Exception as e:
-            logger.error(f"Error verifying user {member}: {e}")
-            await ctx.send("❌ An error occurred while verifying the user.")
-
-    @commands.command(name='unverify')
-    @commands.has_permissions(manage_roles=True)
-    async def unverify_user(self, ctx, member: discord.Member):
-        """
-        Unverify a user by removing verified role and adding entry role back.
-        
-        Args:
-            ctx: Command context
-            member: Discord member to unverify
-        """
-        try:
-            guild = ctx.guild
-            
-            # Get roles from configuration
-            entry_role = discord.utils.get(guild.roles, id=self.config.ENTRY_ROLE_ID)
-            verified_role = discord.utils.get(guild.roles, id=self.config.VERIFIED_ROLE_ID)
-            
-            if not entry_role:
-                await ctx.send("❌ Entry role not found. Please check bot configuration.")
-                return
-                
-            if not verified_role:
-                await ctx.send("❌ Verified role not found. Please check bot configuration.")
-                return
-            
-            # Check if user has verified role
-            if verified_role not in member.roles:
-                await ctx.send(f"❌ {member.mention} is not verified.")
-                return
-            
-            # Remove verified role and add entry role
-            await member.remove_roles(verified_role, reason=f"Manual unverification by {ctx.author}")
-            await member.add_roles(entry_role, reason=f"Manual unverification by {ctx.author}")
-            
-            # Send success message
-            embed = discord.Embed(
-                title="🔄 User Unverified",
-                description=f"{member.mention} has been unverified.",
-                color=discord.Color.orange()
-            )
-            embed.add_field(name="Unverified by", value=ctx.author.mention, inline=True)
-            embed.add_field(name="Verified role removed", value=verified_role.name, inline=True)
-            embed.add_field(name="Entry role added", value=entry_role.name, inline=True)
-            
-            await ctx.send(embed=embed)
-            
-            # Log the unverification
-            logger.info(f"User {member} unverified by {ctx.author} in guild {guild.name}")
-                
-        except discord.Forbidden:
-            await ctx.send("❌ I don't have permission to manage roles. Please check my permissions.")
-        except Exception as e:
-            logger.error(f"Error unverifying user {member}: {e}")
-            await ctx.send("❌ An error occurred while unverifying the user.")
-
-    @commands.command(name='status')
-    @commands.has_permissions(manage_roles=True)
-    async def check_status(self, ctx, member: discord.Member):
-        """
-        Check the verification status of a user.
-        
-        Args:
-            ctx: Command context
-            member: Discord member to check
-        """
-        try:
-            guild = ctx.guild
-            
-            # Get roles from configuration
-            entry_role = discord.utils.get(guild.roles, id=self.config.ENTRY_ROLE_ID)
-            verified_role = discord.utils.get(guild.roles, id=self.config.VERIFIED_ROLE_ID)
-            
-            has_entry = entry_role in member.roles if entry_role else False
-            has_verified = verified_role in member.roles if verified_role else False
-            
-            # Determine status
-            if has_verified:
-                status = "✅ Verified"
-                color = discord.Color.green()
-            elif has_entry:
-                status = "⏳ Pending Verification"
-                color = discord.Color.orange()
-            else:
-                status = "❓ Unknown Status"
-                color = discord.Color.red()
-            
-            embed = discord.Embed(
-                title="User Status",
-                description=f"Status for {member.mention}",
-                color=color
-            )
-            embed.add_field(name="Current Status", value=status, inline=False)
-            embed.add_field(name="Has Entry Role", value="Yes" if has_entry else "No", inline=True)
-            embed.add_field(name="Has Verified Role", value="Yes" if has_verified else "No", inline=True)
-            embed.set_thumbnail(url=member.display_avatar.url)
-            
-            await ctx.send(embed=embed)
-            
-        except Exception as e:
-            logger.error(f"Error checking status for {member}: {e}")
-            await ctx.send("❌ An error occurred while checking user status.")
-
-    @commands.command(name='bothelp')
-    async def bot_help(self, ctx):
-        """Display help information."""
-        embed = discord.Embed(
-            title="🤖 Verification Bot Commands",
-            description="Manual user verification system",
-            color=discord.Color.blue()
-        )
-        
-        embed.add_field(
-            name="!verify @user",
-            value="Verify a user (removes entry role, adds verified role)",
-            inline=False
-        )
-        embed.add_field(
-            name="!unverify @user",
-            value="Remove verification from a user",
-            inline=False
-        )
-        embed.add_field(
-            name="!status @user",
-            value="Check verification status of a user",
-            inline=False
-        )
-        embed.add_field(
-            name="!bothelp",
-            value="Show this help message",
-            inline=False
-        )
-        
-        embed.set_footer(text="Note: All commands require 'Manage Roles' permission")
-        
-        await ctx.send(embed=embed)
\ No newline at end of file
+        """Handle errors not already handled by a command set."""
+        if ctx.cog is not None and ctx.cog.has_error_handler():
+            return
+        if isinstance(error, commands.CommandNotFound):
+            # Ignore unknown commands to avoid spam
+            return
+        logger.error(f'Command error: {error}')
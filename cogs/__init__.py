@@ -0,0 +1,4 @@
+"""
+Command sets loaded as discord.py extensions into a single bot.
+Each extension keeps its own prefix so both sets share one gateway connection.
+"""
@@ -0,0 +1,36 @@
+"""
+Base class for command sets that answer to their own prefix.
+"""
+
+from typing import Dict, Optional
+
+from discord.ext import commands
+
+
+class PrefixedCog(commands.Cog):
+    """
+    Cog whose commands are only reachable through its own prefix.
+
+    Commands may set ``extras={'prefixed_name': ...}`` to be invoked under a
+    name that is already registered by another cog (e.g. ``!status`` and
+    ``+status``); the bot routes the invocation using the prefix that matched.
+    Replies use the guild's locale, or ``default_locale`` when it has none.
+    """
+
+    default_locale = 'en'
+
+    def __init__(self, bot):
+        """Initialize the cog and index its commands by prefixed name."""
+        self.bot = bot
+        self.prefixed_commands: Dict[str, commands.Command] = {}
+        for command in self.get_commands():
+            for name in (command.extras.get('prefixed_name', command.name), *command.aliases):
+                self.prefixed_commands[name] = command
+
+    def command_prefix(self, guild_id: Optional[int]) -> str:
+        """Return the prefix this cog answers to in the given guild, the configured one by default."""
+        return self.bot.config.COMMAND_PREFIX
+
+    def locale(self, guild_id: Optional[int]) -> str:
+        """Return the locale replies are sent in for the given guild."""
+        return self.bot.guild_settings.get(guild_id).locale or self.default_locale
@@ -0,0 +1,120 @@
+"""
+Diagnostics commands (! prefix)
+Administrator-only views of memory, gateway traffic and handler timings, and
+an on-demand sampling profiler.
+"""
+
+import asyncio
+import logging
+
+import discord
+from discord.ext import commands
+
+from bot import process_rss_mb
+from cogs.base import PrefixedCog
+from responses import embed, message
+
+logger = logging.getLogger(__name__)
+
+# Longest profile an administrator may request, in seconds
+MAX_PROFILE_SECONDS = 120
+
+
+class DiagnosticsCog(PrefixedCog, name='Diagnostics'):
+    """Runtime diagnostics using the configured prefix (default !)."""
+
+    async def cog_command_error(self, ctx, error):
+        """Handle command errors."""
+        locale = self.locale(ctx.guild.id if ctx.guild else None)
+        if isinstance(error, commands.MissingPermissions):
+            await ctx.send(message(locale, 'no_permission'))
+        elif isinstance(error, commands.BadArgument):
+            await ctx.send(message(locale, 'invalid_argument'))
+        else:
+            logger.error(f'Command error: {error}')
+            await ctx.send(message(locale, 'error'))
+
+    @commands.command(name='botstats')
+    @commands.has_permissions(administrator=True)
+    async def show_stats(self, ctx):
+        """Display process memory and gateway event counts for the whole bot."""
+        locale = self.locale(ctx.guild.id if ctx.guild else None)
+        rss = process_rss_mb()
+        coordinator = self.bot.action_coordinator
+        await ctx.send(embed=embed(
+            locale, 'botstats',
+            rss=f"{rss:.1f} MiB" if rss is not None else message(locale, 'not_available'),
+            events=self.bot.gateway_stats.total,
+            guilds=len(self.bot.guilds),
+            members=sum(len(g.members) for g in self.bot.guilds),
+            cogs=", ".join(self.bot.cogs),
+            joined=coordinator.deduplicated,
+            queued=coordinator.serialized,
+            rest_saved=coordinator.rest_calls_saved,
+        ))
+
+    @commands.command(name='gatewaystats')
+    @commands.has_permissions(administrator=True)
+    async def gateway_stats(self, ctx):
+        """Display gateway events received and decode time per event type."""
+        locale = self.locale(ctx.guild.id if ctx.guild else None)
+        stats = self.bot.gateway_stats
+        lines = [
+            message(locale, 'gateway_event_line', event_type=event_type, count=count, decode=f"{decode * 1000:.1f}")
+            for event_type, count, decode in stats.top(15)
+        ]
+        guilds = max(len(self.bot.guilds), 1)
+        await ctx.send(embed=embed(
+            locale, 'gatewaystats',
+            events="\n".join(lines) or message(locale, 'no_gateway_events'),
+            profile=self.bot.config.INTENT_PROFILE,
+            total=stats.total,
+            decode=f"{stats.total_decode_seconds * 1000 / guilds:.1f}",
+        ))
+
+    @commands.command(name='perf')
+    @commands.has_permissions(administrator=True)
+    async def show_timings(self, ctx):
+        """Display the event handlers and commands with the highest total time."""
+        locale = self.locale(ctx.guild.id if ctx.guild else None)
+        profiler = self.bot.profiler
+        lines = [
+            message(locale, 'handler_timing_line', name=name, count=stats.count,
+                    average=f"{stats.total / stats.count * 1000:.1f}", max=f"{stats.max * 1000:.0f}")
+            for name, stats in profiler.top(15)
+        ]
+        threshold = f"{profiler.slow_threshold * 1000:.0f} ms" if profiler.slow_threshold > 0 else message(locale, 'disabled')
+        await ctx.send(embed=embed(
+            locale, 'perf',
+            timings="\n".join(lines) or message(locale, 'no_handler_timings'),
+            threshold=threshold,
+            blocks=profiler.slow_callbacks,
+        ))
+
+    @commands.command(name='profile')
+    @commands.has_permissions(administrator=True)
+    async def run_profile(self, ctx, seconds: int = 10):
+        """Sample the event loop for N seconds and upload a flame graph input file."""
+        locale = self.locale(ctx.guild.id if ctx.guild else None)
+        profiler = self.bot.profiler
+        if profiler.sampling:
+            await ctx.send(message(locale, 'profile_running'))
+            return
+
+        # Claimed before the first await and released once the profile file
+        # is written, so a second !profile sent meanwhile is refused
+        profiler.sampling = True
+        try:
+            seconds = max(1, min(seconds, MAX_PROFILE_SECONDS))
+            await ctx.send(message(locale, 'profiling', seconds=seconds))
+            loop = asyncio.get_running_loop()
+            path = await loop.run_in_executor(None, profiler.sample, seconds)
+        finally:
+            profiler.sampling = False
+        await ctx.send(message(locale, 'profile_ready'), file=discord.File(path))
+        logger.info(f"Profile of {seconds}s requested by {ctx.author} written to {path}")
+
+
+async def setup(bot):
+    """Load the diagnostics command set."""
+    await bot.add_cog(DiagnosticsCog(bot))
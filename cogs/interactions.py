@@ -0,0 +1,193 @@
+"""
+Slash commands (/)
+App-command versions of the role commands. They work without the privileged
+message_content intent: every command defers immediately and sends the result
+as a follow-up once the role change is done.
+"""
+
+import logging
+
+import discord
+from discord import app_commands
+from discord.ext import commands
+
+import role_actions
+from responses import message
+from role_actions import ActionError
+
+logger = logging.getLogger(__name__)
+
+
+class InteractionCog(commands.Cog, name='Interactions'):
+    """Slash command set sharing its role actions with the text commands."""
+
+    def __init__(self, bot):
+        """Initialize the cog."""
+        self.bot = bot
+
+    def locale(self, guild_id, default='fr'):
+        """Return the guild's locale, or the language of the command when it has none."""
+        return self.bot.guild_settings.get(guild_id).locale or default
+
+    async def _deferred(self, interaction, action, error_log, locale, member=None):
+        """
+        Defer the interaction, run a role action and send its result as a follow-up.
+
+        Args:
+            interaction: Interaction to answer
+            action: Callable returning the action coroutine; it takes the
+                target member when ``member`` is given, no argument otherwise
+            error_log: Prefix for unexpected errors in the log
+            locale: Locale of the error messages
+            member: Member a role-changing action targets; the action then
+                runs through the action coordinator under the command name
+
+        Returns:
+            True if the action succeeded
+        """
+        await interaction.response.defer(thinking=True)
+        succeeded = False
+        try:
+            if member is not None:
+                embed = await self.bot.action_coordinator.run(
+                    interaction.guild, member, interaction.command.name, action
+                )
+                self.bot.sanctions.apply_action(interaction.guild, member.id, interaction.command.name)
+            else:
+                embed = await action()
+            await interaction.followup.send(embed=embed)
+            succeeded = True
+        except ActionError as e:
+            await interaction.followup.send(str(e))
+        except discord.Forbidden:
+            await interaction.followup.send(message(locale, 'forbidden_roles'))
+        except Exception as e:
+            logger.error(f"{error_log}: {e}")
+            await interaction.followup.send(message(locale, 'error'))
+
+        latency = (discord.utils.utcnow() - interaction.created_at).total_seconds()
+        self.bot.profiler.record(f"slash:/{interaction.command.name}", latency)
+        self.bot.startup.mark('first_command')
+        logger.info(f"/{interaction.command.name} answered in {latency * 1000:.0f} ms")
+        return succeeded
+
+    async def cog_app_command_error(self, interaction, error):
+        """Handle slash command errors."""
+        locale = self.locale(interaction.guild_id)
+        if isinstance(error, app_commands.MissingPermissions):
+            text = message(locale, 'no_permission')
+        else:
+            logger.error(f"App command error: {error}")
+            text = message(locale, 'error')
+
+        if interaction.response.is_done():
+            await interaction.followup.send(text, ephemeral=True)
+        else:
+            await interaction.response.send_message(text, ephemeral=True)
+
+    @app_commands.command(name='verify', description="Verify a user (removes entry role, adds verified role)")
+    @app_commands.guild_only()
+    @app_commands.default_permissions(manage_roles=True)
+    @app_commands.checks.has_permissions(manage_roles=True)
+    async def verify(self, interaction: discord.Interaction, member: discord.Member):
+        """Verify a user by removing entry role and adding verified role."""
+        settings = self.bot.guild_settings.get(interaction.guild_id)
+        locale = self.locale(interaction.guild_id, 'en')
+        await self._deferred(
+            interaction,
+            lambda target: role_actions.verify_member(interaction.guild, target, interaction.user, settings, locale),
+            f"Error verifying user {member}", locale, member
+        )
+
+    @app_commands.command(name='men', description="Vérifier un utilisateur comme homme")
+    @app_commands.guild_only()
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def men(self, interaction: discord.Interaction, member: discord.Member):
+        """Verify a user as male."""
+        settings = self.bot.guild_settings.get(interaction.guild_id)
+        locale = self.locale(interaction.guild_id)
+        await self._deferred(
+            interaction,
+            lambda target: role_actions.verify_gender(interaction.guild, target, interaction.user, settings, 'men', locale),
+            "Error verifying user as male", locale, member
+        )
+
+    @app_commands.command(name='wom', description="Vérifier un utilisateur comme femme")
+    @app_commands.guild_only()
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def wom(self, interaction: discord.Interaction, member: discord.Member):
+        """Verify a user as female."""
+        settings = self.bot.guild_settings.get(interaction.guild_id)
+        locale = self.locale(interaction.guild_id)
+        await self._deferred(
+            interaction,
+            lambda target: role_actions.verify_gender(interaction.guild, target, interaction.user, settings, 'wom', locale),
+            "Error verifying user as female", locale, member
+        )
+
+    @app_commands.command(name='hebs', description="Mettre un utilisateur en prison")
+    @app_commands.guild_only()
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def hebs(self, interaction: discord.Interaction, member: discord.Member, reason: str = None):
+        """Put a user in jail."""
+        settings = self.bot.guild_settings.get(interaction.guild_id)
+        locale = self.locale(interaction.guild_id)
+        await self._deferred(
+            interaction,
+            lambda target: role_actions.jail_member(interaction.guild, target, interaction.user, settings, reason, locale),
+            "Error jailing user", locale, member
+        )
+
+    @app_commands.command(name='unhebs', description="Libérer un utilisateur de prison")
+    @app_commands.guild_only()
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def unhebs(self, interaction: discord.Interaction, member: discord.Member):
+        """Remove a user from jail and restore their roles."""
+        settings = self.bot.guild_settings.get(interaction.guild_id)
+        locale = self.locale(interaction.guild_id)
+        await self._deferred(
+            interaction,
+            lambda target: role_actions.unjail_member(interaction.guild, target, interaction.user, settings, locale),
+            "Error unjailing user", locale, member
+        )
+
+    @app_commands.command(name='unmute', description="Démuter un utilisateur")
+    @app_commands.guild_only()
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def unmute(self, interaction: discord.Interaction, member: discord.Member):
+        """Unmute a user."""
+        settings = self.bot.guild_settings.get(interaction.guild_id)
+        locale = self.locale(interaction.guild_id)
+        unmuted = await self._deferred(
+            interaction,
+            lambda target: role_actions.unmute_member(interaction.guild, target, interaction.user, settings, locale),
+            "Error unmuting user", locale, member
+        )
+
+        moderation = self.bot.get_cog('Moderation')
+        if unmuted and moderation is not None:
+            moderation.clear_spam(interaction.guild_id, member.id)
+
+    @app_commands.command(name='status', description="Vérifier le statut d'un utilisateur")
+    @app_commands.guild_only()
+    @app_commands.default_permissions(administrator=True)
+    @app_commands.checks.has_permissions(administrator=True)
+    async def status(self, interaction: discord.Interaction, member: discord.Member):
+        """Check verification status of a user."""
+        settings = self.bot.guild_settings.get(interaction.guild_id)
+        locale = self.locale(interaction.guild_id)
+
+        async def build():
+            return role_actions.status_embed(interaction.guild, member, settings, locale)
+
+        await self._deferred(interaction, build, "Error checking status", locale)
+
+
+async def setup(bot):
+    """Load the slash command set."""
+    await bot.add_cog(InteractionCog(bot))
@@ -0,0 +1,579 @@
+"""
+Moderation commands (+ prefix)
+Verification by gender, jail, mute and message cleanup, with anti-spam
+protection for admin-only commands.
+"""
+
+import asyncio
+import logging
+import os
+from collections import Counter
+from dataclasses import asdict
+from itertools import islice
+from typing import Optional
+
+import discord
+from discord.ext import commands, tasks
+
+import role_actions
+from archive import MessageArchive, archive_and_purge, snowflake_window
+from cogs.base import PrefixedCog
+from member_index import IndexedMember
+from progress import ProgressReporter
+from responses import embed, message
+from role_actions import ActionError
+
+logger = logging.getLogger(__name__)
+
+# Messages +yisclear scans per channel when no count is given
+CLEAR_LIMIT = 100
+
+# Members shown by +jailed / +muted
+SANCTION_LIST_LIMIT = 50
+
+# Role actions +releaseall runs concurrently; Discord rate limits role
+# changes per guild, so a few workers are as fast as many
+RELEASE_WORKERS = 3
+
+# Release action of each sanction kind: (action name, role action)
+RELEASE_ACTIONS = {
+    'jailed': ('unhebs', role_actions.unjail_member),
+    'muted': ('unmute', role_actions.unmute_member),
+}
+
+
+class ModerationCog(PrefixedCog, name='Moderation'):
+    """French moderation command set using the per-guild prefix (default +)."""
+
+    default_locale = 'fr'
+
+    def __init__(self, bot):
+        """Initialize the cog with an empty anti-spam tracker."""
+        super().__init__(bot)
+        self.spam_tracker = {}  # {(guild_id, user_id): [timestamps]}
+
+    def command_prefix(self, guild_id):
+        """Return the configured prefix for the guild."""
+        return self.bot.guild_settings.get(guild_id).prefix
+
+    def clear_spam(self, guild_id, user_id):
+        """Forget the failed admin command attempts of a user."""
+        self.spam_tracker.pop((guild_id, user_id), None)
+
+    async def cog_load(self):
+        """Start watching the guild settings file."""
+        self.watch_guild_settings.start()
+
+    async def cog_unload(self):
+        """Stop watching the guild settings file."""
+        self.watch_guild_settings.cancel()
+
+    @tasks.loop(seconds=5)
+    async def watch_guild_settings(self):
+        """Hot-reload guild settings when the settings file changes on disk."""
+        self.bot.guild_settings.reload_if_changed()
+
+    @commands.Cog.listener()
+    async def on_message(self, message):
+        """Monitor messages for spam detection."""
+        # Ignore bot messages
+        if message.author.bot:
+            return
+
+        settings = self.bot.guild_settings.get(message.guild.id if message.guild else None)
+
+        # Check if message starts with command prefix
+        if message.guild and message.content.startswith(settings.prefix):
+            # List of admin-only commands
+            admin_commands = ['men', 'wom', 'hebs', 'unhebs', 'zekir', 'yisclear', 'status', 'unmute', 'reload', 'config',
+                              'jailed', 'muted', 'releaseall']
+
+            # Extract command name from message
+            command_parts = message.content[len(settings.prefix):].split()
+            if command_parts:
+                command_name = command_parts[0].lower()
+
+                # Check if it's an admin command and user is not admin
+                if command_name in admin_commands and not message.author.guild_permissions.administrator:
+                    user_id = (message.guild.id, message.author.id)
+                    current_time = message.created_at.timestamp()
+
+                    # Initialize spam tracker for user if not exists
+                    if user_id not in self.spam_tracker:
+                        self.spam_tracker[user_id] = []
+
+                    # Clean old timestamps outside the spam window
+                    self.spam_tracker[user_id] = [
+                        timestamp for timestamp in self.spam_tracker[user_id] 
+                        if current_time - timestamp < settings.spam_window
+                    ]
+
+                    # Add current attempt
+                    self.spam_tracker[user_id].append(current_time)
+
+                    # Check if user exceeded spam threshold
+                    if len(self.spam_tracker[user_id]) >= settings.spam_threshold:
+                        try:
+                            guild = message.guild
+                            muted = await self.bot.action_coordinator.run(
+                                guild, message.author, 'mute',
+                                lambda target: role_actions.auto_mute_member(target, settings)
+                            )
+
+                            if muted:
+                                self.bot.sanctions.apply_action(guild, message.author.id, 'mute')
+
+                                # Send warning message
+                                locale = settings.locale or self.default_locale
+                                await message.channel.send(embed=embed(locale, 'auto_muted', member=message.author.mention))
+
+                                # Clear spam tracker for this user
+                                self.spam_tracker[user_id] = []
+
+                                return
+
+                        except Exception as e:
+                            logger.error(f"Error auto-muting user {message.author}: {e}")
+
+    async def cog_command_error(self, ctx, error):
+        """Handle command errors."""
+        locale = self.locale(ctx.guild.id if ctx.guild else None)
+        if isinstance(error, commands.MissingPermissions):
+            # Only send error message for admins or if not already handled by spam detection
+            if ctx.author.guild_permissions.administrator:
+                await ctx.send(message(locale, 'no_permission'))
+            # For non-admins, the spam detection in on_message handles it
+
+        else:
+            # Log other errors
+            logger.error(f"Command error: {error}")
+            await ctx.send(message(locale, 'error'))
+
+    async def _resolve_target(self, ctx, member, command_name):
+        """Return the mentioned member, or the author of the replied-to message."""
+        if member is not None:
+            return member
+
+        # If no member mentioned, check if replying to a message
+        if ctx.message.reference and ctx.message.reference.message_id:
+            try:
+                referenced_message = await ctx.channel.fetch_message(ctx.message.reference.message_id)
+                return referenced_message.author
+            except discord.HTTPException:
+                pass
+
+        await ctx.send(message(self.locale(ctx.guild.id), 'target_required', command=f"{ctx.prefix}{command_name}"))
+        return None
+
+    async def _run_action(self, ctx, member, name, action, error_log):
+        """
+        Run a role action through the action coordinator and reply with its
+        embed or its error message.
+
+        Args:
+            ctx: Command context
+            member: Member the action targets
+            name: Action name, identical concurrent requests share one run
+            action: Callable taking the target member and returning the action coroutine
+            error_log: Prefix for unexpected errors in the log
+
+        Returns:
+            True if the action succeeded
+        """
+        locale = self.locale(ctx.guild.id)
+        try:
+            reply = await self.bot.action_coordinator.run(ctx.guild, member, name, action)
+            self.bot.sanctions.apply_action(ctx.guild, member.id, name)
+            await ctx.send(embed=reply)
+            return True
+        except ActionError as e:
+            await ctx.send(str(e))
+        except discord.Forbidden:
+            await ctx.send(message(locale, 'forbidden_roles'))
+        except Exception as e:
+            logger.error(f"{error_log}: {e}")
+            await ctx.send(message(locale, 'error'))
+        return False
+
+    @commands.command(name='status')
+    @commands.has_permissions(administrator=True)
+    async def status(self, ctx, member: IndexedMember):
+        """Check verification status of a user."""
+        try:
+            settings = self.bot.guild_settings.get(ctx.guild.id)
+            await ctx.send(embed=role_actions.status_embed(ctx.guild, member, settings, self.locale(ctx.guild.id)))
+
+        except Exception as e:
+            logger.error(f"Error checking status: {e}")
+            await ctx.send(message(self.locale(ctx.guild.id), 'error'))
+
+    @commands.command(name='men')
+    @commands.has_permissions(administrator=True)
+    async def verify_men(self, ctx, member: IndexedMember = None):
+        """Verify a user as male by removing entry role and adding men role."""
+        member = await self._resolve_target(ctx, member, 'men')
+        if member is None:
+            return
+        settings = self.bot.guild_settings.get(ctx.guild.id)
+        await self._run_action(
+            ctx, member, 'men',
+            lambda target: role_actions.verify_gender(ctx.guild, target, ctx.author, settings, 'men', self.locale(ctx.guild.id)),
+            "Error verifying user as male"
+        )
+
+    @commands.command(name='wom')
+    @commands.has_permissions(administrator=True)
+    async def verify_women(self, ctx, member: IndexedMember = None):
+        """Verify a user as female by removing entry role and adding women role."""
+        member = await self._resolve_target(ctx, member, 'wom')
+        if member is None:
+            return
+        settings = self.bot.guild_settings.get(ctx.guild.id)
+        await self._run_action(
+            ctx, member, 'wom',
+            lambda target: role_actions.verify_gender(ctx.guild, target, ctx.author, settings, 'wom', self.locale(ctx.guild.id)),
+            "Error verifying user as female"
+        )
+
+    @commands.command(name='hebs')
+    @commands.has_permissions(administrator=True)
+    async def jail_user(self, ctx, member: IndexedMember = None, *, reason: str = None):
+        """Put a user in jail by removing their roles and adding jail role."""
+        member = await self._resolve_target(ctx, member, 'hebs')
+        if member is None:
+            return
+        settings = self.bot.guild_settings.get(ctx.guild.id)
+        await self._run_action(
+            ctx, member, 'hebs',
+            lambda target: role_actions.jail_member(ctx.guild, target, ctx.author, settings, reason, self.locale(ctx.guild.id)),
+            "Error jailing user"
+        )
+
+    @commands.command(name='unhebs')
+    @commands.has_permissions(administrator=True)
+    async def unjail_user(self, ctx, member: IndexedMember = None):
+        """Remove a user from jail and restore their original roles."""
+        member = await self._resolve_target(ctx, member, 'unhebs')
+        if member is None:
+            return
+        settings = self.bot.guild_settings.get(ctx.guild.id)
+        await self._run_action(
+            ctx, member, 'unhebs',
+            lambda target: role_actions.unjail_member(ctx.guild, target, ctx.author, settings, self.locale(ctx.guild.id)),
+            "Error unjailing user"
+        )
+
+    def _clear_check(self, guild_id, keep_id=None):
+        """
+        Return the filter of the messages +yisclear deletes: the configured
+        user's and the bot's, except the message ``keep_id`` (the status message).
+        """
+        clear_user_id = self.bot.guild_settings.get(guild_id).clear_user_id
+        bot_id = self.bot.user.id
+
+        def check_message(message):
+            return message.id != keep_id and (message.author.id == clear_user_id or message.author.id == bot_id)
+
+        return check_message
+
+    @commands.command(name='yisclear')
+    @commands.has_permissions(administrator=True)
+    async def clear_messages(self, ctx, limit: Optional[int] = None, mode: str = None, hours: float = 24):
+        """
+        Clear messages from specific user and bot across all channels.
+
+        ``+yisclear archive [hours]`` archives the matching messages of the
+        last hours to a compressed file before deleting them; it takes a
+        time window instead of a message count.
+        """
+        if mode is not None:
+            if mode.lower() != 'archive' or limit is not None or hours <= 0:
+                await ctx.send(message(self.locale(ctx.guild.id), 'clear_usage', prefix=ctx.prefix))
+                return
+            await self._archive_messages(ctx, hours)
+            return
+        if limit is None:
+            limit = CLEAR_LIMIT
+
+        locale = self.locale(ctx.guild.id)
+        try:
+            total_deleted = 0
+            channels_processed = 0
+
+            # Only channels where the bot can delete messages
+            channels = [
+                channel for channel in ctx.guild.text_channels
+                if channel.permissions_for(ctx.guild.me).manage_messages
+            ]
+            progress = ProgressReporter(ctx, locale, message(locale, 'progress_clear'), total=len(channels),
+                                        remaining_key='channels_remaining')
+            await progress.start()
+            check_message = self._clear_check(ctx.guild.id, keep_id=progress.message.id)
+
+            # Process all text channels in the guild
+            for channel in channels:
+                try:
+                    # Delete messages matching the criteria
+                    deleted = await channel.purge(limit=limit, check=check_message)
+                    total_deleted += len(deleted)
+                    progress.advance(done=1, deleted=len(deleted))
+
+                    if len(deleted) > 0:
+                        channels_processed += 1
+                        logger.info(f"Deleted {len(deleted)} messages in channel #{channel.name}")
+
+                except discord.Forbidden:
+                    logger.warning(f"No permission to delete messages in #{channel.name}")
+                    progress.advance(done=1, failed=1)
+                    continue
+                except Exception as e:
+                    logger.error(f"Error in channel #{channel.name}: {e}")
+                    progress.advance(done=1, failed=1)
+                    continue
+
+            # Replace the status message with the confirmation
+            if total_deleted > 0:
+                confirmation = await progress.finish(message(locale, 'cleared', count=total_deleted, channels=channels_processed))
+            else:
+                confirmation = await progress.finish(message(locale, 'nothing_cleared'))
+
+            # Delete the confirmation message after 5 seconds
+            await confirmation.delete(delay=5)
+
+            logger.info(f"User {ctx.author} cleared {total_deleted} messages across {channels_processed} channels")
+
+        except Exception as e:
+            logger.error(f"Error clearing messages: {e}")
+            await ctx.send(message(locale, 'clear_error'))
+
+    async def _archive_messages(self, ctx, hours):
+        """Archive, then delete, the messages +yisclear matches in the last hours of every channel."""
+        locale = self.locale(ctx.guild.id)
+        after, before = snowflake_window(hours)
+        channels_processed = 0
+        # Counted per batch, so batches deleted before a channel fails are kept
+        totals = Counter(deleted=0, failed=0)
+
+        try:
+            channels = [
+                channel for channel in ctx.guild.text_channels
+                if channel.permissions_for(ctx.guild.me).manage_messages
+                and channel.permissions_for(ctx.guild.me).read_message_history
+            ]
+            progress = ProgressReporter(ctx, locale, message(locale, 'progress_archive'), total=len(channels),
+                                        remaining_key='channels_remaining')
+            await progress.start()
+            check_message = self._clear_check(ctx.guild.id, keep_id=progress.message.id)
+
+            def on_batch(**counts):
+                totals.update(counts)
+                progress.advance(**counts)
+
+            with MessageArchive.for_guild(ctx.guild.id) as archive:
+                for channel in channels:
+                    deleted_before, failed_before = totals['deleted'], totals['failed']
+                    try:
+                        await archive_and_purge(channel, check_message, archive, after, before, on_batch=on_batch)
+                    except discord.Forbidden:
+                        logger.warning(f"No permission to read history in #{channel.name}")
+                    except discord.HTTPException as e:
+                        logger.error(f"Error in channel #{channel.name}: {e}")
+                    progress.advance(done=1)
+
+                    deleted = totals['deleted'] - deleted_before
+                    failed = totals['failed'] - failed_before
+                    if deleted or failed:
+                        channels_processed += 1
+                        logger.info(f"Archived and deleted {deleted} messages in channel #{channel.name} ({failed} failed)")
+
+            if not archive.count:
+                os.remove(archive.path)
+                await progress.finish(message(locale, 'nothing_cleared'))
+                return
+
+            summary = message(locale, 'archived', archived=archive.count, deleted=totals['deleted'],
+                              channels=channels_processed, failed=totals['failed'])
+            if os.path.getsize(archive.path) <= ctx.guild.filesize_limit:
+                await progress.finish(summary, attachments=[discord.File(archive.path)])
+            else:
+                await progress.finish(f"{summary}\n{message(locale, 'archive_saved', path=archive.path)}")
+
+            logger.info(f"User {ctx.author} archived {archive.count} and deleted {totals['deleted']} messages "
+                        f"of the last {hours}h across {channels_processed} channels to {archive.path}")
+
+        except Exception as e:
+            logger.error(f"Error archiving messages: {e}")
+            await ctx.send(message(locale, 'clear_error'))
+
+    @commands.command(name='unmute')
+    @commands.has_permissions(administrator=True)
+    async def unmute_user(self, ctx, member: IndexedMember = None):
+        """Unmute a user by removing the mute role."""
+        member = await self._resolve_target(ctx, member, 'unmute')
+        if member is None:
+            return
+        settings = self.bot.guild_settings.get(ctx.guild.id)
+        unmuted = await self._run_action(
+            ctx, member, 'unmute',
+            lambda target: role_actions.unmute_member(ctx.guild, target, ctx.author, settings, self.locale(ctx.guild.id)),
+            "Error unmuting user"
+        )
+
+        # Clear spam tracker for this user
+        if unmuted:
+            self.clear_spam(ctx.guild.id, member.id)
+
+    async def _list_sanctioned(self, ctx, kind):
+        """Reply with the members of the guild that have a sanction."""
+        locale = self.locale(ctx.guild.id)
+        if not await self.bot.sanctions.ensure_complete(ctx.guild):
+            await ctx.send(message(locale, 'sanctions_partial'))
+        member_ids = self.bot.sanctions.members(ctx.guild, kind)
+        if not member_ids:
+            await ctx.send(message(locale, f'nobody_{kind}'))
+            return
+
+        lines = [f"<@{member_id}>" for member_id in islice(member_ids, SANCTION_LIST_LIMIT)]
+        if len(member_ids) > SANCTION_LIST_LIMIT:
+            lines.append(message(locale, 'and_more', count=len(member_ids) - SANCTION_LIST_LIMIT))
+        await ctx.send(embed=embed(locale, f'{kind}_list', count=len(member_ids), members="\n".join(lines)))
+
+    @commands.command(name='jailed')
+    @commands.has_permissions(administrator=True)
+    async def list_jailed(self, ctx):
+        """List the members currently in jail."""
+        await self._list_sanctioned(ctx, 'jailed')
+
+    @commands.command(name='muted')
+    @commands.has_permissions(administrator=True)
+    async def list_muted(self, ctx):
+        """List the members currently muted."""
+        await self._list_sanctioned(ctx, 'muted')
+
+    @commands.command(name='releaseall')
+    @commands.has_permissions(administrator=True)
+    async def release_all(self, ctx, kind: str = None):
+        """Release every jailed or muted member, restoring saved roles, and post one summary."""
+        locale = self.locale(ctx.guild.id)
+        if kind not in RELEASE_ACTIONS:
+            await ctx.send(message(locale, 'release_usage', prefix=ctx.prefix))
+            return
+
+        name, action = RELEASE_ACTIONS[kind]
+        guild = ctx.guild
+        settings = self.bot.guild_settings.get(guild.id)
+        if not await self.bot.sanctions.ensure_complete(guild):
+            await ctx.send(message(locale, 'sanctions_partial'))
+        member_ids = list(self.bot.sanctions.members(guild, kind))
+        if not member_ids:
+            await ctx.send(message(locale, f'nobody_{kind}'))
+            return
+
+        pending = iter(member_ids)  # shared by the workers; next() never interleaves
+        counts = Counter(released=0, skipped=0, missing=0, failed=0)
+        progress = ProgressReporter(ctx, locale, message(locale, 'progress_release'), total=len(member_ids),
+                                    remaining_key='members_remaining')
+        await progress.start()
+
+        def record(outcome):
+            counts[outcome] += 1
+            progress.advance(done=1, **{outcome: 1})
+
+        async def worker():
+            for member_id in pending:
+                member = guild.get_member(member_id)
+                if member is None:
+                    self.bot.sanctions.mark(guild, member_id, kind, False)
+                    record('missing')
+                    continue
+                try:
+                    await self.bot.action_coordinator.run(
+                        guild, member, name, lambda target: action(guild, target, ctx.author, settings, locale)
+                    )
+                except ActionError:
+                    # Already released, or the role is gone
+                    self.bot.sanctions.for_guild(guild).update(member)
+                    record('skipped')
+                    continue
+                except Exception as e:
+                    logger.error(f"Error releasing {member} from {kind}: {e}")
+                    record('failed')
+                    continue
+                self.bot.sanctions.apply_action(guild, member_id, name)
+                if kind == 'muted':
+                    self.clear_spam(guild.id, member_id)
+                record('released')
+
+        await asyncio.gather(*(worker() for _ in range(min(RELEASE_WORKERS, len(member_ids)))))
+        await progress.finish(message(locale, 'released', **counts))
+        logger.info(f"User {ctx.author} released {kind} members in guild {guild.id}: {dict(counts)}")
+
+    @commands.command(name='zekir')
+    @commands.has_permissions(administrator=True)
+    async def zekir_cmd(self, ctx):
+        """Zekir command."""
+        await ctx.send("mdr salut c'est zekir je suis puceau")
+
+    @commands.command(name='omar')
+    async def omar_cmd(self, ctx):
+        """Omar command with video."""
+        try:
+            # Send the video file without text
+            video_file = discord.File("zekir_video.mov", filename="omar_video.mov")
+            await ctx.send(file=video_file)
+
+            logger.info(f"User {ctx.author} used omar command with video")
+
+        except FileNotFoundError:
+            await ctx.send(message(self.locale(ctx.guild.id if ctx.guild else None), 'video_missing'))
+            logger.error("zekir_video.mov file not found")
+        except Exception as e:
+            await ctx.send(message(self.locale(ctx.guild.id if ctx.guild else None), 'video_error'))
+            logger.error(f"Error sending video: {e}")
+
+    @commands.command(name='reload')
+    @commands.has_permissions(administrator=True)
+    async def reload_settings(self, ctx):
+        """Reload guild settings from disk without reconnecting."""
+        locale = self.locale(ctx.guild.id)
+        if self.bot.guild_settings.load():
+            await ctx.send(message(locale, 'settings_reloaded'))
+        else:
+            await ctx.send(message(locale, 'settings_invalid'))
+
+    @commands.command(name='config')
+    @commands.has_permissions(administrator=True)
+    async def config_cmd(self, ctx, key: str = None, value: str = None):
+        """Show the guild settings, or change one of them with +config <clé> <valeur>."""
+        locale = self.locale(ctx.guild.id)
+        try:
+            if key is None:
+                settings = self.bot.guild_settings.get(ctx.guild.id)
+                lines = [f"`{name}`: {val}" for name, val in asdict(settings).items()]
+                await ctx.send(embed=embed(locale, 'config', settings="\n".join(lines)))
+                return
+
+            if key not in asdict(self.bot.guild_settings.defaults) or value is None:
+                await ctx.send(message(locale, 'config_usage', prefix=ctx.prefix))
+                return
+
+            self.bot.guild_settings.update(ctx.guild.id, **{key: None if value.lower() == 'none' else value})
+            await ctx.send(message(self.locale(ctx.guild.id), 'config_updated', key=key, value=value))
+            logger.info(f"Guild setting {key} set to {value} in guild {ctx.guild.id} by {ctx.author}")
+
+        except ValueError:
+            await ctx.send(message(locale, 'invalid_value'))
+        except Exception as e:
+            logger.error(f"Error updating guild settings: {e}")
+            await ctx.send(message(locale, 'error'))
+
+    @commands.command(name='help')
+    async def help_cmd(self, ctx):
+        """Show available commands."""
+        guild_id = ctx.guild.id if ctx.guild else None
+        await ctx.send(embed=embed(self.locale(guild_id), 'help', prefix=self.command_prefix(guild_id)))
+
+
+async def setup(bot):
+    """Load the moderation command set."""
+    await bot.add_cog(ModerationCog(bot))
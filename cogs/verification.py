@@ -0,0 +1,125 @@
+"""
+Verification commands (! prefix)
+Handles user verification by managing roles through commands.
+"""
+
+import logging
+
+import discord
+from discord.ext import commands
+
+import role_actions
+from cogs.base import PrefixedCog
+from member_index import IndexedMember
+from responses import embed, message
+from role_actions import ActionError
+
+logger = logging.getLogger(__name__)
+
+
+class VerificationCog(PrefixedCog, name='Verification'):
+    """English verification command set using the configured prefix (default !)."""
+
+    async def cog_command_error(self, ctx, error):
+        """Handle command errors."""
+        locale = self.locale(ctx.guild.id if ctx.guild else None)
+        if isinstance(error, commands.MissingPermissions):
+            await ctx.send(message(locale, 'no_permission'))
+        elif isinstance(error, commands.MemberNotFound):
+            await ctx.send(message(locale, 'member_not_found'))
+        elif isinstance(error, commands.RoleNotFound):
+            await ctx.send(message(locale, 'role_not_found'))
+        else:
+            logger.error(f'Command error: {error}')
+            await ctx.send(message(locale, 'error'))
+
+    @commands.command(name='verify')
+    @commands.has_permissions(manage_roles=True)
+    async def verify_user(self, ctx, member: IndexedMember):
+        """
+        Verify a user by removing entry role and adding verified role.
+        
+        Args:
+            ctx: Command context
+            member: Discord member to verify
+        """
+        locale = self.locale(ctx.guild.id)
+        settings = self.bot.guild_settings.get(ctx.guild.id)
+        try:
+            reply = await self.bot.action_coordinator.run(
+                ctx.guild, member, 'verify',
+                lambda target: role_actions.verify_member(ctx.guild, target, ctx.author, settings, locale)
+            )
+            await ctx.send(embed=reply)
+
+        except ActionError as e:
+            await ctx.send(str(e))
+        except discord.Forbidden:
+            await ctx.send(message(locale, 'forbidden_roles'))
+        except Exception as e:
+            logger.error(f"Error verifying user {member}: {e}")
+            await ctx.send(message(locale, 'verify_error'))
+
+    @commands.command(name='unverify')
+    @commands.has_permissions(manage_roles=True)
+    async def unverify_user(self, ctx, member: IndexedMember):
+        """
+        Unverify a user by removing verified role and adding entry role back.
+        
+        Args:
+            ctx: Command context
+            member: Discord member to unverify
+        """
+        locale = self.locale(ctx.guild.id)
+        settings = self.bot.guild_settings.get(ctx.guild.id)
+        try:
+            reply = await self.bot.action_coordinator.run(
+                ctx.guild, member, 'unverify',
+                lambda target: role_actions.unverify_member(ctx.guild, target, ctx.author, settings, locale)
+            )
+            await ctx.send(embed=reply)
+
+        except ActionError as e:
+            await ctx.send(str(e))
+        except discord.Forbidden:
+            await ctx.send(message(locale, 'forbidden_roles'))
+        except Exception as e:
+            logger.error(f"Error unverifying user {member}: {e}")
+            await ctx.send(message(locale, 'unverify_error'))
+
+    @commands.command(name='verifystatus', extras={'prefixed_name': 'status'})
+    @commands.has_permissions(manage_roles=True)
+    async def check_status(self, ctx, member: IndexedMember):
+        """
+        Check the verification status of a user.
+        
+        Args:
+            ctx: Command context
+            member: Discord member to check
+        """
+        locale = self.locale(ctx.guild.id)
+        try:
+            settings = self.bot.guild_settings.get(ctx.guild.id)
+            state, has_entry, has_verified = role_actions.verification_status(
+                member, settings.entry_role_id, settings.verified_role_id
+            )
+            await ctx.send(embed=embed(
+                locale, f'detailed_status_{state}', member=member.mention, avatar=member.display_avatar.url,
+                has_entry=message(locale, 'yes' if has_entry else 'no'),
+                has_verified=message(locale, 'yes' if has_verified else 'no'),
+            ))
+            
+        except Exception as e:
+            logger.error(f"Error checking status for {member}: {e}")
+            await ctx.send(message(locale, 'status_error'))
+
+    @commands.command(name='bothelp')
+    async def show_help(self, ctx):
+        """Display help information."""
+        guild_id = ctx.guild.id if ctx.guild else None
+        await ctx.send(embed=embed(self.locale(guild_id), 'bothelp', prefix=self.command_prefix(guild_id)))
+
+
+async def setup(bot):
+    """Load the verification command set."""
+    await bot.add_cog(VerificationCog(bot))
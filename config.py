@@ -6,6 +6,7 @@ Handles environment variables and bot settings.
 import os
 from dotenv import load_dotenv
 import logging
+from gateway_stats import INTENT_PROFILES
 
 logger = logging.getLogger(__name__)
 
@@ -22,37 +23,42 @@ class Config:
         if not self.DISCORD_TOKEN:
             raise ValueError("DISCORD_TOKEN environment variable is required")
         
-        # Role IDs (required)
-        entry_role_id = os.getenv('ENTRY_ROLE_ID')
-        verified_role_id = os.getenv('VERIFIED_ROLE_ID')
+        # Optional settings
+        self.LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
+        self.COMMAND_PREFIX = os.getenv('COMMAND_PREFIX', '!')
         
-        if not entry_role_id:
-            raise ValueError("ENTRY_ROLE_ID environment variable is required")
-        if not verified_role_id:
-            raise ValueError("VERIFIED_ROLE_ID environment variable is required")
+        # Gateway intent profile: full, moderation or minimal
+        self.INTENT_PROFILE = os.getenv('INTENT_PROFILE', 'full').lower()
+        if self.INTENT_PROFILE not in INTENT_PROFILES:
+            raise ValueError(f"INTENT_PROFILE must be one of {list(INTENT_PROFILES)}")
         
+        # Message content intent (privileged). Disable to run with slash commands only.
+        self.MESSAGE_CONTENT_INTENT = os.getenv('MESSAGE_CONTENT_INTENT', 'true').lower() not in ('0', 'false', 'no')
+        
+        # Event loop blocks longer than this are logged with their stack (0 disables)
         try:
-            self.ENTRY_ROLE_ID = int(entry_role_id)
-            self.VERIFIED_ROLE_ID = int(verified_role_id)
+            self.SLOW_CALLBACK_MS = int(os.getenv('SLOW_CALLBACK_MS', '200'))
         except ValueError:
-            raise ValueError("Role IDs must be valid integers")
+            raise ValueError("SLOW_CALLBACK_MS must be a valid integer")
         
-        # Optional settings
-        self.LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO').upper()
-        self.COMMAND_PREFIX = os.getenv('COMMAND_PREFIX', '!')
+        # Record raw gateway payloads to this file for benchmarks/gateway_replay.py (optional)
+        self.GATEWAY_RECORD_FILE = os.getenv('GATEWAY_RECORD_FILE')
+        
+        # Warm-restart snapshot of in-memory state
+        self.SNAPSHOT_FILE = os.getenv('SNAPSHOT_FILE', 'state.snapshot')
+        try:
+            self.SNAPSHOT_INTERVAL = int(os.getenv('SNAPSHOT_INTERVAL', '300'))
+            self.SNAPSHOT_MAX_AGE = int(os.getenv('SNAPSHOT_MAX_AGE', '86400'))
+        except ValueError:
+            raise ValueError("SNAPSHOT_INTERVAL and SNAPSHOT_MAX_AGE must be valid integers")
+        if self.SNAPSHOT_INTERVAL < 1:
+            raise ValueError("SNAPSHOT_INTERVAL must be at least 1 second")
         
         # Guild ID (optional - for faster command sync)
         guild_id = os.getenv('GUILD_ID')
         self.GUILD_ID = int(guild_id) if guild_id else None
         
         logger.info("Configuration loaded successfully")
-        logger.info(f"Entry Role ID: {self.ENTRY_ROLE_ID}")
-        logger.info(f"Verified Role ID: {self.VERIFIED_ROLE_ID}")
         logger.info(f"Command Prefix: {self.COMMAND_PREFIX}")
-        
-    def validate(self):
-        """Validate configuration settings."""
-        if self.ENTRY_ROLE_ID == self.VERIFIED_ROLE_ID:
-            raise ValueError("Entry role and verified role cannot be the same")
-        
-        return True
+        logger.info(f"Intent Profile: {self.INTENT_PROFILE}")
+        logger.info(f"Message Content Intent: {self.MESSAGE_CONTENT_INTENT}")
@@ -0,0 +1,177 @@
+"""
+Gateway intent profiles and per-event-type counters
+Profiles pick the smallest set of intents the registered handlers need, and the
+counters show how many events of each type were received and how long
+discord.py spent decoding them into objects.
+"""
+
+import logging
+import time
+from collections import defaultdict
+from typing import Dict, Iterable, List, Tuple
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+# Intents every profile needs: guild state, and the member cache role
+# commands read
+BASE_INTENTS = ('guilds', 'members')
+
+# Intents requested by each profile, on top of Intents.none()
+INTENT_PROFILES = {
+    # Everything discord.py enables by default, plus the privileged intents
+    'full': None,
+    # What the registered handlers need, added once they are known (see
+    # HANDLER_PROFILES): text and slash commands, anti-spam, member tracking
+    'moderation': BASE_INTENTS,
+    # Slash commands and member tracking only
+    'minimal': BASE_INTENTS,
+}
+
+# Profiles completed with required_intents() of the registered handlers
+HANDLER_PROFILES = ('moderation',)
+
+# Intent needed to receive the events behind each listener name
+LISTENER_INTENTS = {
+    # Text commands are read from on_message, in guilds and in DMs
+    'on_message': ('guild_messages', 'dm_messages', 'message_content'),
+    'on_message_edit': ('guild_messages',),
+    'on_message_delete': ('guild_messages',),
+    'on_member_join': ('members',),
+    'on_member_remove': ('members',),
+    'on_member_update': ('members',),
+    'on_raw_member_remove': ('members',),
+    'on_reaction_add': ('guild_reactions',),
+    'on_raw_reaction_add': ('guild_reactions',),
+    'on_typing': ('guild_typing',),
+    'on_presence_update': ('presences',),
+    'on_voice_state_update': ('voice_states',),
+}
+
+
+def build_intents(profile: str) -> discord.Intents:
+    """Build the intents for a profile name (full, moderation or minimal)."""
+    if profile not in INTENT_PROFILES:
+        raise ValueError(f"Unknown intent profile '{profile}', expected one of {list(INTENT_PROFILES)}")
+
+    flags = INTENT_PROFILES[profile]
+    if flags is None:
+        intents = discord.Intents.default()
+        intents.message_content = True
+        intents.members = True
+        return intents
+
+    intents = discord.Intents.none()
+    for flag in flags:
+        setattr(intents, flag, True)
+    return intents
+
+
+def required_intents(listener_names: Iterable[str]) -> discord.Intents:
+    """Return the intents needed by the given listener names, on top of BASE_INTENTS."""
+    intents = discord.Intents.none()
+    for flag in BASE_INTENTS:
+        setattr(intents, flag, True)
+    for name in listener_names:
+        for flag in LISTENER_INTENTS.get(name, ()):
+            setattr(intents, flag, True)
+    return intents
+
+
+def unused_intents(intents: discord.Intents, listener_names: Iterable[str]) -> List[str]:
+    """List the enabled intents whose events no registered listener handles."""
+    needed = required_intents(listener_names)
+    return sorted(name for name, enabled in intents if enabled and not getattr(needed, name))
+
+
+def missing_intents(intents: discord.Intents, listener_names: Iterable[str]) -> Dict[str, List[str]]:
+    """Map each intent a registered listener needs but ``intents`` lacks to those listeners."""
+    missing = defaultdict(list)
+    for name in sorted(set(listener_names)):
+        for flag in LISTENER_INTENTS.get(name, ()):
+            if not getattr(intents, flag):
+                missing[flag].append(name)
+    return dict(missing)
+
+
+class GatewayStats:
+    """Per-event-type counters for gateway dispatch events."""
+
+    def __init__(self):
+        """Initialize empty counters."""
+        self.received: Dict[str, int] = defaultdict(int)
+        self.decode_seconds: Dict[str, float] = defaultdict(float)
+        self.started_at = time.monotonic()
+
+    @property
+    def total(self) -> int:
+        """Number of gateway dispatch events received."""
+        return sum(self.received.values())
+
+    @property
+    def total_decode_seconds(self) -> float:
+        """Time spent decoding gateway events into objects."""
+        return sum(self.decode_seconds.values())
+
+    def record(self, event_type: str):
+        """Count one received gateway event."""
+        self.received[event_type] += 1
+
+    def instrument(self, connection):
+        """
+        Time discord.py's parser for every event type.
+
+        The gateway looks parsers up in ``connection.parsers`` on every
+        event, so wrapping the entries in place covers reconnects too.
+        """
+        parsers = connection.parsers
+        for event_type, parser in list(parsers.items()):
+            parsers[event_type] = self._timed(event_type, parser)
+
+    def _timed(self, event_type, parser):
+        decode_seconds = self.decode_seconds
+        perf_counter = time.perf_counter
+
+        def timed_parser(data):
+            start = perf_counter()
+            try:
+                return parser(data)
+            finally:
+                decode_seconds[event_type] += perf_counter() - start
+
+        return timed_parser
+
+    def top(self, limit: int = 10) -> List[Tuple[str, int, float]]:
+        """Return (event type, count, decode seconds) for the most frequent event types."""
+        ranked = sorted(self.received.items(), key=lambda item: item[1], reverse=True)
+        return [(event_type, count, self.decode_seconds.get(event_type, 0.0)) for event_type, count in ranked[:limit]]
+
+
+class GatewayRecorder:
+    """Appends raw gateway payloads to a JSON Lines file, for replay benchmarks."""
+
+    def __init__(self, path: str, limit: int = 10000):
+        """
+        Initialize the recorder.
+
+        Args:
+            path: File the payloads are appended to, one per line
+            limit: Number of payloads to record before stopping
+        """
+        self.path = path
+        self.remaining = limit
+        self._file = open(path, 'a', encoding='utf-8')
+
+    def attach(self, bot):
+        """Register the raw socket listener (requires enable_debug_events)."""
+        bot.add_listener(self.on_socket_raw_receive)
+
+    async def on_socket_raw_receive(self, msg):
+        if self.remaining <= 0:
+            return
+        self._file.write(msg.replace('\n', ' ') + '\n')
+        self.remaining -= 1
+        if self.remaining == 0:
+            self._file.close()
+            logger.info(f"Gateway recording complete: {self.path}")
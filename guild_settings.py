@@ -0,0 +1,219 @@
+"""
+Per-guild settings store for the Discord Verification Bot
+Keeps role IDs, command prefix and anti-spam thresholds for every guild in memory
+and hot-reloads them from a local JSON file without reconnecting to the gateway.
+"""
+
+import json
+import logging
+import os
+from dataclasses import asdict, dataclass, fields, replace
+from typing import Dict, Optional
+
+from responses import LOCALES
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_SETTINGS_FILE = 'guild_settings.json'
+
+# Settings stored as strings; every other setting is an integer
+_STRING_SETTINGS = ('prefix', 'locale')
+
+# Settings that may be None (not configured); the others always need a value
+_OPTIONAL_SETTINGS = (
+    'locale', 'entry_role_id', 'verified_role_id', 'men_role_id', 'women_role_id',
+    'jail_role_id', 'mute_role_id', 'clear_user_id',
+)
+
+# Integer settings that must be at least 1
+_POSITIVE_SETTINGS = ('spam_threshold', 'spam_window')
+
+
+def _env_int(name: str) -> Optional[int]:
+    """Read an integer from the environment, returning None if missing or invalid."""
+    value = os.getenv(name)
+    if not value:
+        return None
+    try:
+        return int(value)
+    except ValueError:
+        logger.warning(f"Ignoring {name}: '{value}' is not a valid integer")
+        return None
+
+
+def _env_locale() -> Optional[str]:
+    """Read the default reply locale from the environment, returning None if missing or unknown."""
+    value = os.getenv('BOT_LOCALE')
+    if value and value not in LOCALES:
+        logger.warning(f"Ignoring BOT_LOCALE: '{value}' is not one of {list(LOCALES)}")
+        return None
+    return value or None
+
+
+@dataclass(frozen=True)
+class GuildSettings:
+    """
+    Settings for a single guild. Role IDs are None when not configured, and a
+    None locale lets every command set answer in its own language.
+    """
+
+    prefix: str = '+'
+    locale: Optional[str] = None
+    entry_role_id: Optional[int] = None
+    verified_role_id: Optional[int] = None
+    men_role_id: Optional[int] = None
+    women_role_id: Optional[int] = None
+    jail_role_id: Optional[int] = None
+    mute_role_id: Optional[int] = None
+    clear_user_id: Optional[int] = None
+    spam_threshold: int = 3
+    spam_window: int = 30
+
+    @classmethod
+    def from_env(cls) -> 'GuildSettings':
+        """Build the default settings from the legacy environment variables."""
+        return cls(
+            prefix=os.getenv('SIMPLE_BOT_PREFIX') or '+',
+            locale=_env_locale(),
+            entry_role_id=_env_int('ENTRY_ROLE_ID'),
+            verified_role_id=_env_int('VERIFIED_ROLE_ID'),
+            men_role_id=_env_int('MEN_ROLE_ID'),
+            women_role_id=_env_int('WOMEN_ROLE_ID'),
+            jail_role_id=_env_int('JAIL_ROLE_ID'),
+            mute_role_id=_env_int('MUTE_ROLE_ID'),
+            clear_user_id=_env_int('USER_ID'),
+        )
+
+    def merged(self, overrides: dict) -> 'GuildSettings':
+        """Return a copy with the known keys of ``overrides`` applied."""
+        known = {f.name for f in fields(self)}
+        changes = {}
+        for key, value in overrides.items():
+            if key not in known:
+                logger.warning(f"Ignoring unknown guild setting '{key}'")
+                continue
+            changes[key] = _validated(key, value)
+        settings = replace(self, **changes)
+        if settings.entry_role_id is not None and settings.entry_role_id == settings.verified_role_id:
+            raise ValueError("Entry role and verified role cannot be the same")
+        return settings
+
+
+def _validated(key: str, value):
+    """
+    Return a setting value converted to its type.
+
+    Raises:
+        ValueError: If the value is missing, of the wrong type or out of range
+    """
+    if value is None:
+        if key not in _OPTIONAL_SETTINGS:
+            raise ValueError(f"Guild setting '{key}' cannot be empty")
+        return None
+    if key == 'prefix':
+        if not isinstance(value, str) or not value.strip():
+            raise ValueError("The command prefix must be a non-empty string")
+        return value
+    if key == 'locale':
+        if value not in LOCALES:
+            raise ValueError(f"Unknown locale '{value}', expected one of {list(LOCALES)}")
+        return value
+    if isinstance(value, bool):
+        raise ValueError(f"Guild setting '{key}' must be an integer")
+    value = int(value)
+    if key in _POSITIVE_SETTINGS and value < 1:
+        raise ValueError(f"Guild setting '{key}' must be at least 1")
+    return value
+
+
+class GuildSettingsStore:
+    """
+    In-memory map of guild ID to GuildSettings backed by a JSON file.
+
+    The file looks like ``{"defaults": {...}, "guilds": {"<guild_id>": {...}}}``;
+    every section only needs the keys it overrides. Lookups are a single dict
+    access, and a reload swaps the whole map at once so handlers never observe
+    a half-applied file.
+    """
+
+    def __init__(self, path: str = DEFAULT_SETTINGS_FILE, defaults: Optional[GuildSettings] = None):
+        """Initialize the store; call load() to read the file."""
+        self.path = path
+        self.base_defaults = defaults or GuildSettings.from_env()
+        self.defaults = self.base_defaults
+        self._guilds: Dict[int, GuildSettings] = {}
+        self._mtime: Optional[float] = None
+
+    def get(self, guild_id: Optional[int]) -> GuildSettings:
+        """Return the settings for a guild, falling back to the defaults."""
+        return self._guilds.get(guild_id, self.defaults)
+
+    def _file_mtime(self) -> Optional[float]:
+        try:
+            return os.stat(self.path).st_mtime
+        except FileNotFoundError:
+            return None
+
+    def load(self) -> bool:
+        """
+        (Re)load settings from disk.
+
+        Returns:
+            True if the in-memory settings were replaced, False if the file
+            was invalid and the previous settings were kept.
+        """
+        mtime = self._file_mtime()
+        if mtime is None:
+            self.defaults = self.base_defaults
+            self._guilds = {}
+            self._mtime = None
+            return True
+
+        try:
+            with open(self.path, 'r') as f:
+                data = json.load(f)
+            defaults = self.base_defaults.merged(data.get('defaults', {}))
+            guilds = {
+                int(guild_id): defaults.merged(overrides)
+                for guild_id, overrides in data.get('guilds', {}).items()
+            }
+        except (OSError, ValueError, TypeError, AttributeError) as e:
+            logger.error(f"Invalid guild settings file {self.path}, keeping previous settings: {e}")
+            self._mtime = mtime
+            return False
+
+        self.defaults = defaults
+        self._guilds = guilds
+        self._mtime = mtime
+        logger.info(f"Guild settings loaded for {len(guilds)} guild(s) from {self.path}")
+        return True
+
+    def reload_if_changed(self) -> bool:
+        """Reload the file if its modification time changed since the last load."""
+        if self._file_mtime() == self._mtime:
+            return False
+        return self.load()
+
+    def update(self, guild_id: int, **changes) -> GuildSettings:
+        """Change settings for one guild and persist them to disk."""
+        settings = self.get(guild_id).merged(changes)
+        self._guilds[guild_id] = settings
+        self.save()
+        return settings
+
+    def save(self):
+        """Write the current settings atomically, keeping only the per-guild overrides."""
+        base = asdict(self.base_defaults)
+        defaults = asdict(self.defaults)
+        data = {
+            'defaults': {k: v for k, v in defaults.items() if v != base[k]},
+            'guilds': {
+                str(guild_id): {k: v for k, v in asdict(settings).items() if v != defaults[k]}
+                for guild_id, settings in self._guilds.items()
+            },
+        }
+        tmp_path = f"{self.path}.tmp"
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.path)
+        self._mtime = self._file_mtime()
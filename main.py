@@ -1,10 +1,19 @@
 """
 Discord Verification Bot - Entry Point
-Main script to run the Discord bot for manual user verification.
+Main script to run the Discord bot with all command sets loaded.
 """
 
+from startup import StartupTimer
+
+# Started before the other imports so they are part of the measured startup
+startup = StartupTimer()
+
 import asyncio
 import logging
+import os
+import signal
+from dotenv import load_dotenv
+import runtime
 from bot import VerificationBot
 from config import Config
 
@@ -18,19 +27,41 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-async def main():
-    """Main function to initialize and run the bot."""
+def add_shutdown_handler(bot: VerificationBot):
+    """Close the bot cleanly when the process receives SIGTERM."""
+    loop = asyncio.get_running_loop()
+    try:
+        loop.add_signal_handler(signal.SIGTERM, lambda: asyncio.ensure_future(bot.close()))
+    except (NotImplementedError, RuntimeError):
+        # Signal handlers are not supported by this event loop (e.g. on Windows)
+        logger.warning("SIGTERM handler not installed, the bot will not save its state when terminated")
+
+
+async def main(keep_alive: bool = False):
+    """
+    Main function to initialize and run the bot.
+
+    Args:
+        keep_alive: Start the keep-alive web server once connected
+    """
+    startup.mark('imports')
     try:
         # Load configuration
         config = Config()
+        startup.mark('config')
 
         # Initialize bot
-        bot = VerificationBot(config)
+        bot = VerificationBot(config, startup)
+        bot.start_web_server = keep_alive
+        startup.mark('bot_init')
 
         logger.info("Starting Discord Verification Bot...")
 
-        # Run the bot
-        await bot.start(config.DISCORD_TOKEN)
+        # Run the bot; leaving the context closes it (saving the state
+        # snapshot) on Ctrl-C and on SIGTERM from a deploy restart as well
+        async with bot:
+            add_shutdown_handler(bot)
+            await bot.start(config.DISCORD_TOKEN)
 
     except Exception as e:
         logger.error(f"Failed to start bot: {e}")
@@ -38,8 +69,9 @@ async def main():
 
 
 if __name__ == "__main__":
+    load_dotenv()
     try:
-        asyncio.run(main())
+        runtime.run(main(), os.getenv('EVENT_LOOP', 'auto'))
     except KeyboardInterrupt:
         logger.info("Bot stopped by user")
     except Exception as e:
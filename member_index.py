@@ -0,0 +1,215 @@
+"""
+Per-guild member name index and member converter
+Resolves command arguments such as ``@mention``, IDs, usernames, display names
+and nicknames with dictionary lookups instead of scanning every member of the
+guild, and only falls back to discord.py's converter (which may query Discord)
+on a miss.
+"""
+
+import gc
+import logging
+import re
+from collections import defaultdict
+from typing import Dict, Iterable, Optional, Set
+
+import discord
+from discord.ext import commands
+
+logger = logging.getLogger(__name__)
+
+_ID_OR_MENTION = re.compile(r'<@!?([0-9]{15,20})>$|([0-9]{15,20})$')
+
+
+def member_keys(member) -> Set[str]:
+    """Return the casefolded names a member can be referred to by."""
+    names = {member.name, member.global_name, member.nick}
+    keys = {name.casefold() for name in names if name}
+    if member.discriminator and member.discriminator != '0':
+        keys.add(f"{member.name}#{member.discriminator}".casefold())
+    return keys
+
+
+class GuildMemberIndex:
+    """
+    Casefolded name/nickname to member IDs for one guild.
+
+    ID to member lookups use the guild's own member cache, which is already a
+    dict keyed by ID, so members are not stored twice.
+    """
+
+    def __init__(self):
+        """Initialize an empty index."""
+        self.ids_by_name: Dict[str, Set[int]] = defaultdict(set)
+        self.names_by_id: Dict[int, Set[str]] = {}
+
+    def __len__(self):
+        return len(self.names_by_id)
+
+    def add(self, member_id: int, keys: Iterable[str]):
+        """Index a member under the given names, replacing any previous names."""
+        self.remove(member_id)
+        keys = set(keys)
+        self.names_by_id[member_id] = keys
+        for key in keys:
+            self.ids_by_name[key].add(member_id)
+
+    def remove(self, member_id: int):
+        """Remove a member from the index."""
+        for key in self.names_by_id.pop(member_id, ()):
+            ids = self.ids_by_name.get(key)
+            if ids is not None:
+                ids.discard(member_id)
+                if not ids:
+                    del self.ids_by_name[key]
+
+    @classmethod
+    def from_names(cls, names_by_id: Dict[int, Set[str]]) -> 'GuildMemberIndex':
+        """Build an index from member ID to names, taking ownership of the mapping."""
+        index = cls()
+        index.names_by_id = names_by_id
+        ids_by_name = index.ids_by_name
+        # Every set created here survives; pause the cyclic collector as the
+        # snapshot decoder does rather than have it rescan them
+        gc_was_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            for member_id, keys in names_by_id.items():
+                for key in keys:
+                    ids_by_name[key].add(member_id)
+        finally:
+            if gc_was_enabled:
+                gc.enable()
+        return index
+
+    def lookup(self, name: str) -> Set[int]:
+        """Return the IDs of members known by this name."""
+        return self.ids_by_name.get(name.casefold(), set())
+
+
+class MemberIndex:
+    """Member name indexes for every guild, kept up to date from member events."""
+
+    def __init__(self):
+        """Initialize with no guilds indexed."""
+        self.guilds: Dict[int, GuildMemberIndex] = {}
+
+    def attach(self, bot):
+        """Register the listeners that keep the index up to date."""
+        for listener in (self.on_guild_available, self.on_guild_join, self.on_guild_chunked, self.on_guild_remove,
+                         self.on_member_join, self.on_member_remove, self.on_member_update,
+                         self.on_user_update):
+            bot.add_listener(listener)
+
+    def for_guild(self, guild_id: int) -> GuildMemberIndex:
+        """Return the index of a guild, creating it if needed."""
+        index = self.guilds.get(guild_id)
+        if index is None:
+            index = self.guilds[guild_id] = GuildMemberIndex()
+        return index
+
+    def build(self, guild):
+        """(Re)index every cached member of a guild."""
+        index = self.guilds[guild.id] = GuildMemberIndex()
+        for member in guild.members:
+            index.add(member.id, member_keys(member))
+        logger.info(f"Indexed {len(index)} members of guild {guild.id}")
+
+    def add(self, member):
+        """Index or re-index a single member."""
+        self.for_guild(member.guild.id).add(member.id, member_keys(member))
+
+    def restore(self, guild_id: int, restored: GuildMemberIndex):
+        """
+        Swap in an index built from a snapshot, keeping the names of the members
+        already indexed from the live cache.
+
+        Costs the number of live members, so the snapshot index can be built
+        off the event loop and applied here in one step.
+        """
+        live = self.guilds.get(guild_id)
+        if live is not None:
+            for member_id, keys in live.names_by_id.items():
+                restored.add(member_id, keys)
+        self.guilds[guild_id] = restored
+
+    def resolve_id(self, guild, argument: str) -> Optional[int]:
+        """
+        Resolve an argument to a member ID of the guild.
+
+        Returns:
+            The ID, or None if the argument is unknown or ambiguous
+        """
+        match = _ID_OR_MENTION.match(argument)
+        if match:
+            return int(match.group(1) or match.group(2))
+
+        index = self.guilds.get(guild.id)
+        if index is None:
+            return None
+        ids = index.lookup(argument.lstrip('@'))
+        if len(ids) != 1:
+            return None
+        return next(iter(ids))
+
+    async def on_guild_available(self, guild):
+        self.build(guild)
+
+    async def on_guild_join(self, guild):
+        self.build(guild)
+
+    async def on_guild_chunked(self, guild):
+        self.build(guild)
+
+    async def on_guild_remove(self, guild):
+        self.guilds.pop(guild.id, None)
+
+    async def on_member_join(self, member):
+        self.add(member)
+
+    async def on_member_remove(self, member):
+        index = self.guilds.get(member.guild.id)
+        if index is not None:
+            index.remove(member.id)
+
+    async def on_member_update(self, before, after):
+        if before.nick != after.nick:
+            self.add(after)
+
+    async def on_user_update(self, before, after):
+        if before.name == after.name and before.global_name == after.global_name:
+            return
+        for guild in after.mutual_guilds:
+            member = guild.get_member(after.id)
+            if member is not None:
+                self.add(member)
+
+
+class IndexedMember(commands.Converter):
+    """Member converter backed by the bot's MemberIndex, falling back to MemberConverter."""
+
+    async def convert(self, ctx, argument):
+        """Resolve the argument from the index, or with discord.py's converter on a miss."""
+        index: Optional[MemberIndex] = getattr(ctx.bot, 'member_index', None)
+        if ctx.guild is not None and index is not None:
+            member_id = index.resolve_id(ctx.guild, argument)
+            if member_id is not None:
+                member = ctx.guild.get_member(member_id)
+                if member is None:
+                    # Known ID but not cached yet (e.g. before chunking): one REST call
+                    try:
+                        member = await ctx.guild.fetch_member(member_id)
+                    except discord.NotFound:
+                        index.for_guild(ctx.guild.id).remove(member_id)
+                        raise commands.MemberNotFound(argument)
+                    except discord.HTTPException:
+                        pass
+                if member is not None:
+                    # The index may be restored from a snapshot taken before a rename
+                    if _ID_OR_MENTION.match(argument) or argument.lstrip('@').casefold() in member_keys(member):
+                        return member
+                    index.add(member)
+
+        member = await commands.MemberConverter().convert(ctx, argument)
+        if index is not None and ctx.guild is not None:
+            index.add(member)
+        return member
@@ -0,0 +1,158 @@
+"""
+Profiling hooks for the Discord Verification Bot
+Aggregates the duration of every event handler and command, reports callbacks
+that block the event loop with their stack, and runs an on-demand sampling
+profiler that writes collapsed stacks for flame graph tools.
+"""
+
+import asyncio
+import logging
+import os
+import sys
+import threading
+import time
+import traceback
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+PROFILES_DIR = 'profiles'
+
+
+class HandlerStats:
+    """Call count and durations of one handler."""
+
+    __slots__ = ('count', 'total', 'max')
+
+    def __init__(self):
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+
+def _frame_label(frame) -> str:
+    code = frame.f_code
+    return f"{code.co_name} ({os.path.basename(code.co_filename)}:{frame.f_lineno})"
+
+
+def collapse_stack(frame) -> str:
+    """Render a frame and its callers as a root-first collapsed stack."""
+    labels = []
+    while frame is not None:
+        labels.append(_frame_label(frame))
+        frame = frame.f_back
+    return ';'.join(reversed(labels))
+
+
+class Profiler:
+    """
+    Handler timings, blocked-loop watchdog and sampling profiler.
+
+    The watchdog is a heartbeat task on the event loop plus a thread that
+    checks the heartbeat; when the loop misses it for longer than the
+    threshold, the thread logs the loop thread's current stack, which is the
+    callback that is blocking. Nothing else runs until a profile is requested.
+    """
+
+    def __init__(self, slow_threshold: float = 0.2):
+        """
+        Initialize the profiler.
+
+        Args:
+            slow_threshold: Seconds the loop may be blocked before it is
+                reported; 0 disables the watchdog
+        """
+        self.slow_threshold = slow_threshold
+        self.timings: Dict[str, HandlerStats] = {}
+        self.slow_callbacks = 0
+        # Set by !profile from the moment it is accepted until the profile
+        # file is written; sample() does not touch it
+        self.sampling = False
+        self._loop_thread_id: Optional[int] = None
+        self._heartbeat = time.monotonic()
+        self._heartbeat_task: Optional[asyncio.Task] = None
+        self._stop = threading.Event()
+
+    def record(self, name: str, elapsed: float):
+        """Add one call of a handler to its timings."""
+        stats = self.timings.get(name)
+        if stats is None:
+            stats = self.timings[name] = HandlerStats()
+        stats.count += 1
+        stats.total += elapsed
+        if elapsed > stats.max:
+            stats.max = elapsed
+
+    def top(self, limit: int = 10) -> List[Tuple[str, HandlerStats]]:
+        """Return the handlers with the highest total time."""
+        return sorted(self.timings.items(), key=lambda item: item[1].total, reverse=True)[:limit]
+
+    def start_watchdog(self):
+        """Start the blocked-loop watchdog; must be called from the event loop."""
+        self._loop_thread_id = threading.get_ident()
+        if self.slow_threshold <= 0 or self._heartbeat_task is not None:
+            return
+        self._stop.clear()
+        self._heartbeat_task = asyncio.get_running_loop().create_task(self._beat())
+        threading.Thread(target=self._watch, name='loop-watchdog', daemon=True).start()
+
+    def stop_watchdog(self):
+        """Stop the watchdog thread and heartbeat task."""
+        self._stop.set()
+        if self._heartbeat_task is not None:
+            self._heartbeat_task.cancel()
+            self._heartbeat_task = None
+
+    async def _beat(self):
+        interval = self.slow_threshold / 2
+        while True:
+            self._heartbeat = time.monotonic()
+            await asyncio.sleep(interval)
+
+    def _watch(self):
+        interval = self.slow_threshold / 2
+        reported = None
+        while not self._stop.wait(interval):
+            heartbeat = self._heartbeat
+            blocked = time.monotonic() - heartbeat - interval
+            if blocked < self.slow_threshold or reported == heartbeat:
+                continue
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is None:
+                continue
+            reported = heartbeat
+            self.slow_callbacks += 1
+            stack = ''.join(traceback.format_stack(frame))
+            logger.warning(f"Event loop blocked for {blocked * 1000:.0f} ms+ by:\n{stack}")
+
+    def sample(self, seconds: float, interval: float = 0.005) -> str:
+        """
+        Sample the event loop thread's stack for a while and write collapsed stacks.
+
+        Runs in the calling thread (use an executor); the output file has one
+        ``frame;frame;frame count`` line per distinct stack, the input format
+        of flamegraph.pl, speedscope and similar tools.
+
+        Returns:
+            Path of the written file
+        """
+        if self._loop_thread_id is None:
+            raise RuntimeError("Watchdog was never started, loop thread unknown")
+
+        stacks = Counter()
+        deadline = time.monotonic() + seconds
+        while time.monotonic() < deadline:
+            frame = sys._current_frames().get(self._loop_thread_id)
+            if frame is not None:
+                stacks[collapse_stack(frame)] += 1
+            del frame
+            time.sleep(interval)
+
+        os.makedirs(PROFILES_DIR, exist_ok=True)
+        path = os.path.join(PROFILES_DIR, f"profile-{time.strftime('%Y%m%d-%H%M%S')}.folded")
+        with open(path, 'w') as f:
+            for stack, count in stacks.most_common():
+                f.write(f"{stack} {count}\n")
+        logger.info(f"Wrote {sum(stacks.values())} samples ({len(stacks)} stacks) to {path}")
+        return path
@@ -0,0 +1,124 @@
+"""
+Progress reporting for long-running commands
+A command posts one status message and reports its progress to a
+ProgressReporter as often as it likes; the message is edited with the
+aggregated counts and an ETA at most once per interval, then replaced by a
+single summary. The command's output is one send and a bounded number of
+edits however much work it does.
+"""
+
+import asyncio
+import logging
+import time
+from collections import Counter
+from typing import Optional
+
+import discord
+
+from responses import message
+
+logger = logging.getLogger(__name__)
+
+# Seconds between two edits of a status message; Discord allows about five
+# edits per five seconds per channel, shared with everything else the bot sends
+PROGRESS_INTERVAL = 3.0
+
+
+def _format_duration(seconds: float) -> str:
+    minutes, seconds = divmod(int(seconds), 60)
+    return f"{minutes}m{seconds:02d}s" if minutes else f"{seconds}s"
+
+
+class ProgressReporter:
+    """One status message edited at a capped rate with aggregated counts and an ETA."""
+
+    def __init__(self, channel, locale: str, title: str, total: Optional[int] = None,
+                 remaining_key: str = 'count_remaining', interval: float = PROGRESS_INTERVAL):
+        """
+        Initialize the reporter; call start() to post the status message.
+
+        Args:
+            channel: Channel (or context) the status message is sent to
+            locale: Locale of the status line
+            title: Label of the operation, shown first on the status line
+            total: Units of work expected, for the remaining count and ETA
+            remaining_key: Catalog message labelling the remaining units
+            interval: Minimum seconds between two edits
+        """
+        self.channel = channel
+        self.locale = locale
+        self.title = title
+        self.total = total
+        self.remaining_key = remaining_key
+        self.interval = interval
+        self.done = 0
+        self.counts = Counter()
+        self.message: Optional[discord.Message] = None
+        self._started = time.monotonic()
+        self._last_edit = 0.0
+        self._edit_task: Optional[asyncio.Task] = None
+
+    async def start(self):
+        """Post the status message."""
+        self._started = time.monotonic()
+        self._last_edit = self._started
+        self.message = await self.channel.send(self.render())
+
+    def render(self) -> str:
+        """Return the status line for the current counts."""
+        parts = [f"{message(self.locale, f'count_{name}')}: {value}" for name, value in self.counts.items()]
+        if self.total is not None:
+            remaining = max(self.total - self.done, 0)
+            parts.append(f"{message(self.locale, self.remaining_key)}: {remaining}")
+            if self.done and remaining:
+                elapsed = time.monotonic() - self._started
+                eta = _format_duration(elapsed / self.done * remaining)
+                parts.append(message(self.locale, 'progress_eta', eta=eta))
+        if not parts:
+            return f"⏳ {self.title}…"
+        return f"⏳ {self.title} — " + " · ".join(parts)
+
+    def advance(self, done: int = 0, **counts: int):
+        """
+        Record progress and edit the status message if the interval has passed.
+
+        Args:
+            done: Units of work completed
+            counts: Increments of named counters (e.g. deleted=100, failed=2)
+        """
+        self.done += done
+        self.counts.update(counts)
+        if self.message is None or (self._edit_task is not None and not self._edit_task.done()):
+            return
+        now = time.monotonic()
+        if now - self._last_edit >= self.interval:
+            self._last_edit = now
+            self._edit_task = asyncio.create_task(self._edit(self.render()))
+
+    async def _edit(self, content: str, **kwargs) -> bool:
+        try:
+            await self.message.edit(content=content, **kwargs)
+            return True
+        except discord.HTTPException as e:
+            logger.warning(f"Could not update progress message: {e}")
+            return False
+
+    async def finish(self, summary: str, **kwargs) -> discord.Message:
+        """
+        Replace the status message with the summary.
+
+        Args:
+            summary: Final text
+            kwargs: Extra message.edit() arguments, e.g. attachments
+
+        Returns:
+            The message holding the summary
+        """
+        if self._edit_task is not None:
+            await self._edit_task
+        if self.message is not None and await self._edit(summary, **kwargs):
+            return self.message
+        # The status message is gone: send the summary instead
+        if 'attachments' in kwargs:
+            kwargs['files'] = kwargs.pop('attachments')
+        return await self.channel.send(summary, **kwargs)
@@ -0,0 +1,545 @@
+"""
+Response catalog for the Discord Verification Bot
+Every message and embed the commands send, in French and English. Embed
+templates are turned into a Discord payload once at import; sending one only
+fills in the templated strings, and embeds without per-call values (such as
+the help pages) are built once per prefix and reused as-is.
+"""
+
+import copy
+from typing import Dict, Optional, Sequence, Tuple
+
+import discord
+
+LOCALES = ('fr', 'en')
+
+Field = Tuple[str, str, bool]
+
+
+def _read_only(*args, **kwargs):
+    raise TypeError("CachedEmbed is read-only; modify a copy() instead")
+
+
+class CachedEmbed(discord.Embed):
+    """
+    Embed sent from a prebuilt payload.
+
+    discord.py calls to_dict() on every send; this returns the payload the
+    embed was built from, so sending never builds the embed's attributes.
+    Reading an attribute builds a plain Embed from a copy of the payload on
+    first access. The payload may be shared with other sends and with the
+    template, so assigning an attribute or calling a setter raises
+    TypeError; copy() returns a plain, modifiable Embed.
+    """
+
+    __slots__ = ('_payload', '_view')
+
+    def __init__(self, *args, **kwargs):
+        _read_only()
+
+    @classmethod
+    def from_payload(cls, payload: dict) -> 'CachedEmbed':
+        """Wrap a Discord embed payload."""
+        embed = cls.__new__(cls)
+        object.__setattr__(embed, '_payload', payload)
+        return embed
+
+    def to_dict(self) -> dict:
+        return self._payload
+
+    def copy(self) -> discord.Embed:
+        """Return a modifiable copy of the embed."""
+        return discord.Embed.from_dict(copy.deepcopy(self._payload))
+
+    def __getattr__(self, name):
+        # Only called for attributes that are not set, which is all of them but _payload
+        if name in ('_payload', '_view'):
+            raise AttributeError(name)
+        try:
+            view = object.__getattribute__(self, '_view')
+        except AttributeError:
+            view = self.copy()
+            object.__setattr__(self, '_view', view)
+        return getattr(view, name)
+
+    __setattr__ = __delattr__ = _read_only
+    add_field = insert_field_at = set_field_at = remove_field = clear_fields = _read_only
+    set_footer = remove_footer = set_author = remove_author = set_image = set_thumbnail = _read_only
+
+
+def _is_template(text: Optional[str]) -> bool:
+    return text is not None and '{' in text
+
+
+class EmbedTemplate:
+    """
+    Embed whose strings may contain ``{name}`` placeholders.
+
+    The payload is built once; render() copies it and formats only the
+    strings that have placeholders.
+    """
+
+    def __init__(self, title: str, description: Optional[str] = None, colour: discord.Colour = None,
+                 fields: Sequence[Field] = (), footer: Optional[str] = None, thumbnail: Optional[str] = None,
+                 cached: bool = False):
+        """
+        Build the payload of the template.
+
+        Args:
+            title, description, footer, thumbnail: Template strings
+            colour: Embed colour
+            fields: (name, value, inline) template triples
+            cached: Reuse the rendered embed for identical values (for pages such as help)
+        """
+        embed = discord.Embed(title=title, description=description, colour=colour)
+        for name, value, inline in fields:
+            embed.add_field(name=name, value=value, inline=inline)
+        if footer is not None:
+            embed.set_footer(text=footer)
+        if thumbnail is not None:
+            embed.set_thumbnail(url=thumbnail)
+
+        self._payload = embed.to_dict()
+        self._keys = [key for key in ('title', 'description') if _is_template(self._payload.get(key))]
+        self._nested = [
+            (key, attr) for key, attr in (('footer', 'text'), ('thumbnail', 'url'))
+            if _is_template(self._payload.get(key, {}).get(attr))
+        ]
+        self._fields = [
+            (field, _is_template(field['name']), _is_template(field['value']))
+            for field in self._payload.get('fields', ())
+        ]
+        self._dynamic_fields = any(name or value for _, name, value in self._fields)
+        self._static = not (self._keys or self._nested or self._dynamic_fields)
+        self._cache: Optional[Dict[tuple, CachedEmbed]] = {} if cached or self._static else None
+
+    def render(self, **values) -> CachedEmbed:
+        """Return the embed with its placeholders filled in from ``values``."""
+        if self._cache is not None:
+            key = tuple(sorted(values.items()))
+            embed = self._cache.get(key)
+            if embed is None:
+                embed = self._cache[key] = CachedEmbed.from_payload(self._fill(values))
+            return embed
+        return CachedEmbed.from_payload(self._fill(values))
+
+    def _fill(self, values: dict) -> dict:
+        payload = self._payload.copy()
+        for key in self._keys:
+            payload[key] = payload[key].format_map(values)
+        for key, attr in self._nested:
+            payload[key] = {attr: payload[key][attr].format_map(values)}
+        if self._dynamic_fields:
+            payload['fields'] = [
+                {
+                    'name': field['name'].format_map(values) if name else field['name'],
+                    'value': field['value'].format_map(values) if value else field['value'],
+                    'inline': field['inline'],
+                } if name or value else field
+                for field, name, value in self._fields
+            ]
+        return payload
+
+
+MESSAGES: Dict[str, Dict[str, str]] = {
+    'fr': {
+        'no_permission': "❌ Vous n'avez pas la permission d'utiliser cette commande.",
+        'error': "❌ Une erreur s'est produite.",
+        'invalid_argument': "❌ Argument invalide.",
+        'forbidden_roles': "❌ Je n'ai pas la permission de gérer les rôles.",
+        'member_not_found': "❌ Utilisateur introuvable. Veuillez mentionner un utilisateur valide.",
+        'role_not_found': "❌ Rôle requis introuvable. Vérifiez la configuration.",
+        'target_required': "❌ Veuillez mentionner un utilisateur ou répondre à son message avec {command}",
+        'verify_error': "❌ Une erreur s'est produite lors de la vérification.",
+        'unverify_error': "❌ Une erreur s'est produite lors de l'annulation de la vérification.",
+        'status_error': "❌ Une erreur s'est produite lors de la vérification du statut.",
+        'entry_role_missing': "❌ Rôle d'arrivant introuvable. Vérifiez la configuration.",
+        'verified_role_missing': "❌ Rôle vérifié introuvable. Vérifiez la configuration.",
+        'roles_missing': "❌ Rôles introuvables. Vérifiez la configuration.",
+        'jail_role_missing': "❌ Rôle de prison introuvable. Vérifiez la configuration.",
+        'mute_role_missing': "❌ Rôle de mute introuvable. Vérifiez la configuration.",
+        'no_entry_role': "❌ {member} n'a pas le rôle d'arrivant.",
+        'already_verified': "❌ {member} est déjà vérifié.",
+        'not_verified': "❌ {member} n'est pas vérifié.",
+        'already_gender': "❌ {member} a déjà le rôle {role}.",
+        'gender_men': "homme",
+        'gender_wom': "femme",
+        'already_jailed': "❌ {member} est déjà en prison.",
+        'not_jailed': "❌ {member} n'est pas en prison.",
+        'not_muted': "❌ {member} n'est pas mute.",
+        'no_reason': "Aucune raison fournie",
+        'no_saved_roles': "Aucun (aucun rôle sauvegardé trouvé)",
+        'yes': "Oui",
+        'no': "Non",
+        'cleared': "🧹 {count} de vos messages et du bot supprimés dans {channels} salon(s) !",
+        'nothing_cleared': "🧹 Aucun message trouvé à supprimer.",
+        'clear_error': "❌ Une erreur s'est produite lors de la suppression.",
+        'clear_usage': "❌ Utilisation : {prefix}yisclear [nombre] ou {prefix}yisclear archive [heures]",
+        'archived': "🗄️ {archived} message(s) archivé(s), {deleted} supprimé(s) dans {channels} salon(s), {failed} échec(s).",
+        'archive_saved': "Archive enregistrée sur le serveur du bot : `{path}`",
+        'nobody_jailed': "🔓 Personne n'est en prison.",
+        'nobody_muted': "🔊 Personne n'est mute.",
+        'sanctions_partial': "⚠️ La liste des membres n'a pas pu être chargée : seuls les membres en cache sont pris en compte.",
+        'and_more': "… et {count} autre(s)",
+        'release_usage': "❌ Utilisation : {prefix}releaseall jailed|muted",
+        'released': "✅ {released} membre(s) libéré(s), {skipped} déjà libre(s), {missing} introuvable(s), {failed} échec(s).",
+        'progress_clear': "Suppression des messages",
+        'progress_archive': "Archivage et suppression des messages",
+        'progress_release': "Libération des membres",
+        'count_deleted': "supprimés",
+        'count_archived': "archivés",
+        'count_released': "libérés",
+        'count_skipped': "déjà libres",
+        'count_missing': "introuvables",
+        'count_failed': "échecs",
+        'count_remaining': "restants",
+        'channels_remaining': "salons restants",
+        'members_remaining': "membres restants",
+        'progress_eta': "fin dans ~{eta}",
+        'video_missing': "❌ Vidéo introuvable.",
+        'video_error': "❌ Erreur lors de l'envoi de la vidéo.",
+        'settings_reloaded': "🔄 Configuration rechargée.",
+        'settings_invalid': "❌ Fichier de configuration invalide, l'ancienne configuration est conservée.",
+        'config_usage': "❌ Utilisation : {prefix}config <clé> <valeur>",
+        'config_updated': "✅ `{key}` mis à jour : {value}",
+        'invalid_value': "❌ Valeur invalide.",
+        'not_available': "n/d",
+        'disabled': "désactivé",
+        'gateway_event_line': "`{event_type}` : {count} événements, {decode} ms de décodage",
+        'no_gateway_events': "Aucun événement reçu pour l'instant.",
+        'handler_timing_line': "`{name}` : {count} appels, moy. {average} ms, max {max} ms",
+        'no_handler_timings': "Aucun handler n'a encore été exécuté.",
+        'profile_running': "❌ Un profil est déjà en cours.",
+        'profiling': "🔬 Profilage pendant {seconds} s...",
+        'profile_ready': "Piles agrégées, à ouvrir avec speedscope ou flamegraph.pl.",
+    },
+    'en': {
+        'no_permission': "❌ You don't have permission to use this command.",
+        'error': "❌ An error occurred while processing the command.",
+        'invalid_argument': "❌ Invalid argument.",
+        'forbidden_roles': "❌ I don't have permission to manage roles. Please check my permissions.",
+        'member_not_found': "❌ User not found. Please mention a valid user.",
+        'role_not_found': "❌ Required role not found. Please check bot configuration.",
+        'target_required': "❌ Please mention a user or reply to their message with {command}",
+        'verify_error': "❌ An error occurred while verifying the user.",
+        'unverify_error': "❌ An error occurred while unverifying the user.",
+        'status_error': "❌ An error occurred while checking user status.",
+        'entry_role_missing': "❌ Entry role not found. Please check bot configuration.",
+        'verified_role_missing': "❌ Verified role not found. Please check bot configuration.",
+        'roles_missing': "❌ Roles not found. Please check bot configuration.",
+        'jail_role_missing': "❌ Jail role not found. Please check bot configuration.",
+        'mute_role_missing': "❌ Mute role not found. Please check bot configuration.",
+        'no_entry_role': "❌ {member} doesn't have the entry role.",
+        'already_verified': "❌ {member} is already verified.",
+        'not_verified': "❌ {member} is not verified.",
+        'already_gender': "❌ {member} already has the {role} role.",
+        'gender_men': "men",
+        'gender_wom': "women",
+        'already_jailed': "❌ {member} is already jailed.",
+        'not_jailed': "❌ {member} is not jailed.",
+        'not_muted': "❌ {member} is not muted.",
+        'no_reason': "No reason given",
+        'no_saved_roles': "None (no saved roles found)",
+        'yes': "Yes",
+        'no': "No",
+        'cleared': "🧹 Deleted {count} of your and the bot's messages in {channels} channel(s)!",
+        'nothing_cleared': "🧹 No messages found to delete.",
+        'clear_error': "❌ An error occurred while deleting messages.",
+        'clear_usage': "❌ Usage: {prefix}yisclear [count] or {prefix}yisclear archive [hours]",
+        'archived': "🗄️ Archived {archived} message(s), deleted {deleted} in {channels} channel(s), {failed} failed.",
+        'archive_saved': "Archive saved on the bot host: `{path}`",
+        'nobody_jailed': "🔓 Nobody is jailed.",
+        'nobody_muted': "🔊 Nobody is muted.",
+        'sanctions_partial': "⚠️ The member list could not be loaded: only cached members are included.",
+        'and_more': "… and {count} more",
+        'release_usage': "❌ Usage: {prefix}releaseall jailed|muted",
+        'released': "✅ Released {released} member(s), {skipped} already free, {missing} not found, {failed} failed.",
+        'progress_clear': "Deleting messages",
+        'progress_archive': "Archiving and deleting messages",
+        'progress_release': "Releasing members",
+        'count_deleted': "deleted",
+        'count_archived': "archived",
+        'count_released': "released",
+        'count_skipped': "already free",
+        'count_missing': "not found",
+        'count_failed': "failed",
+        'count_remaining': "remaining",
+        'channels_remaining': "channels left",
+        'members_remaining': "members left",
+        'progress_eta': "done in ~{eta}",
+        'video_missing': "❌ Video not found.",
+        'video_error': "❌ Error while sending the video.",
+        'settings_reloaded': "🔄 Settings reloaded.",
+        'settings_invalid': "❌ Invalid settings file, the previous settings are kept.",
+        'config_usage': "❌ Usage: {prefix}config <key> <value>",
+        'config_updated': "✅ `{key}` updated: {value}",
+        'invalid_value': "❌ Invalid value.",
+        'not_available': "n/a",
+        'disabled': "disabled",
+        'gateway_event_line': "`{event_type}`: {count} events, {decode} ms decode",
+        'no_gateway_events': "No events received yet.",
+        'handler_timing_line': "`{name}`: {count} calls, avg {average} ms, max {max} ms",
+        'no_handler_timings': "No handler has run yet.",
+        'profile_running': "❌ A profile is already running.",
+        'profiling': "🔬 Profiling for {seconds}s...",
+        'profile_ready': "Collapsed stacks, open with speedscope or flamegraph.pl.",
+    },
+}
+
+EMBEDS: Dict[str, Dict[str, EmbedTemplate]] = {
+    'fr': {
+        'verified': EmbedTemplate(
+            "✅ Utilisateur Vérifié", "{member} a été vérifié avec succès !", discord.Color.green(),
+            [("Vérifié par", "{moderator}", True), ("Rôle d'arrivant retiré", "{entry_role}", True),
+             ("Rôle vérifié ajouté", "{verified_role}", True)],
+        ),
+        'verified_dm': EmbedTemplate(
+            "🎉 Vous avez été vérifié !",
+            "Vous avez été vérifié manuellement dans **{guild}** et avez maintenant accès à tous les salons.",
+            discord.Color.green(),
+        ),
+        'unverified': EmbedTemplate(
+            "🔄 Vérification Annulée", "La vérification de {member} a été annulée.", discord.Color.orange(),
+            [("Annulée par", "{moderator}", True), ("Rôle vérifié retiré", "{verified_role}", True),
+             ("Rôle d'arrivant ajouté", "{entry_role}", True)],
+        ),
+        'verified_men': EmbedTemplate(
+            "✅ Utilisateur Vérifié (Homme)", "{member} a été vérifié comme homme !", discord.Color.blue(),
+            [("Vérifié par", "{moderator}", True)],
+        ),
+        'verified_wom': EmbedTemplate(
+            "✅ Utilisateur Vérifié (Femme)", "{member} a été vérifiée comme femme !", discord.Color.pink(),
+            [("Vérifié par", "{moderator}", True)],
+        ),
+        'jailed': EmbedTemplate(
+            "🔒 Utilisateur Emprisonné", "{member} a été mis en prison !", discord.Color.red(),
+            [("Emprisonné par", "{moderator}", True), ("Raison", "{reason}", True)],
+        ),
+        'jailed_dm': EmbedTemplate(
+            "🔒 Vous avez été emprisonné", "Vous avez été mis en prison dans **{guild}**.", discord.Color.red(),
+            [("Raison", "{reason}", False)],
+        ),
+        'unjailed': EmbedTemplate(
+            "🔓 Utilisateur Libéré", "{member} a été libéré de prison !", discord.Color.green(),
+            [("Libéré par", "{moderator}", True), ("Rôles restaurés", "{roles}", True)],
+        ),
+        'unmuted': EmbedTemplate(
+            "🔊 Utilisateur Démute", "{member} a été démute !", discord.Color.green(),
+            [("Démute par", "{moderator}", True)],
+        ),
+        'auto_muted': EmbedTemplate(
+            "🔇 Utilisateur Mute", "{member} a été mute automatiquement !", discord.Color.red(),
+            [("Raison", "Spam des commandes d'administrateur", False),
+             ("Durée", "Jusqu'à ce qu'un administrateur vous démute", False),
+             ("⚠️ Avertissement", "Ne spammez pas les commandes réservées aux administrateurs !", False)],
+        ),
+        'status_verified': EmbedTemplate(
+            "Statut Utilisateur", "Statut pour {member}: ✅ Vérifié", discord.Color.green()),
+        'status_pending': EmbedTemplate(
+            "Statut Utilisateur", "Statut pour {member}: ⏳ En attente de vérification", discord.Color.orange()),
+        'status_unknown': EmbedTemplate(
+            "Statut Utilisateur", "Statut pour {member}: ❓ Statut inconnu", discord.Color.red()),
+        'detailed_status_verified': EmbedTemplate(
+            "Statut Utilisateur", "Statut pour {member}", discord.Color.green(),
+            [("Statut actuel", "✅ Vérifié", False), ("A le rôle d'arrivant", "{has_entry}", True),
+             ("A le rôle vérifié", "{has_verified}", True)],
+            thumbnail="{avatar}",
+        ),
+        'detailed_status_pending': EmbedTemplate(
+            "Statut Utilisateur", "Statut pour {member}", discord.Color.orange(),
+            [("Statut actuel", "⏳ En attente de vérification", False), ("A le rôle d'arrivant", "{has_entry}", True),
+             ("A le rôle vérifié", "{has_verified}", True)],
+            thumbnail="{avatar}",
+        ),
+        'detailed_status_unknown': EmbedTemplate(
+            "Statut Utilisateur", "Statut pour {member}", discord.Color.red(),
+            [("Statut actuel", "❓ Statut inconnu", False), ("A le rôle d'arrivant", "{has_entry}", True),
+             ("A le rôle vérifié", "{has_verified}", True)],
+            thumbnail="{avatar}",
+        ),
+        'config': EmbedTemplate("⚙️ Configuration du serveur", "{settings}", discord.Color.blue()),
+        'jailed_list': EmbedTemplate("🔒 En prison ({count})", "{members}", discord.Color.red()),
+        'muted_list': EmbedTemplate("🔇 Mute ({count})", "{members}", discord.Color.red()),
+        'help': EmbedTemplate(
+            "🤖 Commandes du Bot de Vérification", None, discord.Color.blue(),
+            [("{prefix}men @utilisateur", "Vérifier un utilisateur comme homme (mention ou réponse)", False),
+             ("{prefix}wom @utilisateur", "Vérifier un utilisateur comme femme (mention ou réponse)", False),
+             ("{prefix}hebs @utilisateur [raison]", "Mettre un utilisateur en prison (mention ou réponse)", False),
+             ("{prefix}unhebs @utilisateur", "Libérer un utilisateur de prison (mention ou réponse)", False),
+             ("{prefix}jailed / {prefix}muted", "Lister les membres en prison / mute", False),
+             ("{prefix}releaseall jailed|muted", "Libérer tous les membres en prison / mute", False),
+             ("{prefix}zekir", "Message de Zekir", False),
+             ("{prefix}unmute @utilisateur", "Démuter un utilisateur (mention ou réponse)", False),
+             ("{prefix}omar", "Envoie une vidéo spéciale", False),
+             ("{prefix}yisclear [nombre]",
+              "Supprimer vos messages et ceux du bot dans tous les salons (défaut: 100)", False),
+             ("{prefix}yisclear archive [heures]",
+              "Archiver puis supprimer ces messages des dernières heures (défaut: 24)", False),
+             ("{prefix}status @utilisateur", "Vérifier le statut d'un utilisateur", False),
+             ("{prefix}help", "Afficher cette aide", False)],
+            cached=True,
+        ),
+        'bothelp': EmbedTemplate(
+            "🤖 Commandes du Bot de Vérification", "Système de vérification manuelle", discord.Color.blue(),
+            [("{prefix}verify @utilisateur", "Vérifier un utilisateur (retire le rôle d'arrivant, ajoute le rôle vérifié)", False),
+             ("{prefix}unverify @utilisateur", "Annuler la vérification d'un utilisateur", False),
+             ("{prefix}status @utilisateur", "Vérifier le statut de vérification d'un utilisateur", False),
+             ("{prefix}botstats", "Afficher la mémoire et l'utilisation du gateway du bot", False),
+             ("{prefix}gatewaystats", "Afficher les événements du gateway et leur temps de décodage par type", False),
+             ("{prefix}perf / {prefix}profile [secondes]",
+              "Afficher les temps des handlers / enregistrer un profil par échantillonnage", False),
+             ("{prefix}bothelp", "Afficher cette aide", False)],
+            footer="Note : toutes les commandes nécessitent la permission « Gérer les rôles »",
+            cached=True,
+        ),
+        'botstats': EmbedTemplate(
+            "📊 Statistiques du Bot", None, discord.Color.blue(),
+            [("RSS du processus", "{rss}", True), ("Événements du gateway", "{events}", True),
+             ("Serveurs", "{guilds}", True), ("Membres en cache", "{members}", True),
+             ("Ensembles de commandes", "{cogs}", True),
+             ("Actions de rôle simultanées", "{joined} jointes, {queued} en file", True),
+             ("Appels REST économisés", "{rest_saved}", True)],
+        ),
+        'gatewaystats': EmbedTemplate(
+            "📡 Événements du Gateway", "{events}", discord.Color.blue(),
+            [("Profil d'intents", "{profile}", True), ("Total des événements", "{total}", True),
+             ("Décodage par serveur", "{decode} ms", True)],
+        ),
+        'perf': EmbedTemplate(
+            "⏱️ Temps des Handlers", "{timings}", discord.Color.blue(),
+            [("Seuil de blocage de la boucle", "{threshold}", True),
+             ("Blocages de la boucle détectés", "{blocks}", True)],
+        ),
+    },
+    'en': {
+        'verified': EmbedTemplate(
+            "✅ User Verified", "{member} has been successfully verified!", discord.Color.green(),
+            [("Verified by", "{moderator}", True), ("Entry role removed", "{entry_role}", True),
+             ("Verified role added", "{verified_role}", True)],
+        ),
+        'verified_dm': EmbedTemplate(
+            "🎉 You've been verified!",
+            "You have been manually verified in **{guild}** and now have access to all channels.",
+            discord.Color.green(),
+        ),
+        'unverified': EmbedTemplate(
+            "🔄 User Unverified", "{member} has been unverified.", discord.Color.orange(),
+            [("Unverified by", "{moderator}", True), ("Verified role removed", "{verified_role}", True),
+             ("Entry role added", "{entry_role}", True)],
+        ),
+        'verified_men': EmbedTemplate(
+            "✅ User Verified (Male)", "{member} has been verified as male!", discord.Color.blue(),
+            [("Verified by", "{moderator}", True)],
+        ),
+        'verified_wom': EmbedTemplate(
+            "✅ User Verified (Female)", "{member} has been verified as female!", discord.Color.pink(),
+            [("Verified by", "{moderator}", True)],
+        ),
+        'jailed': EmbedTemplate(
+            "🔒 User Jailed", "{member} has been jailed!", discord.Color.red(),
+            [("Jailed by", "{moderator}", True), ("Reason", "{reason}", True)],
+        ),
+        'jailed_dm': EmbedTemplate(
+            "🔒 You have been jailed", "You have been jailed in **{guild}**.", discord.Color.red(),
+            [("Reason", "{reason}", False)],
+        ),
+        'unjailed': EmbedTemplate(
+            "🔓 User Released", "{member} has been released from jail!", discord.Color.green(),
+            [("Released by", "{moderator}", True), ("Roles restored", "{roles}", True)],
+        ),
+        'unmuted': EmbedTemplate(
+            "🔊 User Unmuted", "{member} has been unmuted!", discord.Color.green(),
+            [("Unmuted by", "{moderator}", True)],
+        ),
+        'auto_muted': EmbedTemplate(
+            "🔇 User Muted", "{member} has been muted automatically!", discord.Color.red(),
+            [("Reason", "Spamming administrator commands", False),
+             ("Duration", "Until an administrator unmutes you", False),
+             ("⚠️ Warning", "Do not spam commands reserved for administrators!", False)],
+        ),
+        'status_verified': EmbedTemplate(
+            "User Status", "Status for {member}: ✅ Verified", discord.Color.green()),
+        'status_pending': EmbedTemplate(
+            "User Status", "Status for {member}: ⏳ Pending Verification", discord.Color.orange()),
+        'status_unknown': EmbedTemplate(
+            "User Status", "Status for {member}: ❓ Unknown Status", discord.Color.red()),
+        'detailed_status_verified': EmbedTemplate(
+            "User Status", "Status for {member}", discord.Color.green(),
+            [("Current Status", "✅ Verified", False), ("Has Entry Role", "{has_entry}", True),
+             ("Has Verified Role", "{has_verified}", True)],
+            thumbnail="{avatar}",
+        ),
+        'detailed_status_pending': EmbedTemplate(
+            "User Status", "Status for {member}", discord.Color.orange(),
+            [("Current Status", "⏳ Pending Verification", False), ("Has Entry Role", "{has_entry}", True),
+             ("Has Verified Role", "{has_verified}", True)],
+            thumbnail="{avatar}",
+        ),
+        'detailed_status_unknown': EmbedTemplate(
+            "User Status", "Status for {member}", discord.Color.red(),
+            [("Current Status", "❓ Unknown Status", False), ("Has Entry Role", "{has_entry}", True),
+             ("Has Verified Role", "{has_verified}", True)],
+            thumbnail="{avatar}",
+        ),
+        'config': EmbedTemplate("⚙️ Server settings", "{settings}", discord.Color.blue()),
+        'jailed_list': EmbedTemplate("🔒 Jailed ({count})", "{members}", discord.Color.red()),
+        'muted_list': EmbedTemplate("🔇 Muted ({count})", "{members}", discord.Color.red()),
+        'help': EmbedTemplate(
+            "🤖 Verification Bot Commands", None, discord.Color.blue(),
+            [("{prefix}men @user", "Verify a user as male (mention or reply)", False),
+             ("{prefix}wom @user", "Verify a user as female (mention or reply)", False),
+             ("{prefix}hebs @user [reason]", "Put a user in jail (mention or reply)", False),
+             ("{prefix}unhebs @user", "Release a user from jail (mention or reply)", False),
+             ("{prefix}jailed / {prefix}muted", "List jailed / muted members", False),
+             ("{prefix}releaseall jailed|muted", "Release every jailed / muted member", False),
+             ("{prefix}zekir", "Zekir's message", False),
+             ("{prefix}unmute @user", "Unmute a user (mention or reply)", False),
+             ("{prefix}omar", "Sends a special video", False),
+             ("{prefix}yisclear [count]", "Delete your and the bot's messages in every channel (default: 100)", False),
+             ("{prefix}yisclear archive [hours]", "Archive, then delete, those messages from the last hours (default: 24)", False),
+             ("{prefix}status @user", "Check the status of a user", False),
+             ("{prefix}help", "Show this help message", False)],
+            cached=True,
+        ),
+        'bothelp': EmbedTemplate(
+            "🤖 Verification Bot Commands", "Manual user verification system", discord.Color.blue(),
+            [("{prefix}verify @user", "Verify a user (removes entry role, adds verified role)", False),
+             ("{prefix}unverify @user", "Remove verification from a user", False),
+             ("{prefix}status @user", "Check verification status of a user", False),
+             ("{prefix}botstats", "Show memory and gateway usage of the bot process", False),
+             ("{prefix}gatewaystats", "Show gateway events and decode time per event type", False),
+             ("{prefix}perf / {prefix}profile [seconds]", "Show handler timings / record a sampling profile", False),
+             ("{prefix}bothelp", "Show this help message", False)],
+            footer="Note: All commands require 'Manage Roles' permission",
+            cached=True,
+        ),
+        'botstats': EmbedTemplate(
+            "📊 Bot Statistics", None, discord.Color.blue(),
+            [("Process RSS", "{rss}", True), ("Gateway events", "{events}", True),
+             ("Guilds", "{guilds}", True), ("Cached members", "{members}", True),
+             ("Command sets", "{cogs}", True),
+             ("Concurrent role actions", "{joined} joined, {queued} queued", True),
+             ("REST calls saved", "{rest_saved}", True)],
+        ),
+        'gatewaystats': EmbedTemplate(
+            "📡 Gateway Events", "{events}", discord.Color.blue(),
+            [("Intent profile", "{profile}", True), ("Total events", "{total}", True),
+             ("Decode time per guild", "{decode} ms", True)],
+        ),
+        'perf': EmbedTemplate(
+            "⏱️ Handler Timings", "{timings}", discord.Color.blue(),
+            [("Loop block threshold", "{threshold}", True), ("Loop blocks detected", "{blocks}", True)],
+        ),
+    },
+}
+
+
+def message(locale: str, key: str, **values) -> str:
+    """Return a catalog message, with its placeholders filled in from ``values``."""
+    text = MESSAGES[locale][key]
+    return text.format_map(values) if values else text
+
+
+def embed(locale: str, key: str, **values) -> discord.Embed:
+    """Return a catalog embed, with its placeholders filled in from ``values``."""
+    return EMBEDS[locale][key].render(**values)
@@ -0,0 +1,263 @@
+"""
+Role actions shared by text and slash commands
+Each action validates the request, performs the role changes and returns the
+embed to reply with, from the response catalog in the requested locale.
+Validation failures raise ActionError with the message to show to the
+moderator; discord.Forbidden is left to the caller.
+"""
+
+import logging
+
+import discord
+
+from responses import embed, message
+from runtime import json_dumps, json_loads
+
+logger = logging.getLogger(__name__)
+
+JAILED_USERS_FILE = 'jailed_users.json'
+
+# Verification by gender: role setting, word used in audit log reasons
+GENDERS = {
+    'men': ('men_role_id', 'male'),
+    'wom': ('women_role_id', 'female'),
+}
+
+
+class ActionError(Exception):
+    """Raised when an action cannot be performed; the message is shown as-is."""
+
+
+def load_jailed_users() -> dict:
+    """Load the saved roles of jailed users."""
+    try:
+        with open(JAILED_USERS_FILE, 'r') as f:
+            return json_loads(f.read())
+    except (FileNotFoundError, ValueError):
+        return {}
+
+
+def save_jailed_users(jailed_data: dict):
+    """Persist the saved roles of jailed users."""
+    with open(JAILED_USERS_FILE, 'w') as f:
+        f.write(json_dumps(jailed_data))
+
+
+async def verify_member(guild, member, moderator, settings, locale: str = 'en') -> discord.Embed:
+    """Verify a user by removing entry role and adding verified role."""
+    entry_role = guild.get_role(settings.entry_role_id)
+    verified_role = guild.get_role(settings.verified_role_id)
+
+    if not entry_role:
+        raise ActionError(message(locale, 'entry_role_missing'))
+    if not verified_role:
+        raise ActionError(message(locale, 'verified_role_missing'))
+
+    # Check if user has entry role
+    if entry_role not in member.roles:
+        raise ActionError(message(locale, 'no_entry_role', member=member.mention))
+
+    # Check if user already has verified role
+    if verified_role in member.roles:
+        raise ActionError(message(locale, 'already_verified', member=member.mention))
+
+    # Remove entry role and add verified role
+    await member.remove_roles(entry_role, reason=f"Manual verification by {moderator}")
+    await member.add_roles(verified_role, reason=f"Manual verification by {moderator}")
+
+    reply = embed(locale, 'verified', member=member.mention, moderator=moderator.mention,
+                  entry_role=entry_role.name, verified_role=verified_role.name)
+
+    logger.info(f"User {member} verified by {moderator} in guild {guild.name}")
+
+    # Send DM to verified user (optional)
+    try:
+        await member.send(embed=embed(locale, 'verified_dm', guild=guild.name))
+    except discord.Forbidden:
+        logger.info(f"Could not send DM to {member} - DMs disabled")
+
+    return reply
+
+
+async def unverify_member(guild, member, moderator, settings, locale: str = 'en') -> discord.Embed:
+    """Unverify a user by removing verified role and adding entry role back."""
+    entry_role = guild.get_role(settings.entry_role_id)
+    verified_role = guild.get_role(settings.verified_role_id)
+
+    if not entry_role:
+        raise ActionError(message(locale, 'entry_role_missing'))
+    if not verified_role:
+        raise ActionError(message(locale, 'verified_role_missing'))
+
+    # Check if user has verified role
+    if verified_role not in member.roles:
+        raise ActionError(message(locale, 'not_verified', member=member.mention))
+
+    # Remove verified role and add entry role
+    await member.remove_roles(verified_role, reason=f"Manual unverification by {moderator}")
+    await member.add_roles(entry_role, reason=f"Manual unverification by {moderator}")
+
+    logger.info(f"User {member} unverified by {moderator} in guild {guild.name}")
+    return embed(locale, 'unverified', member=member.mention, moderator=moderator.mention,
+                 verified_role=verified_role.name, entry_role=entry_role.name)
+
+
+async def verify_gender(guild, member, moderator, settings, gender: str, locale: str = 'fr') -> discord.Embed:
+    """Verify a user as male or female by removing entry role and adding the gender role."""
+    role_setting, english = GENDERS[gender]
+    entry_role = guild.get_role(settings.entry_role_id)
+    gender_role = guild.get_role(getattr(settings, role_setting))
+
+    if not entry_role or not gender_role:
+        raise ActionError(message(locale, 'roles_missing'))
+
+    # Check if user has entry role
+    if entry_role not in member.roles:
+        raise ActionError(message(locale, 'no_entry_role', member=member.mention))
+
+    # Check if already has the gender role
+    if gender_role in member.roles:
+        raise ActionError(message(locale, 'already_gender', member=member.mention,
+                                  role=message(locale, f'gender_{gender}')))
+
+    # Remove entry role and add gender role
+    await member.remove_roles(entry_role, reason=f"Verified as {english} by {moderator}")
+    await member.add_roles(gender_role, reason=f"Verified as {english} by {moderator}")
+
+    logger.info(f"User {member} verified as {english} by {moderator}")
+    return embed(locale, f'verified_{gender}', member=member.mention, moderator=moderator.mention)
+
+
+async def jail_member(guild, member, moderator, settings, reason: str = None, locale: str = 'fr') -> discord.Embed:
+    """Put a user in jail by removing their roles and adding jail role."""
+    jail_role = guild.get_role(settings.jail_role_id)
+    reason = reason or message(locale, 'no_reason')
+
+    if not jail_role:
+        raise ActionError(message(locale, 'jail_role_missing'))
+
+    # Check if already in jail
+    if jail_role in member.roles:
+        raise ActionError(message(locale, 'already_jailed', member=member.mention))
+
+    # Save current roles (except @everyone, bot roles, and entry role) for restoration
+    roles_to_save = [role.id for role in member.roles if role.name != "@everyone" and not role.managed and role.id != settings.entry_role_id]
+
+    jailed_data = load_jailed_users()
+    jailed_data[str(member.id)] = roles_to_save
+    save_jailed_users(jailed_data)
+
+    # Remove all roles and add jail role
+    roles_to_remove = [role for role in member.roles if role.name != "@everyone" and not role.managed]
+    if roles_to_remove:
+        await member.remove_roles(*roles_to_remove, reason=f"Jailed by {moderator}: {reason}")
+    await member.add_roles(jail_role, reason=f"Jailed by {moderator}: {reason}")
+
+    logger.info(f"User {member} jailed by {moderator} for: {reason}")
+
+    # Try to send DM to jailed user
+    try:
+        await member.send(embed=embed(locale, 'jailed_dm', guild=guild.name, reason=reason))
+    except discord.Forbidden:
+        logger.info(f"Could not send DM to {member} - DMs disabled")
+
+    return embed(locale, 'jailed', member=member.mention, moderator=moderator.mention, reason=reason)
+
+
+async def unjail_member(guild, member, moderator, settings, locale: str = 'fr') -> discord.Embed:
+    """Remove a user from jail and restore their original roles."""
+    jail_role = guild.get_role(settings.jail_role_id)
+
+    if not jail_role:
+        raise ActionError(message(locale, 'jail_role_missing'))
+
+    # Check if user is in jail
+    if jail_role not in member.roles:
+        raise ActionError(message(locale, 'not_jailed', member=member.mention))
+
+    user_id = str(member.id)
+    saved_roles = load_jailed_users().get(user_id)
+
+    # Remove jail role first
+    await member.remove_roles(jail_role, reason=f"Unjailed by {moderator}")
+
+    # Restore original roles if they were saved
+    if saved_roles is not None:
+        roles_to_add = [role for role in map(guild.get_role, saved_roles) if role]
+
+        if roles_to_add:
+            await member.add_roles(*roles_to_add, reason=f"Restored original roles - Unjailed by {moderator}")
+
+        # Remove user from jailed data, re-read so entries saved for other
+        # members while the role changes were in flight are kept
+        jailed_data = load_jailed_users()
+        jailed_data.pop(user_id, None)
+        save_jailed_users(jailed_data)
+
+        restored_roles = ", ".join([role.name for role in roles_to_add])
+    else:
+        # No saved roles found - user gets no additional roles (just removed from jail)
+        restored_roles = message(locale, 'no_saved_roles')
+
+    logger.info(f"User {member} unjailed by {moderator}, restored roles: {restored_roles}")
+    return embed(locale, 'unjailed', member=member.mention, moderator=moderator.mention, roles=restored_roles)
+
+
+async def unmute_member(guild, member, moderator, settings, locale: str = 'fr') -> discord.Embed:
+    """Unmute a user by removing the mute role."""
+    mute_role = guild.get_role(settings.mute_role_id)
+
+    if not mute_role:
+        raise ActionError(message(locale, 'mute_role_missing'))
+
+    # Check if user is muted
+    if mute_role not in member.roles:
+        raise ActionError(message(locale, 'not_muted', member=member.mention))
+
+    await member.remove_roles(mute_role, reason=f"Unmuted by {moderator}")
+
+    logger.info(f"User {member} unmuted by {moderator}")
+    return embed(locale, 'unmuted', member=member.mention, moderator=moderator.mention)
+
+
+async def auto_mute_member(member, settings) -> bool:
+    """
+    Mute a member caught spamming admin commands.
+
+    Returns:
+        True if the member was muted, False if the mute role is missing or
+        the member is already muted
+    """
+    mute_role = member.guild.get_role(settings.mute_role_id)
+    if not mute_role or mute_role in member.roles:
+        return False
+    await member.add_roles(mute_role, reason="Auto-muted for spamming admin commands")
+    logger.info(f"User {member} auto-muted for spamming admin commands")
+    return True
+
+
+def verification_status(member, entry_role_id, verified_role_id):
+    """
+    Return the verification state of a member.
+
+    Returns:
+        (state, has entry role, has verified role) where state is
+        'verified', 'pending' or 'unknown'
+    """
+    role_ids = {role.id for role in member.roles}
+    has_entry = entry_role_id in role_ids
+    has_verified = verified_role_id in role_ids
+
+    if has_verified:
+        state = 'verified'
+    elif has_entry:
+        state = 'pending'
+    else:
+        state = 'unknown'
+    return state, has_entry, has_verified
+
+
+def status_embed(guild, member, settings, locale: str = 'fr') -> discord.Embed:
+    """Build the verification status embed of a user."""
+    state, _, _ = verification_status(member, settings.entry_role_id, settings.verified_role_id)
+    return embed(locale, f'status_{state}', member=member.mention)
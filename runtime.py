@@ -0,0 +1,83 @@
+"""
+Runtime backends for the Discord Verification Bot
+Picks the fastest installed event loop (uvloop) and JSON library (orjson) at
+startup and falls back to the standard library when they are missing. Install
+them with ``pip install .[speed]``.
+"""
+
+import asyncio
+import importlib
+import json
+import logging
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+EVENT_LOOPS = ('auto', 'uvloop', 'asyncio')
+
+
+def _optional_import(name):
+    """Import a module, returning None if it is not installed."""
+    try:
+        return importlib.import_module(name)
+    except ImportError:
+        return None
+
+
+orjson = _optional_import('orjson')
+
+if orjson is not None:
+    JSON_BACKEND = 'orjson'
+
+    def json_loads(data):
+        """Decode JSON from str or bytes."""
+        return orjson.loads(data)
+
+    def json_dumps(obj) -> str:
+        """Encode an object to a JSON string."""
+        return orjson.dumps(obj).decode('utf-8')
+else:
+    JSON_BACKEND = 'json'
+
+    def json_loads(data):
+        """Decode JSON from str or bytes."""
+        return json.loads(data)
+
+    def json_dumps(obj) -> str:
+        """Encode an object to a JSON string."""
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=True)
+
+
+def event_loop_factory(preference: str = 'auto'):
+    """
+    Return the event loop factory for a preference (auto, uvloop or asyncio).
+
+    Returns:
+        (factory, name) where factory is None for the stock asyncio loop
+    """
+    if preference not in EVENT_LOOPS:
+        logger.warning(f"Unknown EVENT_LOOP '{preference}', expected one of {list(EVENT_LOOPS)}; using auto")
+        preference = 'auto'
+
+    if preference != 'asyncio':
+        uvloop = _optional_import('uvloop')
+        if uvloop is not None:
+            return uvloop.new_event_loop, 'uvloop'
+        if preference == 'uvloop':
+            logger.warning("uvloop requested but not installed, falling back to asyncio")
+    return None, 'asyncio'
+
+
+def describe() -> str:
+    """Describe the selected JSON backends for the startup log."""
+    gateway_json = 'orjson' if discord.utils.HAS_ORJSON else 'json'
+    return f"JSON: {JSON_BACKEND} (gateway: {gateway_json})"
+
+
+def run(coro, preference: str = 'auto'):
+    """Run a coroutine to completion on the preferred event loop."""
+    factory, name = event_loop_factory(preference)
+    logger.info(f"Event loop: {name}, {describe()}")
+    with asyncio.Runner(loop_factory=factory) as runner:
+        return runner.run(coro)
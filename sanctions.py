@@ -0,0 +1,157 @@
+"""
+Per-guild sets of jailed and muted members
+Kept up to date from member events and from the moderation commands, so
+listing the sanctioned members of a guild costs the number of sanctioned
+members instead of a scan of the whole member list.
+
+Members are not chunked at startup, so the sets of a guild only cover its
+cached members until ensure_complete() has loaded the full member list.
+"""
+
+import asyncio
+import logging
+from typing import Dict, Optional, Set
+
+import discord
+
+logger = logging.getLogger(__name__)
+
+# Sanction kinds and the guild setting holding their role
+SANCTION_ROLES = {
+    'jailed': 'jail_role_id',
+    'muted': 'mute_role_id',
+}
+
+# Effect of a successful role action on the sanctions: (kind, sanctioned)
+ACTION_EFFECTS = {
+    'hebs': ('jailed', True),
+    'unhebs': ('jailed', False),
+    'mute': ('muted', True),
+    'unmute': ('muted', False),
+}
+
+
+class GuildSanctions:
+    """Jailed and muted member IDs of one guild, for the role IDs they were built with."""
+
+    def __init__(self, role_ids: Dict[str, Optional[int]]):
+        """Initialize empty sets for the given role IDs, keyed by sanction kind."""
+        self.role_ids = role_ids
+        self.members: Dict[str, Set[int]] = {kind: set() for kind in SANCTION_ROLES}
+
+    def update(self, member):
+        """Recompute the sanctions of one member from its roles."""
+        for kind, role_id in self.role_ids.items():
+            if role_id is not None and member.get_role(role_id) is not None:
+                self.members[kind].add(member.id)
+            else:
+                self.members[kind].discard(member.id)
+
+    def discard(self, member_id: int):
+        """Forget a member, e.g. when they leave the guild."""
+        for members in self.members.values():
+            members.discard(member_id)
+
+
+class SanctionIndex:
+    """Sanctioned members of every guild, kept up to date from member events."""
+
+    def __init__(self, guild_settings):
+        """
+        Initialize with no guilds indexed.
+
+        Args:
+            guild_settings: GuildSettingsStore the role IDs are read from
+        """
+        self.guild_settings = guild_settings
+        self.guilds: Dict[int, GuildSanctions] = {}
+
+    def attach(self, bot):
+        """Register the listeners that keep the sets up to date."""
+        for listener in (self.on_guild_available, self.on_guild_join, self.on_guild_chunked, self.on_guild_remove,
+                         self.on_member_join, self.on_member_remove, self.on_member_update):
+            bot.add_listener(listener)
+
+    def _role_ids(self, guild_id: int) -> Dict[str, Optional[int]]:
+        settings = self.guild_settings.get(guild_id)
+        return {kind: getattr(settings, setting) for kind, setting in SANCTION_ROLES.items()}
+
+    def build(self, guild) -> GuildSanctions:
+        """(Re)build the sets of a guild from the members of its jail and mute roles."""
+        sanctions = self.guilds[guild.id] = GuildSanctions(self._role_ids(guild.id))
+        for kind, role_id in sanctions.role_ids.items():
+            role = guild.get_role(role_id) if role_id is not None else None
+            if role is not None:
+                sanctions.members[kind] = {member.id for member in role.members}
+        logger.info(
+            f"Indexed {len(sanctions.members['jailed'])} jailed and "
+            f"{len(sanctions.members['muted'])} muted members of guild {guild.id}"
+        )
+        return sanctions
+
+    def for_guild(self, guild) -> GuildSanctions:
+        """Return the sets of a guild, rebuilding them if its jail or mute role changed."""
+        sanctions = self.guilds.get(guild.id)
+        if sanctions is None or sanctions.role_ids != self._role_ids(guild.id):
+            sanctions = self.build(guild)
+        return sanctions
+
+    def members(self, guild, kind: str) -> Set[int]:
+        """Return the IDs of the guild's members with a sanction ('jailed' or 'muted')."""
+        return self.for_guild(guild).members[kind]
+
+    async def ensure_complete(self, guild) -> bool:
+        """
+        Load the guild's full member list if it is not cached yet and rebuild its sets.
+
+        Returns:
+            True if the sets cover every member, False if the member list
+            could not be loaded and they only cover the cached members
+        """
+        if guild.chunked:
+            return True
+        try:
+            await guild.chunk()
+        except (discord.HTTPException, asyncio.TimeoutError) as e:
+            logger.warning(f"Failed to chunk members of guild {guild.id}, sanctions are partial: {e}")
+            return False
+        self.build(guild)
+        return True
+
+    def mark(self, guild, member_id: int, kind: str, sanctioned: bool):
+        """Record a sanction change made by the bot, before the gateway confirms it."""
+        members = self.members(guild, kind)
+        if sanctioned:
+            members.add(member_id)
+        else:
+            members.discard(member_id)
+
+    def apply_action(self, guild, member_id: int, action: str):
+        """Record the effect of a successful role action, if it changes a sanction."""
+        effect = ACTION_EFFECTS.get(action)
+        if effect is not None:
+            self.mark(guild, member_id, *effect)
+
+    async def on_guild_available(self, guild):
+        self.build(guild)
+
+    async def on_guild_join(self, guild):
+        self.build(guild)
+
+    async def on_guild_chunked(self, guild):
+        self.build(guild)
+
+    async def on_guild_remove(self, guild):
+        self.guilds.pop(guild.id, None)
+
+    async def on_member_join(self, member):
+        self.for_guild(member.guild).update(member)
+
+    async def on_member_remove(self, member):
+        sanctions = self.guilds.get(member.guild.id)
+        if sanctions is not None:
+            sanctions.discard(member.id)
+
+    async def on_member_update(self, before, after):
+        if before.roles != after.roles:
+            self.for_guild(after.guild).update(after)
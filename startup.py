@@ -0,0 +1,47 @@
+"""
+Startup timing for the Discord Verification Bot
+Records how long each startup phase takes, from the first import of the entry
+point to the first command served, so restarts after deploys can be measured.
+"""
+
+import logging
+import time
+from typing import List, Tuple
+
+logger = logging.getLogger(__name__)
+
+
+class StartupTimer:
+    """Wall-clock durations of named startup phases."""
+
+    def __init__(self):
+        """Start timing from now."""
+        self.origin = time.perf_counter()
+        self._last = self.origin
+        self.phases: List[Tuple[str, float]] = []
+
+    def __contains__(self, phase: str) -> bool:
+        return any(name == phase for name, _ in self.phases)
+
+    @property
+    def elapsed(self) -> float:
+        """Seconds since the timer started."""
+        return time.perf_counter() - self.origin
+
+    def mark(self, phase: str):
+        """Record the end of a phase, the first time it is reached."""
+        if phase in self:
+            return
+        now = time.perf_counter()
+        self.phases.append((phase, now - self._last))
+        self._last = now
+        logger.info(f"Startup phase '{phase}' took {(self.phases[-1][1]) * 1000:.0f} ms ({now - self.origin:.2f}s since start)")
+
+    def summary(self) -> str:
+        """One line per phase with its duration and the cumulative time."""
+        lines = []
+        total = 0.0
+        for name, duration in self.phases:
+            total += duration
+            lines.append(f"{name:<16} {duration * 1000:8.0f} ms   {total:6.2f}s")
+        return "\n".join(lines)
@@ -0,0 +1,106 @@
+"""Stand-ins for the discord.py objects the moderation commands use."""
+
+import os
+import tempfile
+import types
+
+import discord
+
+from guild_settings import GuildSettings, GuildSettingsStore
+
+CLEAR_USER_ID = 500
+BOT_USER_ID = 900
+
+
+def http_error(status=500, text='boom'):
+    return discord.HTTPException(types.SimpleNamespace(status=status, reason=text), text)
+
+
+def forbidden():
+    return discord.Forbidden(types.SimpleNamespace(status=403, reason='Forbidden'), 'Missing Access')
+
+
+class FakeMessage:
+    """Sent message that records its edits."""
+
+    def __init__(self, message_id, content=None, author_id=BOT_USER_ID, channel=None):
+        self.id = message_id
+        self.content = content
+        self.author = types.SimpleNamespace(id=author_id)
+        self.channel = channel
+        self.created_at = discord.utils.utcnow()
+        self.edited_at = None
+        self.attachments = []
+        self.embeds = []
+        self.reference = None
+        self.edits = []
+
+    async def edit(self, content=None, **kwargs):
+        self.edits.append(content)
+        self.content = content
+
+    async def delete(self, delay=None):
+        pass
+
+
+class FakeChannel:
+    """Text channel whose history may fail after a number of messages."""
+
+    def __init__(self, channel_id, count=0, fail_after=None, purge_error=None):
+        self.id = channel_id
+        self.name = f"channel-{channel_id}"
+        self.messages = [FakeMessage(channel_id * 1000 + i, author_id=CLEAR_USER_ID, channel=self)
+                         for i in range(count)]
+        self.fail_after = fail_after
+        self.purge_error = purge_error
+        self.deleted = []
+
+    def permissions_for(self, member):
+        return types.SimpleNamespace(manage_messages=True, read_message_history=True)
+
+    def history(self, **kwargs):
+        return self._history()
+
+    async def _history(self):
+        for position, message in enumerate(self.messages):
+            if position == self.fail_after:
+                raise http_error()
+            yield message
+
+    async def delete_messages(self, messages):
+        self.deleted.extend(messages)
+
+    async def purge(self, limit=None, check=None):
+        if self.purge_error is not None:
+            raise self.purge_error
+        deleted = [message for message in self.messages[:limit] if check(message)]
+        self.deleted.extend(deleted)
+        return deleted
+
+
+class FakeContext:
+    """Command context in one guild that records what it sends."""
+
+    prefix = '+'
+    author = 'moderator'
+
+    def __init__(self, guild):
+        self.guild = guild
+        self.sent = []
+
+    async def send(self, content=None, **kwargs):
+        sent = FakeMessage(len(self.sent) + 1, content)
+        sent.kwargs = kwargs
+        self.sent.append(sent)
+        return sent
+
+
+def make_guild(channels=(), guild_id=1):
+    return types.SimpleNamespace(id=guild_id, text_channels=list(channels), me=object(), filesize_limit=25 * 1024 ** 2)
+
+
+def make_bot(**attributes):
+    """Bot with a settings store whose defaults set the +yisclear user."""
+    path = os.path.join(tempfile.mkdtemp(), 'guild_settings.json')
+    store = GuildSettingsStore(path, defaults=GuildSettings(clear_user_id=CLEAR_USER_ID))
+    return types.SimpleNamespace(guild_settings=store, user=types.SimpleNamespace(id=BOT_USER_ID), **attributes)
@@ -0,0 +1,168 @@
+"""Tests for the per-member action coordinator."""
+
+import asyncio
+import types
+import unittest
+
+from action_coordinator import ACTION_REST_CALLS, ActionCoordinator
+
+
+class FakeGuild:
+    """Guild whose fetch_member returns a fresh member and counts the calls."""
+
+    id = 1
+
+    def __init__(self):
+        self.fetched = 0
+
+    async def fetch_member(self, member_id):
+        self.fetched += 1
+        return types.SimpleNamespace(id=member_id, fresh=True)
+
+
+def cached_member(member_id=10):
+    return types.SimpleNamespace(id=member_id, fresh=False)
+
+
+class ActionCoordinatorTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.coordinator = ActionCoordinator()
+        self.guild = FakeGuild()
+
+    async def test_identical_actions_share_one_run(self):
+        calls = []
+
+        async def action(member):
+            calls.append(member)
+            await asyncio.sleep(0.01)
+            return 'done'
+
+        member = cached_member()
+        results = await asyncio.gather(
+            self.coordinator.run(self.guild, member, 'men', action),
+            self.coordinator.run(self.guild, member, 'men', action),
+        )
+
+        self.assertEqual(results, ['done', 'done'])
+        self.assertEqual(len(calls), 1)
+        self.assertEqual(self.coordinator.deduplicated, 1)
+        self.assertEqual(self.coordinator.rest_calls_saved, ACTION_REST_CALLS['men'])
+
+    async def test_conflicting_actions_run_one_after_the_other(self):
+        events = []
+
+        def action(name):
+            async def run(member):
+                events.append(f"{name} start")
+                await asyncio.sleep(0.01)
+                events.append(f"{name} end")
+                return member
+            return run
+
+        member = cached_member()
+        jailed, unjailed = await asyncio.gather(
+            self.coordinator.run(self.guild, member, 'hebs', action('hebs')),
+            self.coordinator.run(self.guild, member, 'unhebs', action('unhebs')),
+        )
+
+        self.assertEqual(events, ['hebs start', 'hebs end', 'unhebs start', 'unhebs end'])
+        self.assertEqual(self.coordinator.serialized, 1)
+        # The queued action must not see the roles cached before the first one
+        self.assertFalse(jailed.fresh)
+        self.assertTrue(unjailed.fresh)
+        self.assertEqual(self.guild.fetched, 1)
+
+    async def test_action_after_a_recent_one_fetches_the_member(self):
+        async def action(member):
+            return member
+
+        member = cached_member()
+        first = await self.coordinator.run(self.guild, member, 'hebs', action)
+        second = await self.coordinator.run(self.guild, member, 'unhebs', action)
+
+        self.assertFalse(first.fresh)
+        self.assertTrue(second.fresh)
+
+    async def test_other_members_use_the_cached_member(self):
+        async def action(member):
+            return member
+
+        await self.coordinator.run(self.guild, cached_member(10), 'hebs', action)
+        other = await self.coordinator.run(self.guild, cached_member(11), 'hebs', action)
+
+        self.assertFalse(other.fresh)
+        self.assertEqual(self.guild.fetched, 0)
+
+    async def test_exception_is_raised_to_every_caller(self):
+        async def action(member):
+            await asyncio.sleep(0.01)
+            raise ValueError("no jail role")
+
+        member = cached_member()
+        results = await asyncio.gather(
+            self.coordinator.run(self.guild, member, 'hebs', action),
+            self.coordinator.run(self.guild, member, 'hebs', action),
+            return_exceptions=True,
+        )
+
+        self.assertEqual(len(results), 2)
+        for result in results:
+            self.assertIsInstance(result, ValueError)
+
+    async def test_leader_cancellation_is_raised_to_joiners(self):
+        started = asyncio.Event()
+
+        async def action(member):
+            started.set()
+            await asyncio.sleep(10)
+
+        member = cached_member()
+        leader = asyncio.create_task(self.coordinator.run(self.guild, member, 'hebs', action))
+        await started.wait()
+        joiner = asyncio.create_task(self.coordinator.run(self.guild, member, 'hebs', action))
+        await asyncio.sleep(0)
+        leader.cancel()
+
+        with self.assertRaises(asyncio.CancelledError):
+            await leader
+        with self.assertRaises(asyncio.CancelledError):
+            await joiner
+        self.assertEqual(self.coordinator.deduplicated, 1)
+
+    async def test_joiner_cancellation_does_not_cancel_the_leader(self):
+        started = asyncio.Event()
+
+        async def action(member):
+            started.set()
+            await asyncio.sleep(0.02)
+            return 'done'
+
+        member = cached_member()
+        leader = asyncio.create_task(self.coordinator.run(self.guild, member, 'hebs', action))
+        await started.wait()
+        joiner = asyncio.create_task(self.coordinator.run(self.guild, member, 'hebs', action))
+        await asyncio.sleep(0)
+        joiner.cancel()
+
+        self.assertEqual(await leader, 'done')
+        with self.assertRaises(asyncio.CancelledError):
+            await joiner
+
+    async def test_state_is_released_after_the_last_action(self):
+        async def action(member):
+            await asyncio.sleep(0.01)
+
+        member = cached_member()
+        await asyncio.gather(
+            self.coordinator.run(self.guild, member, 'hebs', action),
+            self.coordinator.run(self.guild, member, 'unhebs', action),
+        )
+
+        self.assertEqual(self.coordinator._in_flight, {})
+        self.assertEqual(self.coordinator._locks, {})
+        self.assertEqual(dict(self.coordinator._users), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
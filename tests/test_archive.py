@@ -0,0 +1,81 @@
+"""Tests for the streaming archive-then-purge of +yisclear archive."""
+
+import gzip
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from archive import MessageArchive, archive_and_purge, snowflake_window
+from cogs.moderation import ModerationCog
+from responses import message
+from tests.fakes import CLEAR_USER_ID, FakeChannel, FakeContext, make_bot, make_guild
+
+
+def from_clear_user(message):
+    return message.author.id == CLEAR_USER_ID
+
+
+class ArchiveAndPurgeTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.path = os.path.join(tempfile.mkdtemp(), 'archive.jsonl.gz')
+
+    async def test_messages_are_archived_in_batches_then_deleted(self):
+        channel = FakeChannel(1, count=250)
+        batches = []
+
+        with MessageArchive(self.path) as archive:
+            result = await archive_and_purge(channel, from_clear_user, archive, *snowflake_window(1),
+                                             on_batch=lambda **counts: batches.append(counts))
+
+        self.assertEqual(result, (250, 0))
+        self.assertEqual([batch['archived'] for batch in batches], [100, 100, 50])
+        self.assertEqual(len(channel.deleted), 250)
+        with gzip.open(self.path, 'rt', encoding='utf-8') as f:
+            records = [json.loads(line) for line in f]
+        self.assertEqual([record['id'] for record in records], [m.id for m in channel.messages])
+
+    async def test_batch_counts_are_reported_before_the_history_fails(self):
+        channel = FakeChannel(1, count=250, fail_after=210)
+        batches = []
+
+        with MessageArchive(self.path) as archive, self.assertRaises(Exception):
+            await archive_and_purge(channel, from_clear_user, archive, *snowflake_window(1),
+                                    on_batch=lambda **counts: batches.append(counts))
+
+        self.assertEqual(sum(batch['deleted'] for batch in batches), 200)
+        self.assertEqual(archive.count, 200)
+
+
+class ClearArchiveCommandTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.cog = ModerationCog(make_bot())
+        directory = tempfile.mkdtemp()
+        patcher = mock.patch('archive.ARCHIVES_DIR', directory)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    async def test_counts_of_a_failed_channel_are_kept(self):
+        failing = FakeChannel(1, count=250, fail_after=210)
+        ctx = FakeContext(make_guild([failing, FakeChannel(2, count=30)]))
+
+        await self.cog.clear_messages.callback(self.cog, ctx, None, 'archive')
+
+        status = ctx.sent[0]
+        self.assertEqual(status.content, message('fr', 'archived', archived=230, deleted=230, channels=2, failed=0))
+
+    async def test_a_count_is_rejected_in_archive_mode(self):
+        channel = FakeChannel(1, count=10)
+        ctx = FakeContext(make_guild([channel]))
+
+        await self.cog.clear_messages.callback(self.cog, ctx, 50, 'archive')
+
+        self.assertEqual([sent.content for sent in ctx.sent], [message('fr', 'clear_usage', prefix='+')])
+        self.assertEqual(channel.deleted, [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,35 @@
+"""Tests for the environment configuration."""
+
+import os
+import unittest
+from unittest import mock
+
+from config import Config
+
+
+class ConfigTest(unittest.TestCase):
+
+    def load(self, **env):
+        with mock.patch.dict(os.environ, {'DISCORD_TOKEN': 'token', **env}, clear=True), \
+                mock.patch('config.load_dotenv'):
+            return Config()
+
+    def test_starts_without_role_ids(self):
+        config = self.load()
+
+        self.assertFalse(hasattr(config, 'ENTRY_ROLE_ID'))
+        self.assertEqual(config.COMMAND_PREFIX, '!')
+
+    def test_token_is_required(self):
+        with mock.patch.dict(os.environ, {}, clear=True), mock.patch('config.load_dotenv'), \
+                self.assertRaises(ValueError):
+            Config()
+
+    def test_snapshot_interval_must_be_positive(self):
+        for interval in ('0', '-5', 'soon'):
+            with self.subTest(interval), self.assertRaises(ValueError):
+                self.load(SNAPSHOT_INTERVAL=interval)
+
+
+if __name__ == '__main__':
+    unittest.main()
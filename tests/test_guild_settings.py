@@ -0,0 +1,94 @@
+"""Tests for the per-guild settings store."""
+
+import json
+import os
+import tempfile
+import unittest
+
+from guild_settings import GuildSettings, GuildSettingsStore
+
+
+class MergedValidationTest(unittest.TestCase):
+
+    def test_values_are_converted(self):
+        settings = GuildSettings().merged({'spam_threshold': '5', 'jail_role_id': '123', 'prefix': '?'})
+
+        self.assertEqual(settings.spam_threshold, 5)
+        self.assertEqual(settings.jail_role_id, 123)
+        self.assertEqual(settings.prefix, '?')
+
+    def test_optional_settings_accept_none(self):
+        settings = GuildSettings(jail_role_id=1, locale='en').merged({'jail_role_id': None, 'locale': None})
+
+        self.assertIsNone(settings.jail_role_id)
+        self.assertIsNone(settings.locale)
+
+    def test_invalid_values_are_rejected(self):
+        cases = [
+            {'prefix': None},
+            {'prefix': ''},
+            {'prefix': '   '},
+            {'prefix': 3},
+            {'spam_threshold': None},
+            {'spam_threshold': '0'},
+            {'spam_window': -5},
+            {'spam_window': 'soon'},
+            {'spam_window': True},
+            {'mute_role_id': 'role'},
+            {'locale': 'de'},
+            {'entry_role_id': 5, 'verified_role_id': '5'},
+        ]
+        for overrides in cases:
+            with self.subTest(overrides), self.assertRaises(ValueError):
+                GuildSettings().merged(overrides)
+
+    def test_same_entry_and_verified_role_is_rejected(self):
+        with self.assertRaises(ValueError):
+            GuildSettings(entry_role_id=5).merged({'verified_role_id': 5})
+
+    def test_unknown_keys_are_ignored(self):
+        self.assertEqual(GuildSettings().merged({'colour': 'blue'}), GuildSettings())
+
+
+class GuildSettingsStoreTest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, 'guild_settings.json')
+        self.store = GuildSettingsStore(self.path, GuildSettings())
+
+    def write(self, data):
+        with open(self.path, 'w') as f:
+            json.dump(data, f)
+
+    def test_update_rejects_invalid_values_and_keeps_the_settings(self):
+        self.store.update(1, prefix='?')
+
+        with self.assertRaises(ValueError):
+            self.store.update(1, prefix=None)
+
+        self.assertEqual(self.store.get(1).prefix, '?')
+        with open(self.path) as f:
+            self.assertEqual(json.load(f)['guilds']['1']['prefix'], '?')
+
+    def test_invalid_file_keeps_the_previous_settings(self):
+        self.write({'guilds': {'1': {'spam_window': 10}}})
+        self.assertTrue(self.store.load())
+
+        self.write({'guilds': {'1': {'spam_window': 0}}})
+        self.assertFalse(self.store.load())
+
+        self.assertEqual(self.store.get(1).spam_window, 10)
+
+    def test_defaults_apply_to_unknown_guilds(self):
+        self.write({'defaults': {'prefix': '$'}, 'guilds': {'1': {'locale': 'en'}}})
+        self.store.load()
+
+        self.assertEqual(self.store.get(2).prefix, '$')
+        self.assertEqual(self.store.get(1).prefix, '$')
+        self.assertEqual(self.store.get(1).locale, 'en')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,159 @@
+"""Tests for the member name index and the IndexedMember converter."""
+
+import types
+import unittest
+from unittest import mock
+
+import discord
+from discord.ext import commands
+
+from member_index import GuildMemberIndex, IndexedMember, MemberIndex
+
+
+def make_member(member_id, name, guild=None, nick=None):
+    return types.SimpleNamespace(id=member_id, name=name, global_name=None, nick=nick, discriminator='0',
+                                 guild=guild)
+
+
+class FakeGuild:
+    """Guild with a member cache and a fetch_member that counts the calls."""
+
+    id = 1
+
+    def __init__(self, cached=(), remote=()):
+        self.cached = {member.id: member for member in cached}
+        self.remote = {member.id: member for member in remote}
+        self.fetched = 0
+
+    def get_member(self, member_id):
+        return self.cached.get(member_id)
+
+    async def fetch_member(self, member_id):
+        self.fetched += 1
+        try:
+            return self.remote[member_id]
+        except KeyError:
+            raise discord.NotFound(types.SimpleNamespace(status=404, reason='Not Found'), 'Unknown Member')
+
+
+class MemberIndexTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.index = MemberIndex()
+        self.guild = types.SimpleNamespace(id=1, members=[])
+
+    def member(self, member_id, name, nick=None):
+        member = make_member(member_id, name, self.guild, nick)
+        self.guild.members.append(member)
+        return member
+
+    def test_members_resolve_by_any_of_their_names(self):
+        alice = self.member(10, 'alice', nick='Ally')
+        alice.global_name = 'Alice Liddell'
+        self.index.build(self.guild)
+
+        for argument in ('alice', '@ALICE', 'ally', 'alice liddell'):
+            with self.subTest(argument):
+                self.assertEqual(self.index.resolve_id(self.guild, argument), 10)
+
+    def test_mentions_and_ids_resolve_without_the_index(self):
+        self.assertEqual(self.index.resolve_id(self.guild, '<@!123456789012345678>'), 123456789012345678)
+        self.assertEqual(self.index.resolve_id(self.guild, '123456789012345678'), 123456789012345678)
+
+    def test_ambiguous_and_unknown_names_do_not_resolve(self):
+        self.member(10, 'sam')
+        self.member(11, 'samuel', nick='Sam')
+        self.index.build(self.guild)
+
+        self.assertIsNone(self.index.resolve_id(self.guild, 'sam'))
+        self.assertIsNone(self.index.resolve_id(self.guild, 'nobody'))
+        self.assertEqual(self.index.resolve_id(self.guild, 'samuel'), 11)
+
+    async def test_member_events_keep_the_index_up_to_date(self):
+        before = self.member(10, 'bob')
+        self.index.build(self.guild)
+
+        after = make_member(10, 'bob', self.guild, nick='Robert')
+        await self.index.on_member_update(before, after)
+        self.assertEqual(self.index.resolve_id(self.guild, 'robert'), 10)
+
+        await self.index.on_member_remove(after)
+        self.assertIsNone(self.index.resolve_id(self.guild, 'bob'))
+        self.assertEqual(len(self.index.guilds[self.guild.id]), 0)
+
+
+class IndexedMemberTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.index = MemberIndex()
+
+    def context(self, guild):
+        return types.SimpleNamespace(bot=types.SimpleNamespace(member_index=self.index), guild=guild)
+
+    async def convert(self, guild, argument, fallback=None):
+        with mock.patch.object(commands.MemberConverter, 'convert', mock.AsyncMock(return_value=fallback)) as slow:
+            member = await IndexedMember().convert(self.context(guild), argument)
+        return member, slow
+
+    async def test_indexed_name_resolves_without_the_fallback(self):
+        guild = FakeGuild()
+        bob = make_member(10, 'bob', guild)
+        guild.cached[10] = bob
+        self.index.for_guild(guild.id).add(10, {'bob'})
+
+        member, slow = await self.convert(guild, '@Bob')
+
+        self.assertIs(member, bob)
+        slow.assert_not_called()
+
+    async def test_uncached_member_is_fetched_once(self):
+        guild = FakeGuild()
+        bob = make_member(10, 'bob', guild)
+        guild.remote[10] = bob
+        self.index.restore(guild.id, GuildMemberIndex.from_names({10: {'bob'}}))
+
+        member, slow = await self.convert(guild, 'bob')
+
+        self.assertIs(member, bob)
+        self.assertEqual(guild.fetched, 1)
+        slow.assert_not_called()
+
+    async def test_renamed_member_is_not_returned_for_its_old_name(self):
+        guild = FakeGuild()
+        # Restored from a snapshot taken before member 10 was renamed from bob
+        renamed = make_member(10, 'robert', guild)
+        guild.remote[10] = renamed
+        self.index.restore(guild.id, GuildMemberIndex.from_names({10: {'bob'}}))
+        other_bob = make_member(11, 'bob', guild)
+
+        member, slow = await self.convert(guild, 'bob', fallback=other_bob)
+
+        self.assertIs(member, other_bob)
+        slow.assert_awaited_once()
+        index = self.index.guilds[guild.id]
+        self.assertEqual(index.lookup('robert'), {10})
+        self.assertEqual(index.lookup('bob'), {11})
+
+    async def test_member_that_left_is_not_found_without_the_fallback(self):
+        guild = FakeGuild()
+        self.index.restore(guild.id, GuildMemberIndex.from_names({10: {'bob'}}))
+
+        with self.assertRaises(commands.MemberNotFound):
+            await self.convert(guild, 'bob')
+
+        self.assertEqual(self.index.guilds[guild.id].lookup('bob'), set())
+        self.assertEqual(guild.fetched, 1)
+
+    async def test_id_resolves_whatever_the_name(self):
+        guild = FakeGuild()
+        bob = make_member(123456789012345678, 'bob', guild)
+        guild.cached[bob.id] = bob
+
+        member, slow = await self.convert(guild, f'<@{bob.id}>')
+
+        self.assertIs(member, bob)
+        slow.assert_not_called()
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+"""Tests for the sampling profiler and the !profile command."""
+
+import asyncio
+import os
+import tempfile
+import threading
+import types
+import unittest
+from unittest import mock
+
+from cogs.diagnostics import DiagnosticsCog
+from guild_settings import GuildSettingsStore
+from profiling import Profiler
+from responses import message
+
+
+class FakeContext:
+    """Context that records what the command sends."""
+
+    guild = None
+    author = 'admin'
+
+    def __init__(self):
+        self.sent = []
+
+    async def send(self, content=None, **kwargs):
+        self.sent.append(content)
+
+
+class ProfileCommandTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_second_profile_is_refused_until_the_file_is_written(self):
+        profiler = Profiler(slow_threshold=0)
+        writing = threading.Event()
+        release = threading.Event()
+        directory = tempfile.mkdtemp()
+
+        def sample(seconds):
+            # Stands in for the profile file write at the end of sample()
+            self.assertTrue(profiler.sampling)
+            writing.set()
+            release.wait(5)
+            path = os.path.join(directory, 'profile.folded')
+            open(path, 'w').close()
+            return path
+
+        profiler.sample = sample
+        bot = types.SimpleNamespace(profiler=profiler, guild_settings=GuildSettingsStore(os.path.join(directory, 's')))
+        cog = DiagnosticsCog(bot)
+        first, second = FakeContext(), FakeContext()
+
+        running = asyncio.create_task(cog.run_profile.callback(cog, first, 1))
+        await asyncio.to_thread(writing.wait, 5)
+        await cog.run_profile.callback(cog, second, 1)
+        release.set()
+        await running
+
+        self.assertEqual(second.sent, [message(cog.locale(None), 'profile_running')])
+        self.assertEqual(len(first.sent), 2)
+        self.assertFalse(profiler.sampling)
+
+    def test_sample_leaves_the_flag_to_the_caller(self):
+        profiler = Profiler(slow_threshold=0)
+        profiler._loop_thread_id = threading.get_ident()
+        profiler.sampling = True
+        directory = tempfile.mkdtemp()
+
+        with mock.patch('profiling.PROFILES_DIR', directory):
+            path = profiler.sample(0.01, interval=0.001)
+
+        self.assertTrue(os.path.exists(path))
+        self.assertTrue(profiler.sampling)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,110 @@
+"""Tests for the rate-capped progress message of long commands."""
+
+import asyncio
+import unittest
+from collections import Counter
+from unittest import mock
+
+from cogs.moderation import ModerationCog
+from progress import ProgressReporter
+from tests.fakes import FakeChannel, FakeContext, forbidden, http_error, make_bot, make_guild
+
+
+class FakeClock:
+    """Replacement for time.monotonic that only moves when told to."""
+
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+class ProgressReporterTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.clock = FakeClock()
+        patcher = mock.patch('progress.time.monotonic', self.clock)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.ctx = FakeContext(guild=None)
+
+    async def test_edits_are_capped_to_one_per_interval(self):
+        progress = ProgressReporter(self.ctx, 'en', 'Working', total=1000, interval=3.0)
+        await progress.start()
+
+        for _ in range(500):
+            progress.advance(done=1, deleted=2)
+            self.clock.now += 0.001
+        await asyncio.sleep(0)
+        self.assertEqual(progress.message.edits, [])
+
+        self.clock.now += 3.0
+        for _ in range(500):
+            progress.advance(done=1, deleted=2)
+        await asyncio.sleep(0)
+        self.assertEqual(len(progress.message.edits), 1)
+        self.assertEqual(progress.counts, Counter(deleted=2000))
+
+        await progress.finish('Done')
+        self.assertEqual(progress.message.edits[-1], 'Done')
+        self.assertEqual(len(self.ctx.sent), 1)
+
+    async def test_no_second_edit_while_one_is_in_flight(self):
+        progress = ProgressReporter(self.ctx, 'en', 'Working', interval=1.0)
+        await progress.start()
+        release = asyncio.Event()
+        edits = []
+
+        async def slow_edit(content=None, **kwargs):
+            edits.append(content)
+            await release.wait()
+
+        progress.message.edit = slow_edit
+        for _ in range(5):
+            self.clock.now += 1.0
+            progress.advance(deleted=1)
+            await asyncio.sleep(0)
+
+        self.assertEqual(len(edits), 1)
+        release.set()
+        await progress.finish('Done')
+        self.assertEqual(edits[-1], 'Done')
+
+    async def test_summary_is_sent_when_the_status_message_is_gone(self):
+        progress = ProgressReporter(self.ctx, 'en', 'Working')
+        await progress.start()
+
+        async def gone(content=None, **kwargs):
+            raise http_error(404, 'Unknown Message')
+
+        progress.message.edit = gone
+        summary = await progress.finish('Done')
+
+        self.assertEqual([sent.content for sent in self.ctx.sent][-1], 'Done')
+        self.assertIs(summary, self.ctx.sent[-1])
+
+
+class ClearProgressTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_failed_channels_are_counted(self):
+        reporters = []
+
+        class RecordingReporter(ProgressReporter):
+            def __init__(self, *args, **kwargs):
+                super().__init__(*args, **kwargs)
+                reporters.append(self)
+
+        channels = [FakeChannel(1, count=5), FakeChannel(2, purge_error=forbidden()),
+                    FakeChannel(3, purge_error=http_error())]
+        cog = ModerationCog(make_bot())
+
+        with mock.patch('cogs.moderation.ProgressReporter', RecordingReporter):
+            await cog.clear_messages.callback(cog, FakeContext(make_guild(channels)), None)
+
+        self.assertEqual(reporters[0].done, 3)
+        self.assertEqual(reporters[0].counts, Counter(deleted=5, failed=2))
+
+
+if __name__ == '__main__':
+    unittest.main()
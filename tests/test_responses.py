@@ -0,0 +1,76 @@
+"""Tests for the prebuilt response catalog."""
+
+import unittest
+
+import discord
+
+from responses import EMBEDS, LOCALES, MESSAGES, embed
+
+
+class CatalogTest(unittest.TestCase):
+
+    def test_locales_have_the_same_keys(self):
+        for catalog in (MESSAGES, EMBEDS):
+            keys = [set(catalog[locale]) for locale in LOCALES]
+            self.assertTrue(all(locale_keys == keys[0] for locale_keys in keys))
+
+    def test_render_matches_an_embed_built_from_scratch(self):
+        expected = discord.Embed(
+            title="🔒 Utilisateur Emprisonné",
+            description="<@1> a été mis en prison !",
+            color=discord.Color.red()
+        )
+        expected.add_field(name="Emprisonné par", value="<@2>", inline=True)
+        expected.add_field(name="Raison", value="spam", inline=True)
+
+        rendered = embed('fr', 'jailed', member='<@1>', moderator='<@2>', reason='spam')
+
+        self.assertEqual(rendered.to_dict(), expected.to_dict())
+        self.assertEqual(rendered.title, expected.title)
+        self.assertEqual([field.value for field in rendered.fields], ['<@2>', 'spam'])
+
+    def test_renders_do_not_share_values(self):
+        first = embed('fr', 'jailed', member='<@1>', moderator='<@2>', reason='spam')
+        second = embed('fr', 'jailed', member='<@3>', moderator='<@2>', reason='flood')
+
+        self.assertEqual(first.to_dict()['fields'][1]['value'], 'spam')
+        self.assertEqual(second.to_dict()['fields'][1]['value'], 'flood')
+
+    def test_cached_pages_are_reused_per_prefix(self):
+        self.assertIs(embed('en', 'help', prefix='+'), embed('en', 'help', prefix='+'))
+        self.assertIsNot(embed('en', 'help', prefix='+'), embed('en', 'help', prefix='!'))
+
+
+class CachedEmbedTest(unittest.TestCase):
+
+    def setUp(self):
+        self.embed = embed('en', 'help', prefix='+')
+
+    def test_mutation_is_refused(self):
+        mutations = {
+            'assign title': lambda: setattr(self.embed, 'title', 'changed'),
+            'assign colour': lambda: setattr(self.embed, 'colour', discord.Color.red()),
+            'delete title': lambda: delattr(self.embed, 'title'),
+            'add_field': lambda: self.embed.add_field(name='a', value='b'),
+            'clear_fields': self.embed.clear_fields,
+            'set_footer': lambda: self.embed.set_footer(text='changed'),
+        }
+        for name, mutate in mutations.items():
+            with self.subTest(name), self.assertRaises(TypeError):
+                mutate()
+
+    def test_copy_is_modifiable_and_leaves_the_payload_alone(self):
+        before = embed('en', 'help', prefix='+').to_dict()['fields'][0]['name']
+
+        copied = self.embed.copy()
+        copied.title = 'changed'
+        copied.set_field_at(0, name='changed', value='changed')
+
+        self.assertNotIsInstance(copied, type(self.embed))
+        self.assertEqual(copied.to_dict()['title'], 'changed')
+        self.assertEqual(embed('en', 'help', prefix='+').to_dict()['fields'][0]['name'], before)
+        self.assertNotEqual(self.embed.title, 'changed')
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,144 @@
+"""Tests for the per-guild sets of jailed and muted members."""
+
+import asyncio
+import types
+import unittest
+
+from cogs.moderation import ModerationCog
+from guild_settings import GuildSettings, GuildSettingsStore
+from responses import message
+from sanctions import SanctionIndex
+from tests.fakes import FakeContext, http_error, make_bot
+
+JAIL_ROLE_ID = 70
+MUTE_ROLE_ID = 71
+
+
+class FakeMember:
+    """Member holding a set of role IDs."""
+
+    def __init__(self, member_id, guild, *role_ids):
+        self.id = member_id
+        self.guild = guild
+        self.roles = set(role_ids)
+
+    def get_role(self, role_id):
+        return role_id if role_id in self.roles else None
+
+
+class FakeGuild:
+    """Guild with a partial member cache until chunk() loads the rest."""
+
+    id = 1
+
+    def __init__(self, chunked=True, chunk_error=None):
+        self.chunked = chunked
+        self.chunk_error = chunk_error
+        self.cached = []
+        self.uncached = []
+
+    def add(self, member_id, *role_ids, cached=True):
+        member = FakeMember(member_id, self, *role_ids)
+        (self.cached if cached else self.uncached).append(member)
+        return member
+
+    def get_role(self, role_id):
+        return types.SimpleNamespace(members=[member for member in self.cached if role_id in member.roles])
+
+    async def chunk(self):
+        if self.chunk_error is not None:
+            raise self.chunk_error
+        self.cached.extend(self.uncached)
+        self.uncached = []
+        self.chunked = True
+
+
+def settings_store(jail_role_id=JAIL_ROLE_ID):
+    return GuildSettingsStore('/nonexistent/guild_settings.json',
+                              defaults=GuildSettings(jail_role_id=jail_role_id, mute_role_id=MUTE_ROLE_ID))
+
+
+class SanctionIndexTest(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        self.store = settings_store()
+        self.sanctions = SanctionIndex(self.store)
+        self.guild = FakeGuild()
+
+    def test_sets_are_built_from_the_role_members(self):
+        self.guild.add(10, JAIL_ROLE_ID)
+        self.guild.add(11, MUTE_ROLE_ID)
+        self.guild.add(12, JAIL_ROLE_ID, MUTE_ROLE_ID)
+        self.guild.add(13)
+
+        self.assertEqual(self.sanctions.members(self.guild, 'jailed'), {10, 12})
+        self.assertEqual(self.sanctions.members(self.guild, 'muted'), {11, 12})
+
+    def test_role_actions_update_the_sets(self):
+        self.sanctions.apply_action(self.guild, 10, 'hebs')
+        self.sanctions.apply_action(self.guild, 11, 'mute')
+        self.sanctions.apply_action(self.guild, 12, 'men')
+        self.assertEqual(self.sanctions.members(self.guild, 'jailed'), {10})
+        self.assertEqual(self.sanctions.members(self.guild, 'muted'), {11})
+
+        self.sanctions.apply_action(self.guild, 10, 'unhebs')
+        self.assertEqual(self.sanctions.members(self.guild, 'jailed'), set())
+
+    async def test_member_events_update_the_sets(self):
+        before = self.guild.add(10)
+        self.sanctions.build(self.guild)
+
+        after = FakeMember(10, self.guild, JAIL_ROLE_ID)
+        await self.sanctions.on_member_update(before, after)
+        self.assertEqual(self.sanctions.members(self.guild, 'jailed'), {10})
+
+        await self.sanctions.on_member_remove(after)
+        self.assertEqual(self.sanctions.members(self.guild, 'jailed'), set())
+
+    def test_sets_are_rebuilt_when_the_jail_role_changes(self):
+        self.guild.add(10, JAIL_ROLE_ID)
+        self.guild.add(11, 72)
+        self.assertEqual(self.sanctions.members(self.guild, 'jailed'), {10})
+
+        self.store.defaults = GuildSettings(jail_role_id=72, mute_role_id=MUTE_ROLE_ID)
+
+        self.assertEqual(self.sanctions.members(self.guild, 'jailed'), {11})
+
+    async def test_ensure_complete_loads_the_uncached_members(self):
+        guild = FakeGuild(chunked=False)
+        guild.add(10, JAIL_ROLE_ID)
+        guild.add(11, JAIL_ROLE_ID, cached=False)
+        self.assertEqual(self.sanctions.members(guild, 'jailed'), {10})
+
+        self.assertTrue(await self.sanctions.ensure_complete(guild))
+
+        self.assertEqual(self.sanctions.members(guild, 'jailed'), {10, 11})
+
+    async def test_ensure_complete_reports_a_failed_chunk(self):
+        for error in (http_error(), asyncio.TimeoutError()):
+            with self.subTest(type(error).__name__):
+                guild = FakeGuild(chunked=False, chunk_error=error)
+                guild.add(10, JAIL_ROLE_ID)
+
+                self.assertFalse(await self.sanctions.ensure_complete(guild))
+                self.assertEqual(self.sanctions.members(guild, 'jailed'), {10})
+
+
+class SanctionListCommandTest(unittest.IsolatedAsyncioTestCase):
+
+    async def test_partial_list_is_flagged(self):
+        guild = FakeGuild(chunked=False, chunk_error=http_error())
+        guild.add(10, JAIL_ROLE_ID)
+        store = settings_store()
+        cog = ModerationCog(make_bot(sanctions=SanctionIndex(store)))
+        cog.bot.guild_settings = store
+        ctx = FakeContext(guild)
+
+        await cog.list_jailed.callback(cog, ctx)
+
+        self.assertEqual(ctx.sent[0].content, message('fr', 'sanctions_partial'))
+        self.assertIn('<@10>', ctx.sent[1].kwargs['embed'].description)
+
+
+if __name__ == '__main__':
+    unittest.main()
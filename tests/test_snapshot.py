@@ -0,0 +1,106 @@
+"""Tests for the warm-restart snapshot codec and the member index restore."""
+
+import os
+import struct
+import tempfile
+import unittest
+import zlib
+
+from member_index import GuildMemberIndex, MemberIndex
+from snapshot import (SNAPSHOT_MAGIC, SNAPSHOT_VERSION, GuildState, SnapshotError, decode, encode, read_snapshot,
+                      write_snapshot)
+
+
+def sample_state():
+    return {
+        100: GuildState(
+            spam={1: [1000.5, 1001.25], 2: [1002.0]},
+            names={10: {'alice', 'ally'}, 11: {'bob'}, 12: {'élodie'}},
+        ),
+        200: GuildState(),
+    }
+
+
+class SnapshotCodecTest(unittest.TestCase):
+
+    def test_round_trip(self):
+        written_at, guilds = decode(encode(sample_state(), written_at=1234.5))
+
+        self.assertEqual(written_at, 1234.5)
+        self.assertEqual(guilds, sample_state())
+
+    def test_names_containing_a_separator_are_dropped(self):
+        cases = {
+            'member separator': {10: {'a\x1eb', 'alice'}, 11: {'bob'}},
+            'name separator': {10: {'alice'}, 11: {'b\x1fc', 'bob'}},
+        }
+        for name, names in cases.items():
+            with self.subTest(name):
+                _, guilds = decode(encode({1: GuildState(names=names)}))
+
+                self.assertEqual(guilds[1].names, {10: {'alice'}, 11: {'bob'}})
+
+    def test_members_without_names_decode_without_names(self):
+        state = {1: GuildState(names={10: set(), 11: {'bob'}, 12: {''}, 13: set()})}
+
+        _, guilds = decode(encode(state))
+
+        self.assertEqual(guilds[1].names, {10: set(), 11: {'bob'}, 12: set(), 13: set()})
+
+    def test_misaligned_names_are_rejected(self):
+        # One member ID but a names blob holding two members
+        blob = 'alice\x1ebob'.encode('utf-8')
+        body = (struct.pack('<QIII', 1, 0, 0, 1) + struct.pack('<Q', 10)
+                + struct.pack('<I', len(blob)) + blob)
+        data = struct.pack('<4sHdI', SNAPSHOT_MAGIC, SNAPSHOT_VERSION, 0.0, 1) + zlib.compress(body)
+
+        with self.assertRaises(SnapshotError):
+            decode(data)
+
+    def test_other_files_are_rejected(self):
+        data = encode(sample_state())
+        cases = {
+            'truncated': data[:5],
+            'magic': b'XXXX' + data[4:],
+            'version': data[:4] + struct.pack('<H', SNAPSHOT_VERSION + 1) + data[6:],
+            'corrupt body': data[:struct.calcsize('<4sHdI')] + b'not zlib',
+        }
+        for name, corrupted in cases.items():
+            with self.subTest(name), self.assertRaises(SnapshotError):
+                decode(corrupted)
+
+    def test_file_round_trip(self):
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'state.snapshot')
+            with self.assertRaises(SnapshotError):
+                read_snapshot(path)
+
+            write_snapshot(path, sample_state())
+            _, guilds = read_snapshot(path)
+
+        self.assertEqual(guilds, sample_state())
+
+
+class MemberIndexRestoreTest(unittest.TestCase):
+
+    def test_from_names_builds_the_inverted_index(self):
+        index = GuildMemberIndex.from_names({10: {'alice', 'al'}, 11: {'al'}})
+
+        self.assertEqual(index.lookup('Alice'), {10})
+        self.assertEqual(index.lookup('al'), {10, 11})
+        self.assertEqual(len(index), 2)
+
+    def test_restore_keeps_the_live_names(self):
+        members = MemberIndex()
+        members.for_guild(1).add(10, {'alice2'})
+
+        members.restore(1, GuildMemberIndex.from_names({10: {'alice'}, 11: {'bob'}}))
+
+        index = members.guilds[1]
+        self.assertEqual(index.lookup('alice2'), {10})
+        self.assertEqual(index.lookup('alice'), set())
+        self.assertEqual(index.lookup('bob'), {11})
+
+
+if __name__ == '__main__':
+    unittest.main()